@@ -0,0 +1,315 @@
+"""
+The command-line interface of the package.
+
+Usage: `python -m ciphergeard <cipher> [-d] [options] [input]`, e.g. `python -m ciphergeard vigenere --keyword secret plain.txt -o encoded.txt`. The input is encoded, or decoded with `-d`.
+Run `python -m ciphergeard <cipher> --help` for the key options of a cipher.
+
+The input (a file or `-` for stdin) is read `--block-size` bytes at a time and the output is written as it is produced, to stdout or `--output`:
+
+- The ciphers with an incremental encoder/decoder (the Vigenère family, Morse decoding, Bifid with a `--period`) are streamed as text.
+  Like :meth:`VigenereCipher.encode`, the key of the Vigenère family advances on every character, but the text is not stripped.
+- The other ciphers whose output for any part of the text only depends on that part (Affine, Caesar, ROT13, Atbash) are streamed byte by byte, without stripping the text.
+- With an input file, an `--output` file and `--workers`, the blocks of these ciphers and of the Vigenère family are processed in parallel by :meth:`ParallelFileMixin.encode_file`.
+  It works on bytes, where the key of the Vigenère family would advance on every byte of a non-ASCII character: such an input is rejected, so that `--workers` never changes the output.
+- The Vernam cipher combines the input file with a `--keyword-file` through :meth:`VernamCipher.encode_file`.
+- The other ciphers need the whole text at once: the blocks are read first and the text is processed with `encode`/`decode`.
+
+The output cannot be the same file as the input (or the `--keyword-file`), as it would overwrite it before it is read.
+
+With `--stats`, the size of the input and output and the throughput are printed to stderr.
+"""
+
+import argparse
+import codecs
+import os
+import sys
+import time
+
+from .affine import AffineCipher, AffineCipherError
+from .atbash import AtbashCipher, AtbashCipherError
+from .baconion import BaconianCipher, BaconianCipherError
+from .batch import BatchError
+from .bifid import BifidCipher, BifidCipherError
+from .caesar import CaesarCipher
+from .columnar_transposition import ColumnarTranspositionCipher, ColumnarTranspositionCipherError
+from .morse import MorseCode, MorseCodeError
+from .parallel import ParallelError
+from .playfair import PlayfairCipher, PlayfairCipherError
+from .rail_fence import RailFenceCipher, RailFenceCipherError
+from .rot13 import ROT13Cipher
+from .vernam import VernamCipher, VernamCipherError
+from .vigenere import VigenereCipher, VigenereCipherError
+from .vigenere.beaufort import BeaufortVariant
+from .vigenere.gronsfeld import GronsfeldVariant, GronsfeldVariantError
+from .vigenere.running_key import RunningKeyVariant
+
+ERRORS = (
+    OSError, ValueError, AffineCipherError, AtbashCipherError, BaconianCipherError, BatchError, BifidCipherError, ColumnarTranspositionCipherError,
+    MorseCodeError, ParallelError, PlayfairCipherError, RailFenceCipherError, VernamCipherError, VigenereCipherError, GronsfeldVariantError,
+)
+"""The errors reported as a message instead of a traceback."""
+
+def build_parser():
+    """
+    Used to build the argument parser, with a subcommand for every cipher.
+
+    ---------------------------
+
+    :return: The argument parser.
+    :rtype: argparse.ArgumentParser
+    """
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-d", "--decode", dest="action", action="store_const", const="decode", default="encode", help="decode the input instead of encoding it")
+    common.add_argument("input", nargs="?", default="-", help="the file to read, defaults to stdin")
+    common.add_argument("-o", "--output", default="-", help="the file to write, defaults to stdout")
+    common.add_argument("--block-size", type=int, default=1 << 20, help="the number of bytes to read at a time, defaults to 1 MiB")
+    common.add_argument("--workers", type=int, default=None, help="the number of worker processes, for the position-independent ciphers with an input and output file")
+    common.add_argument("--stats", action="store_true", help="print the sizes and the throughput to stderr")
+
+    parser = argparse.ArgumentParser(prog="python -m ciphergeard", description="Encode or decode text with the ciphers of Ciphergeard.")
+    subparsers = parser.add_subparsers(dest="cipher", metavar="cipher", required=True)
+
+    def add(name: str, help: str, build):
+        subparser = subparsers.add_parser(name, parents=[common], help=help)
+        subparser.set_defaults(build=build)
+        return subparser
+
+    subparser = add("affine", "the Affine cipher", lambda args: AffineCipher(a=args.a, b=args.b, case_sensitive=args.case_sensitive))
+    subparser.add_argument("-a", type=int, required=True, help="the multiplier, co-prime with 26")
+    subparser.add_argument("-b", type=int, required=True, help="the offset")
+    subparser.add_argument("--case-sensitive", action="store_true", help="keep the case of the letters")
+
+    add("atbash", "the Atbash cipher", lambda args: AtbashCipher())
+
+    subparser = add("baconian", "the Baconian cipher, with a table generated from a seed", lambda args: BaconianCipher(BaconianCipher.generate_lookup_table(args.multiple_char, args.seed)))
+    subparser.add_argument("--seed", required=True, help="the seed of the lookup table")
+    subparser.add_argument("--multiple-char", action="store_true", help="use the whole alphabet in the codes instead of 'a' and 'b'")
+
+    subparser = add("bifid", "the Bifid cipher", lambda args: BifidCipher(keyword=args.keyword, filler_char=args.filler, period=args.period))
+    subparser.add_argument("--keyword", required=True, help="the keyword")
+    subparser.add_argument("--filler", default="x", help="the filler of odd-length texts, defaults to 'x'")
+    subparser.add_argument("--period", type=int, default=None, help="the number of letters fractionated together, which allows streaming")
+
+    subparser = add("caesar", "the Caesar cipher", lambda args: CaesarCipher(offset=args.offset, case_sensitive=args.case_sensitive))
+    subparser.add_argument("--offset", type=int, required=True, help="the offset")
+    subparser.add_argument("--case-sensitive", action="store_true", help="keep the case of the letters")
+
+    subparser = add("columnar", "the Columnar Transposition cipher", lambda args: ColumnarTranspositionCipher(keyword=args.keyword, second_keyword=args.second_keyword))
+    subparser.add_argument("--keyword", required=True, help="the keyword")
+    subparser.add_argument("--second-keyword", default=None, help="the keyword of a second transposition")
+
+    add("morse", "Morse code", lambda args: MorseCode())
+
+    subparser = add("playfair", "the Playfair cipher", lambda args: PlayfairCipher(keyword=args.keyword, filler_char=args.filler))
+    subparser.add_argument("--keyword", required=True, help="the keyword")
+    subparser.add_argument("--filler", default="x", help="the filler of odd-length texts, defaults to 'x'")
+
+    subparser = add("rail-fence", "the Rail Fence cipher", lambda args: RailFenceCipher(rails=args.rails))
+    subparser.add_argument("--rails", type=int, required=True, help="the number of rails")
+
+    subparser = add("rot13", "the ROT13 cipher", lambda args: ROT13Cipher(case_sensitive=args.case_sensitive))
+    subparser.add_argument("--case-sensitive", action="store_true", help="keep the case of the letters")
+
+    subparser = add("vernam", "the Vernam cipher, with a keyword file as long as the input", lambda args: VernamCipher())
+    subparser.add_argument("--keyword-file", required=True, help="the keyword file")
+
+    subparser = add("vigenere", "the Vigenère cipher", lambda args: VigenereCipher(keyword=args.keyword))
+    subparser.add_argument("--keyword", required=True, help="the keyword")
+
+    subparser = add("beaufort", "the Beaufort variant of the Vigenère cipher", lambda args: BeaufortVariant(keyword=args.keyword))
+    subparser.add_argument("--keyword", required=True, help="the keyword")
+
+    subparser = add("gronsfeld", "the Gronsfeld variant of the Vigenère cipher", lambda args: GronsfeldVariant(key=args.key))
+    subparser.add_argument("--key", type=int, required=True, help="the numeric key")
+
+    subparser = add("running-key", "the Running Key variant of the Vigenère cipher", lambda args: RunningKeyVariant(keywords=args.keywords, max_lcm=args.max_lcm))
+    subparser.add_argument("--keywords", action="append", required=True, help="a keyword, repeated for every keyword (e.g. `--keywords ab --keywords cde`)")
+    subparser.add_argument("--max-lcm", type=int, default=None, help="the maximum length of the combined key")
+
+    return parser
+
+def read_blocks(source, block_size: int):
+    """
+    Used to read `source` `block_size` bytes at a time.
+
+    ---------------------------
+
+    :param source: The binary stream to read.
+    :type source: BinaryIO
+
+    :param block_size: The number of bytes to read at a time.
+    :type block_size: int
+
+    ---------------------------
+
+    :return: The blocks.
+    :rtype: Generator[bytes]
+    """
+    return iter(lambda: source.read(block_size), b"")
+
+def is_ascii(path: str, block_size: int):
+    """
+    Used to check whether the file at `path` only contains ASCII characters, reading it `block_size` bytes at a time.
+
+    ---------------------------
+
+    :param path: The path of the file.
+    :type path: str
+
+    :param block_size: The number of bytes to read at a time.
+    :type block_size: int
+
+    ---------------------------
+
+    :return: `True` if every byte is ASCII.
+    :rtype: bool
+    """
+    with open(path, "rb") as file:
+        return all(block.isascii() for block in read_blocks(file, block_size))
+
+def process_blocks(cipher, action: str, blocks):
+    """
+    Used to encode/decode the blocks of the input, streaming them whenever the cipher allows it.
+    The incremental encoders/decoders are preferred to the `encode_chunk`/`decode_chunk` methods, as they follow the position in the text by characters.
+
+    ---------------------------
+
+    :param cipher: The cipher to use.
+    :type cipher: object
+
+    :param action: `'encode'` or `'decode'`.
+    :type action: str
+
+    :param blocks: The blocks of the input.
+    :type blocks: Iterable[bytes]
+
+    ---------------------------
+
+    :return: The blocks of the output.
+    :rtype: Generator[bytes]
+    """
+    stream = None
+    stream_method = getattr(cipher, f"stream_{action}r", None)
+    if stream_method is not None:
+        try:
+            stream = stream_method()
+        except BifidCipherError:
+            pass
+
+    chunk_method = getattr(cipher, f"{action}_chunk", None)
+    if stream is None and chunk_method is not None:
+        position = 0
+        for block in blocks:
+            yield chunk_method(block, position)
+            position += len(block)
+        return
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    if stream is not None:
+        for block in blocks:
+            yield stream.process(decoder.decode(block)).encode("utf-8")
+        yield (stream.process(decoder.decode(b"", final=True)) + stream.flush()).encode("utf-8")
+        return
+
+    text = "".join([decoder.decode(block) for block in blocks]) + decoder.decode(b"", final=True)
+    yield getattr(cipher, action)(text).encode("utf-8")
+
+def run(args):
+    """
+    Used to run the subcommand parsed into `args`.
+
+    ---------------------------
+
+    :param args: The parsed arguments.
+    :type args: argparse.Namespace
+
+    ---------------------------
+
+    :return: The number of bytes read and written.
+    :rtype: tuple[int, int]
+
+    ---------------------------
+
+    :raises ValueError: Indicates that the options could not be used together, that the input and the output were the same file, or that `--workers` was used with a non-ASCII input for the Vigenère family.
+    """
+    if args.block_size < 1:
+        raise ValueError("`--block-size` must be a natural number, i.e., > 0.")
+    # The output is truncated before the input is read.
+    if args.input != "-" and args.output != "-" and os.path.exists(args.output) and os.path.samefile(args.input, args.output):
+        raise ValueError(f"The input and the output are the same file - '{args.output}'")
+
+    cipher = args.build(args)
+    files = args.input != "-" and args.output != "-"
+
+    if isinstance(cipher, VernamCipher):
+        if not files:
+            raise ValueError("The Vernam cipher needs an input file and an `--output` file.")
+        getattr(cipher, f"{args.action}_file")(args.input, args.keyword_file, args.output, window=args.block_size)
+        return os.path.getsize(args.input), os.path.getsize(args.output)
+
+    if args.workers is not None:
+        if not files or not hasattr(cipher, f"{args.action}_chunk"):
+            raise ValueError("`--workers` needs an input file, an `--output` file and a position-independent cipher.")
+        # The chunks are keyed by byte, which matches the text path (keyed by character) only for ASCII input.
+        if isinstance(cipher, VigenereCipher) and not is_ascii(args.input, args.block_size):
+            raise ValueError("`--workers` needs an ASCII input with the Vigenère family, whose key advances on every character.")
+        getattr(cipher, f"{args.action}_file")(args.input, args.output, workers=args.workers, chunk_size=args.block_size)
+        return os.path.getsize(args.input), os.path.getsize(args.output)
+
+    source = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    target = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    read = written = 0
+
+    def counted(blocks):
+        nonlocal read
+        for block in blocks:
+            read += len(block)
+            yield block
+
+    try:
+        for block in process_blocks(cipher, args.action, counted(read_blocks(source, args.block_size))):
+            target.write(block)
+            written += len(block)
+        target.flush()
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if target is not sys.stdout.buffer:
+            target.close()
+
+    return read, written
+
+def main(argv: list[str] = None):
+    """
+    Used to run the command-line interface.
+
+    ---------------------------
+
+    :param argv: The arguments, defaults to `None` (`sys.argv[1:]`).
+    :type argv: list[str], optional
+
+    ---------------------------
+
+    :return: The exit status.
+    :rtype: int
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        read, written = run(args)
+    except KeyError as error:
+        parser.exit(1, f"{parser.prog} {args.cipher}: error: Unsupported character: {error}\n")
+    except ERRORS as error:
+        parser.exit(1, f"{parser.prog} {args.cipher}: error: {error}\n")
+    elapsed = time.perf_counter() - start
+
+    if args.stats:
+        rate = read / elapsed / 1e6 if elapsed else float("inf")
+        print(f"{args.cipher} {args.action}: {read} bytes in, {written} bytes out, {elapsed:.3f} s, {rate:.1f} MB/s", file=sys.stderr)
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
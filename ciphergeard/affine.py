@@ -1,9 +1,12 @@
 import math
+import string
+from .batch import BatchMixin
+from .parallel import ParallelFileMixin
 
 class AffineCipherError(Exception):
     pass
 
-class AffineCipher:
+class AffineCipher(BatchMixin, ParallelFileMixin):
     def __init__(self, a: int, b: int, case_sensitive: bool = False) -> None:
         """
         The `Affine Cipher <https://en.wikipedia.org/wiki/Affine_cipher>`_, a classic monoalphabetic substitution cipher in Python.
@@ -52,6 +55,30 @@ class AffineCipher:
         self.ia = pow(base=self.a, exp=-1, mod=26)
         self.b = b
         self.case_sensitive = case_sensitive
+        self.encode_table, self.decode_table = self.generate_tables()
+        self.encode_byte_table, self.decode_byte_table = self.generate_tables(as_bytes=True)
+
+    def generate_tables(self, as_bytes: bool = False):
+        """
+        Used to precompute the translation tables for encoding and decoding.
+        Both lowercase and uppercase letters are mapped, so the same tables serve the case-sensitive and insensitive modes.
+
+        ---------------------------
+
+        :param as_bytes: If set to `True`, the tables are generated for `bytes.translate` instead, defaults to `False`.
+        :type as_bytes: bool, optional
+
+        ---------------------------
+
+        :return: The encoding and decoding tables, usable with `str.translate` (or `bytes.translate`).
+        :rtype: tuple[dict, dict] | tuple[bytes, bytes]
+        """
+        encoded = "".join(string.ascii_lowercase[((self.a * i) + self.b) % 26] for i in range(26))
+        encoded += encoded.upper()
+        if as_bytes:
+            letters, encoded = string.ascii_letters.encode(), encoded.encode()
+            return bytes.maketrans(letters, encoded), bytes.maketrans(encoded, letters)
+        return str.maketrans(string.ascii_letters, encoded), str.maketrans(encoded, string.ascii_letters)
 
     def encode(self, plaintext: str):
         """
@@ -71,16 +98,7 @@ class AffineCipher:
         if not self.case_sensitive:
             plaintext = plaintext.lower()
 
-        ciphertext = ""
-
-        for i in plaintext:
-            if not i.isalpha():
-                ciphertext += i
-                continue
-            ciphertext += chr((((self.a * self.get_index(i)) + self.b) % 26) + (65 if i.isupper() else 97))
-            continue
-
-        return ciphertext
+        return plaintext.translate(self.encode_table)
 
     def decode(self, ciphertext: str):
         """
@@ -100,15 +118,87 @@ class AffineCipher:
         if not self.case_sensitive:
             ciphertext = ciphertext.lower()
 
-        plaintext = ""
+        return ciphertext.translate(self.decode_table)
+
+    def encode_bytes(self, plaintext: bytes | bytearray | memoryview):
+        """
+        Used to encode the `plaintext` directly as bytes, without decoding it to `str` first.
+        Only the ASCII letters are encoded, every other byte is left untouched.
+
+        ---------------------------
+
+        :param plaintext: The plaintext to encode.
+        :type plaintext: bytes | bytearray | memoryview
+
+        ---------------------------
+
+        :return: The encoded bytes.
+        :rtype: bytes
+        """
+        plaintext = bytes(plaintext).strip()
+        if not self.case_sensitive:
+            plaintext = plaintext.lower()
+
+        return plaintext.translate(self.encode_byte_table)
+
+    def decode_bytes(self, ciphertext: bytes | bytearray | memoryview):
+        """
+        Used to decode the `ciphertext` directly as bytes, without decoding it to `str` first.
+        Only the ASCII letters are decoded, every other byte is left untouched.
+
+        ---------------------------
+
+        :param ciphertext: The encoded bytes to decode.
+        :type ciphertext: bytes | bytearray | memoryview
+
+        ---------------------------
+
+        :return: The decoded bytes.
+        :rtype: bytes
+        """
+        ciphertext = bytes(ciphertext).strip()
+        if not self.case_sensitive:
+            ciphertext = ciphertext.lower()
+
+        return ciphertext.translate(self.decode_byte_table)
+
+    def encode_chunk(self, chunk: bytes, position: int = 0):
+        """
+        Used to encode a chunk of a larger text, e.g. by :meth:`encode_file`. Every letter is encoded on its own, so the `position` of the chunk is not needed.
+
+        ---------------------------
+
+        :param chunk: The chunk to encode. It is not stripped.
+        :type chunk: bytes
 
-        for i in ciphertext:
-            if not i.isalpha():
-                plaintext += i
-                continue
-            plaintext += chr(((self.ia * (self.get_index(i) - self.b)) % 26) + (65 if i.isupper() else 97))
+        :param position: The offset of the chunk in the text, defaults to `0`.
+        :type position: int, optional
 
-        return plaintext
+        ---------------------------
+
+        :return: The encoded chunk.
+        :rtype: bytes
+        """
+        return (chunk if self.case_sensitive else chunk.lower()).translate(self.encode_byte_table)
+
+    def decode_chunk(self, chunk: bytes, position: int = 0):
+        """
+        Used to decode a chunk of a larger text, e.g. by :meth:`decode_file`. Every letter is decoded on its own, so the `position` of the chunk is not needed.
+
+        ---------------------------
+
+        :param chunk: The chunk to decode. It is not stripped.
+        :type chunk: bytes
+
+        :param position: The offset of the chunk in the text, defaults to `0`.
+        :type position: int, optional
+
+        ---------------------------
+
+        :return: The decoded chunk.
+        :rtype: bytes
+        """
+        return (chunk if self.case_sensitive else chunk.lower()).translate(self.decode_byte_table)
     
     def get_index(self, letter: str):
         """
@@ -0,0 +1,157 @@
+"""
+Cryptanalysis of the ciphers of the package: the helpers shared by the crackers of the submodules.
+
+Every cracker first reduces the ciphertext to small statistics (e.g. the count of every letter) in a few passes, and then scores the keys against those statistics instead of decoding the text with every key.
+"""
+
+import math
+import string
+from collections import Counter
+
+from ..frequency import ENGLISH_LETTER_FREQUENCIES
+from .ngrams import NgramModel, NgramModelError
+
+class AnalysisError(Exception):
+    pass
+
+ENGLISH_LETTER_PROBABILITIES = [ENGLISH_LETTER_FREQUENCIES[letter] / sum(ENGLISH_LETTER_FREQUENCIES.values()) for letter in string.ascii_lowercase]
+"""The probability of every letter from `'a'` to `'z'` in English text."""
+
+def letter_counts(text: str):
+    """
+    Used to count every English letter of `text`, ignoring the case.
+
+    ---------------------------
+
+    :param text: The text to count the letters of.
+    :type text: str
+
+    ---------------------------
+
+    :return: The count of every letter from `'a'` to `'z'`.
+    :rtype: list[int]
+    """
+    text = text.lower()
+    return [text.count(letter) for letter in string.ascii_lowercase]
+
+def chi_squared(counts: list[int], probabilities: list[float] = None):
+    """
+    Used to measure how far the letter `counts` are from the expected `probabilities`, with `Pearson's chi-squared statistic <https://en.wikipedia.org/wiki/Pearson%27s_chi-squared_test>`_.
+    The lower the statistic, the closer the text is to the language.
+
+    ---------------------------
+
+    :param counts: The count of every letter from `'a'` to `'z'`.
+    :type counts: list[int]
+
+    :param probabilities: The probability of every letter from `'a'` to `'z'`, defaults to `ENGLISH_LETTER_PROBABILITIES`.
+    :type probabilities: list[float], optional
+
+    ---------------------------
+
+    :return: The chi-squared statistic.
+    :rtype: float
+    """
+    probabilities = probabilities or ENGLISH_LETTER_PROBABILITIES
+    total = sum(counts)
+    return sum((count - total * p) ** 2 / (total * p) for count, p in zip(counts, probabilities)) if total else 0.0
+
+def quadgram_log_probabilities(corpus: str, floor: float = 0.01):
+    """
+    Used to count the quadgrams (4 consecutive letters) of a `corpus` of the language, and turn them into a flat table of log-probabilities.
+    The quadgram `abcd` is at the index `((a * 26 + b) * 26 + c) * 26 + d`, with the letters numbered from 0 (`'a'`) to 25 (`'z'`), so a text is scored with a rolling index instead of string lookups.
+
+    The characters other than English letters are skipped, so the quadgrams span the words.
+
+    ---------------------------
+
+    :param corpus: A long text of the language, e.g. a few books.
+    :type corpus: str
+
+    :param floor: The count given to the quadgrams missing from the corpus, defaults to `0.01`.
+    :type floor: float, optional
+
+    ---------------------------
+
+    :return: The base-10 log-probability of every quadgram, i.e. 26^4 floats.
+    :rtype: list[float]
+
+    ---------------------------
+
+    :raises AnalysisError: Indicates that the corpus did not contain any quadgram.
+    """
+    letters = [ord(char) - 97 for char in corpus.lower() if 'a' <= char <= 'z']
+    counts = Counter(((a * 26 + b) * 26 + c) * 26 + d for a, b, c, d in zip(letters, letters[1:], letters[2:], letters[3:]))
+    total = sum(counts.values())
+    if not total:
+        raise AnalysisError('The corpus does not contain any quadgram.')
+
+    scores = [math.log10(floor / total)] * 26 ** 4
+    for index, count in counts.items():
+        scores[index] = math.log10(count / total)
+    return scores
+
+def quadgram_table(quadgrams: list[float] | NgramModel):
+    """
+    Used to get the flat table of the log-probabilities of the quadgrams, which the crackers index in their inner loops.
+    A list (e.g. from :func:`quadgram_log_probabilities`) is returned as is, and a :class:`NgramModel` gives its memory-mapped table.
+
+    ---------------------------
+
+    :param quadgrams: The log-probability of every quadgram, or a 4-gram model.
+    :type quadgrams: list[float] | NgramModel
+
+    ---------------------------
+
+    :return: The table of 26^4 floats.
+    :rtype: list[float] | memoryview
+
+    ---------------------------
+
+    :raises AnalysisError: Indicates that the model was not a 4-gram model.
+    """
+    if not isinstance(quadgrams, NgramModel):
+        return quadgrams
+    if quadgrams.n != 4:
+        raise AnalysisError(f"Expected a 4-gram model. Found: a {quadgrams.n}-gram model")
+    return quadgrams.table
+
+def quadgram_score(text: str, quadgrams: list[float] | NgramModel):
+    """
+    Used to score how close `text` is to the language, by the average log-probability of its quadgrams. The characters other than English letters are skipped.
+    A :class:`NgramModel` scores the text with :meth:`NgramModel.score`, vectorized with NumPy.
+
+    ---------------------------
+
+    :param text: The text to score.
+    :type text: str
+
+    :param quadgrams: The log-probability of every quadgram, as returned by :func:`quadgram_log_probabilities`, or a 4-gram model.
+    :type quadgrams: list[float] | NgramModel
+
+    ---------------------------
+
+    :return: The score per quadgram, higher is better.
+    :rtype: float
+
+    ---------------------------
+
+    :raises AnalysisError: Indicates that the text had less than 4 letters, or that the model was not a 4-gram model.
+    """
+    if isinstance(quadgrams, NgramModel):
+        quadgram_table(quadgrams) # Checks the length of the n-grams.
+        try:
+            return quadgrams.score(text)
+        except NgramModelError as error:
+            raise AnalysisError(str(error)) from error
+
+    letters = [ord(char) - 97 for char in text.lower() if 'a' <= char <= 'z']
+    if len(letters) < 4:
+        raise AnalysisError(f"Expected at least 4 letters. Found: {len(letters)}")
+
+    index = (letters[0] * 26 + letters[1]) * 26 + letters[2]
+    score = 0.0
+    for letter in letters[3:]:
+        index = index % 17576 * 26 + letter
+        score += quadgrams[index]
+    return score / (len(letters) - 3)
\ No newline at end of file
@@ -0,0 +1,93 @@
+import math
+
+from ..affine import AffineCipher
+from . import ENGLISH_LETTER_PROBABILITIES, AnalysisError, chi_squared, letter_counts
+
+AFFINE_MULTIPLIERS = [a for a in range(1, 26) if math.gcd(a, 26) == 1]
+"""The 12 values of `a` co-prime with 26, i.e. the valid multipliers of :class:`AffineCipher`."""
+
+def rank_affine_keys(ciphertext: str, caesar_only: bool = False, probabilities: list[float] = None):
+    """
+    Used to rank every key of :class:`AffineCipher` (312 keys), or of :class:`CaesarCipher` (26 keys), by how close the decoded text would be to the language.
+
+    The letters of the ciphertext are counted once. Decoding with a key only permutes the letters, so the counts of the decoded text are the same counts, permuted,
+    and every key is scored by the chi-squared statistic of its permutation of the counts. The cost is one pass over the text plus 26 operations per key.
+
+    ---------------------------
+
+    :param ciphertext: The encoded text.
+    :type ciphertext: str
+
+    :param caesar_only: If set to `True`, only the keys with `a = 1` (the Caesar cipher) are ranked, defaults to `False`.
+    :type caesar_only: bool, optional
+
+    :param probabilities: The probability of every letter from `'a'` to `'z'`, defaults to the English letter probabilities.
+    :type probabilities: list[float], optional
+
+    ---------------------------
+
+    :return: The `(a, b, score)` of every key, best (lowest chi-squared) first.
+    :rtype: list[tuple[int, int, float]]
+
+    ---------------------------
+
+    :raises AnalysisError: Indicates that the ciphertext did not contain any letter.
+    """
+    counts = letter_counts(ciphertext)
+    if not any(counts):
+        raise AnalysisError('The ciphertext does not contain any letter.')
+    probabilities = probabilities or ENGLISH_LETTER_PROBABILITIES
+
+    ranked = []
+    for a in ([1] if caesar_only else AFFINE_MULTIPLIERS):
+        for b in range(26):
+            # The plaintext letter x is encoded as (ax + b) mod 26, so the decoded count of x is the count of that letter.
+            decoded_counts = [counts[(a * x + b) % 26] for x in range(26)]
+            ranked.append((a, b, chi_squared(decoded_counts, probabilities)))
+
+    ranked.sort(key=lambda key: key[2])
+    return ranked
+
+def crack_affine(ciphertext: str, caesar_only: bool = False, probabilities: list[float] = None, case_sensitive: bool = False):
+    """
+    Used to recover the key and the plaintext of a text encoded by :class:`AffineCipher` (or :class:`CaesarCipher`), without knowing the key.
+    Only the best key of :func:`rank_affine_keys` is used to decode the text.
+
+    ---------------------------
+
+    :param ciphertext: The encoded text.
+    :type ciphertext: str
+
+    :param caesar_only: If set to `True`, only the keys of the Caesar cipher are tried, defaults to `False`.
+    :type caesar_only: bool, optional
+
+    :param probabilities: The probability of every letter from `'a'` to `'z'`, defaults to the English letter probabilities.
+    :type probabilities: list[float], optional
+
+    :param case_sensitive: Indicates whether the decoded text should keep the case of the letters, defaults to `False`.
+    :type case_sensitive: bool, optional
+
+    ---------------------------
+
+    :return: The ranked `(a, b, score)` of every key, best first, and the text decoded with the best key.
+    :rtype: tuple[list[tuple[int, int, float]], str]
+
+    ---------------------------
+
+    :raises AnalysisError: Indicates that the ciphertext did not contain any letter.
+
+    ---------------------------
+
+    **Example**
+    ---------------------------
+    .. code-block:: python
+
+       from ciphergeard.analysis.affine import crack_affine
+
+       ranked, plaintext = crack_affine("Yfmfqy gaf fdzg bdcc xm gaf rdzgcf")
+       # ranked[0]: (7, 3, 18.528...)
+       # Output: defend the east wall of the castle
+    """
+    ranked = rank_affine_keys(ciphertext, caesar_only, probabilities)
+    a, b, _ = ranked[0]
+    return ranked, AffineCipher(a=a, b=b, case_sensitive=case_sensitive).decode(ciphertext=ciphertext)
\ No newline at end of file
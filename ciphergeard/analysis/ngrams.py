@@ -0,0 +1,416 @@
+"""
+Memory-mapped n-gram language models, to score candidate plaintexts.
+
+A model is compiled once from a corpus into a binary file: a 64-byte header followed by the dense table of the base-10 log-probabilities of the 26^n n-grams, as little-endian float32.
+The n-gram `abcd` is at the index `((a * 26 + b) * 26 + c) * 26 + d`, like in :func:`quadgram_log_probabilities`, so a 4-gram model is 1.8 MB.
+
+Loading a model only reads its header: the table is memory-mapped at its first use, so the pages are read from the page cache instead of parsed, and every process using the same file shares them.
+A model is pickled as its path, so worker processes map the file again instead of receiving the table.
+"""
+
+import functools
+import math
+import mmap
+import os
+import struct
+import sys
+from collections import Counter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MAGIC = b"CGNGRAM1"
+"""The first bytes of a model file."""
+
+HEADER_SIZE = 64
+"""The size of the header of a model file, which keeps the table aligned."""
+
+_HEADER = struct.Struct("<8sI")
+
+class NgramModelError(Exception):
+    pass
+
+_NON_LETTERS = bytes(sorted(set(range(256)) - set(range(97, 123))))
+_LETTER_CODES = bytes((i - 97) % 256 for i in range(256))
+
+def _letters(text: str):
+    """
+    Used to turn the English letters of `text` into bytes numbered from 0 (`'a'`) to 25 (`'z'`), ignoring the case and skipping every other character.
+    """
+    return text.lower().encode("ascii", "ignore").translate(_LETTER_CODES, _NON_LETTERS)
+
+def _indices(letters: bytes, n: int):
+    """
+    Used to compute the index of every n-gram of `letters` one by one, rolling the index of the previous one.
+    """
+    index, modulo = 0, 26 ** (n - 1)
+    for i, letter in enumerate(letters):
+        index = index % modulo * 26 + letter
+        if i >= n - 1:
+            yield index
+
+def _batches(chunks, size: int = 1 << 22):
+    """
+    Used to join the letters of the chunks of a corpus (e.g. the lines of a file) into batches of about `size` letters, so that each batch is counted at once.
+    """
+    batch, length = [], 0
+    for chunk in chunks:
+        letters = _letters(chunk)
+        batch.append(letters)
+        length += len(letters)
+        if length >= size:
+            yield b"".join(batch)
+            batch, length = [], 0
+    yield b"".join(batch)
+
+def _log_table(counts, size: int, floor: float):
+    """
+    Used to turn the counts of the n-grams (a NumPy array, or a `Counter` of their indices) into the bytes of the table of their log-probabilities.
+    """
+    if not isinstance(counts, Counter):
+        total = int(counts.sum())
+        if not total:
+            raise NgramModelError('The corpus does not contain any n-gram.')
+        return numpy.log10(numpy.maximum(counts, floor) / total).astype("<f4").tobytes()
+
+    total = sum(counts.values())
+    if not total:
+        raise NgramModelError('The corpus does not contain any n-gram.')
+    scores = [math.log10(floor / total)] * size
+    for index, count in counts.items():
+        scores[index] = math.log10(count / total)
+    return struct.pack(f"<{size}f", *scores)
+
+def _write_model(path: str, n: int, table: bytes):
+    """
+    Used to write a model file through a temporary file in the same directory, which then replaces `path`.
+    A model already mapped from `path` (by this process or another one) keeps reading the previous file instead of seeing it truncated.
+    """
+    temporary = f"{path}.{os.getpid()}.tmp"
+    file = open(temporary, "xb")
+    try:
+        with file:
+            file.write(_HEADER.pack(MAGIC, n).ljust(HEADER_SIZE, b"\0"))
+            file.write(table)
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+
+class NgramModel:
+    def __init__(self, path: str) -> None:
+        """
+        A language model of the n-grams of English letters, stored in a file compiled by :meth:`compile`.
+        Only the header is read here: the table is memory-mapped at its first use.
+
+        The model can be used as the `quadgrams` of every cracker of :mod:`ciphergeard.analysis` (if `n` is 4), and scores whole texts with :meth:`score`,
+        vectorized with `NumPy <https://numpy.org>`_ if installed.
+
+        ---------------------------
+
+        :param path: The path of the model file.
+        :type path: str
+
+        ---------------------------
+
+        :raises NgramModelError: Indicates that the file was not a valid model.
+
+        ---------------------------
+
+        **Example**
+        ---------------------------
+        .. code-block:: python
+
+           from ciphergeard.analysis.ngrams import NgramModel, load_model
+           from ciphergeard.analysis.playfair import crack_playfair
+
+           with open("corpus.txt") as file:
+               NgramModel.compile(file, "english.ngrams", n=4)
+
+           # Or from a table of counts, e.g. "TION 13168375" on every line.
+           with open("english_quadgrams.txt") as file:
+               NgramModel.from_counts(file, "english.ngrams")
+
+           model = load_model("english.ngrams")
+
+           score = model.score("attack at dawn")
+           keys, plaintext = crack_playfair(ciphertext, model, workers=4)
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            header = file.read(HEADER_SIZE)
+            size = file.seek(0, 2)
+
+        if len(header) < HEADER_SIZE:
+            raise NgramModelError(f"Invalid model file - '{path}'")
+        magic, self.n = _HEADER.unpack_from(header)
+        if magic != MAGIC or not 1 <= self.n <= 6:
+            raise NgramModelError(f"Invalid model file - '{path}'")
+        if size != HEADER_SIZE + 4 * 26 ** self.n:
+            raise NgramModelError(f"Expected {HEADER_SIZE + 4 * 26 ** self.n} bytes for a {self.n}-gram model. Found: {size} - '{path}'")
+
+        self._mmap = self._table = self._array = None
+
+    def __getstate__(self):
+        """
+        Used to pickle the model as its path, without the mapping.
+
+        ---------------------------
+
+        :return: The state of the model.
+        :rtype: dict
+        """
+        return {"path": self.path, "n": self.n}
+
+    def __setstate__(self, state: dict):
+        """
+        Used to unpickle the model, which maps its file again at its first use.
+
+        ---------------------------
+
+        :param state: The state of the model.
+        :type state: dict
+        """
+        self.__dict__.update(state)
+        self._mmap = self._table = self._array = None
+
+    def __map(self):
+        """
+        Internal function to memory-map the file, once.
+        """
+        if self._mmap is None:
+            with open(self.path, "rb") as file:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def table(self):
+        """
+        The log-probability of every n-gram, as a memory-mapped view of the file. Indexing it one n-gram at a time is as fast as indexing a `list`.
+
+        ---------------------------
+
+        :return: The table of 26^n floats.
+        :rtype: memoryview
+
+        ---------------------------
+
+        :raises NgramModelError: Indicates that the platform was big-endian.
+        """
+        if self._table is None:
+            if sys.byteorder != "little":
+                raise NgramModelError('The memory-mapped table requires a little-endian platform.')
+            self.__map()
+            self._table = memoryview(self._mmap)[HEADER_SIZE:].cast("f")
+        return self._table
+
+    @property
+    def array(self):
+        """
+        The log-probability of every n-gram, as a memory-mapped NumPy array.
+
+        ---------------------------
+
+        :return: The table of 26^n floats.
+        :rtype: numpy.ndarray
+
+        ---------------------------
+
+        :raises NgramModelError: Indicates that NumPy was not installed.
+        """
+        if numpy is None:
+            raise NgramModelError('NumPy is required for the array of the model. It can be installed using `pip install numpy`.')
+        if self._array is None:
+            self.__map()
+            self._array = numpy.frombuffer(self._mmap, dtype="<f4", count=26 ** self.n, offset=HEADER_SIZE)
+        return self._array
+
+    def __len__(self):
+        return 26 ** self.n
+
+    def __getitem__(self, index: int | slice):
+        return self.table[index]
+
+    def score(self, text: str):
+        """
+        Used to score how close `text` is to the language, by the average log-probability of its n-grams. The characters other than English letters are skipped.
+        With NumPy, the indices of all the n-grams are computed at once from shifted views of the letters (`index = index * 26 + letters[k:]`), and gathered from the table in one call.
+
+        ---------------------------
+
+        :param text: The text to score.
+        :type text: str
+
+        ---------------------------
+
+        :return: The score per n-gram, higher is better.
+        :rtype: float
+
+        ---------------------------
+
+        :raises NgramModelError: Indicates that the text had less than `n` letters.
+        """
+        letters = _letters(text)
+        count = len(letters) - self.n + 1
+        if count < 1:
+            raise NgramModelError(f"Expected at least {self.n} letters. Found: {len(letters)}")
+
+        if numpy is not None:
+            codes = numpy.frombuffer(letters, dtype=numpy.uint8).astype(numpy.intp)
+            index = codes[:count].copy()
+            for k in range(1, self.n):
+                index *= 26
+                index += codes[k:k + count]
+            return float(self.array[index].sum(dtype=numpy.float64)) / count
+
+        return sum(map(self.table.__getitem__, _indices(letters, self.n))) / count
+
+    def close(self):
+        """
+        Used to unmap the file. The model maps it again at its next use.
+        """
+        if self._table is not None:
+            self._table.release()
+        self._table = self._array = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    @classmethod
+    def compile(cls, corpus, path: str, n: int = 4, floor: float = 0.01):
+        """
+        Used to count the n-grams of a `corpus` of the language and write their log-probabilities into a model file.
+        The corpus is read chunk by chunk (e.g. the lines of an open file), so it does not have to fit in memory; the n-grams spanning two chunks are counted.
+        With NumPy, the n-grams are counted by a `bincount` of their indices, a few million letters at a time.
+        The file is written next to `path` and then replaces it, so the models already mapped from `path` are not affected.
+
+        ---------------------------
+
+        :param corpus: A long text of the language, or an iterable of its chunks.
+        :type corpus: str | Iterable[str]
+
+        :param path: The path of the model file to write.
+        :type path: str
+
+        :param n: The length of the n-grams, from 1 to 6, defaults to `4`.
+        :type n: int, optional
+
+        :param floor: The count given to the n-grams missing from the corpus, defaults to `0.01`.
+        :type floor: float, optional
+
+        ---------------------------
+
+        :return: The compiled model.
+        :rtype: NgramModel
+
+        ---------------------------
+
+        :raises NgramModelError: Indicates that `n` was out of range, or that the corpus did not contain any n-gram.
+        """
+        if not 1 <= n <= 6:
+            raise NgramModelError(f"`n` must be between 1 and 6. Found: {n}")
+        size = 26 ** n
+        counts = numpy.zeros(size, dtype=numpy.int64) if numpy is not None else Counter()
+
+        carry = b""
+        for batch in _batches([corpus] if isinstance(corpus, str) else corpus):
+            letters = carry + batch
+            count = len(letters) - n + 1
+            if count > 0:
+                if numpy is not None:
+                    codes = numpy.frombuffer(letters, dtype=numpy.uint8).astype(numpy.intp)
+                    index = codes[:count].copy()
+                    for k in range(1, n):
+                        index *= 26
+                        index += codes[k:k + count]
+                    counts += numpy.bincount(index, minlength=size)
+                else:
+                    counts.update(_indices(letters, n))
+            carry = letters[-(n - 1):] if n > 1 else b""
+
+        _write_model(path, n, _log_table(counts, size, floor))
+        return cls(path)
+
+    @classmethod
+    def from_counts(cls, counts, path: str, floor: float = 0.01):
+        """
+        Used to write a model file from a table of n-gram counts, with one `NGRAM count` pair per line (e.g. `TION 13168375`), like the published quadgram tables.
+        The case of the n-grams is ignored, the counts of repeated n-grams are added, and `n` is the length of the n-grams.
+        Like :meth:`compile`, the file is written next to `path` and then replaces it.
+
+        ---------------------------
+
+        :param counts: The lines of the table, e.g. an open file, or the whole table.
+        :type counts: str | Iterable[str]
+
+        :param path: The path of the model file to write.
+        :type path: str
+
+        :param floor: The count given to the n-grams missing from the table, defaults to `0.01`.
+        :type floor: float, optional
+
+        ---------------------------
+
+        :return: The compiled model.
+        :rtype: NgramModel
+
+        ---------------------------
+
+        :raises NgramModelError: Indicates that a line was not a valid `NGRAM count` pair, that the n-grams were not all of the same length (from 1 to 6), or that the table was empty.
+        """
+        totals, n = Counter(), None
+        for number, line in enumerate(counts.splitlines() if isinstance(counts, str) else counts, 1):
+            fields = line.split()
+            if not fields:
+                continue
+            try:
+                ngram, count = fields
+                count = int(count)
+            except ValueError:
+                raise NgramModelError(f"Expected an n-gram and its count on line {number}. Found: {line.strip()!r}") from None
+
+            letters = _letters(ngram)
+            if len(letters) != len(ngram) or count < 0:
+                raise NgramModelError(f"Expected English letters and a non-negative count on line {number}. Found: {line.strip()!r}")
+            if n is None:
+                n = len(letters)
+                if not 1 <= n <= 6:
+                    raise NgramModelError(f"`n` must be between 1 and 6. Found: {n}")
+            elif len(letters) != n:
+                raise NgramModelError(f"Expected {n}-grams. Found: {ngram!r} on line {number}")
+            totals[next(_indices(letters, n))] += count
+
+        if n is None:
+            raise NgramModelError('The table does not contain any n-gram.')
+        if numpy is not None:
+            array = numpy.zeros(26 ** n, dtype=numpy.int64)
+            array[list(totals)] = list(totals.values())
+            totals = array
+        _write_model(path, n, _log_table(totals, 26 ** n, floor))
+        return cls(path)
+
+@functools.lru_cache(maxsize=8)
+def _load_model(path: str, inode: int, modified: int):
+    """
+    Internal function to load a model once per version of its file, as identified by its inode and modification time.
+    """
+    return NgramModel(path)
+
+def load_model(path: str):
+    """
+    Used to load the model at `path` once per process: every cracker (and every call) using the same path shares the same mapping.
+    Once the file is replaced (e.g. compiled again), the next call loads the new file; the models already loaded keep mapping the previous one.
+
+    ---------------------------
+
+    :param path: The path of the model file.
+    :type path: str
+
+    ---------------------------
+
+    :return: The model.
+    :rtype: NgramModel
+    """
+    status = os.stat(path)
+    return _load_model(path, status.st_ino, status.st_mtime_ns)
\ No newline at end of file
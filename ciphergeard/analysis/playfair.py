@@ -0,0 +1,324 @@
+import math
+import multiprocessing
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from ..playfair import PlayfairCipher
+from . import AnalysisError, NgramModel, quadgram_table
+
+_worker_state = None
+
+LETTERS = [letter for letter in range(26) if letter != 9]
+"""The 25 letters of a Playfair table, numbered from 0 (`'a'`) to 25 (`'z'`), without `'j'` (9)."""
+
+def _decode_cells():
+    """
+    Used to precompute the cells of the decoded digram for every pair of cells of a 5x5 table.
+    The rules of Playfair only depend on the positions of the letters, so the result is the same for every table.
+
+    ---------------------------
+
+    :return: The cells of the decoded digram, for the cells `(p, q)` at the index `p * 25 + q`.
+    :rtype: list[tuple[int, int]]
+    """
+    cells = []
+    for p in range(25):
+        for q in range(25):
+            (r1, c1), (r2, c2) = divmod(p, 5), divmod(q, 5)
+            if r1 == r2: # Same row
+                cells.append((r1 * 5 + (c1 - 1) % 5, r2 * 5 + (c2 - 1) % 5))
+            elif c1 == c2: # Same column
+                cells.append(((r1 - 1) % 5 * 5 + c1, (r2 - 1) % 5 * 5 + c2))
+            else: # Rectangle
+                cells.append((r1 * 5 + c2, r2 * 5 + c1))
+    return cells
+
+DECODE_CELLS = _decode_cells()
+
+def ciphertext_pairs(ciphertext: str):
+    """
+    Used to split the letters of `ciphertext` into the digrams decoded by :class:`PlayfairCipher`, skipping the other characters and replacing `'j'` by `'i'`.
+
+    ---------------------------
+
+    :param ciphertext: The encoded text.
+    :type ciphertext: str
+
+    ---------------------------
+
+    :return: The digrams, as pairs of letters numbered from 0 to 25.
+    :rtype: list[tuple[int, int]]
+
+    ---------------------------
+
+    :raises AnalysisError: Indicates that the ciphertext had less than two digrams, or an odd number of letters.
+    """
+    letters = [ord(char) - 97 for char in ciphertext.lower().replace('j', 'i') if 'a' <= char <= 'z']
+    if len(letters) < 4 or len(letters) % 2:
+        raise AnalysisError(f"Expected an even number of letters, at least 4. Found: {len(letters)}")
+    return list(zip(letters[::2], letters[1::2]))
+
+def score_table(pairs: list[tuple[int, int]], table: list[int], position: list[int], quadgrams: list[float] | memoryview):
+    """
+    Used to score the text decoded from `pairs` with `table`, by the sum of the log-probabilities of its quadgrams.
+    Nothing is allocated for the decoded text: every decoded letter is rolled into the index of the current quadgram.
+
+    ---------------------------
+
+    :param pairs: The digrams of the ciphertext, as returned by :func:`ciphertext_pairs`.
+    :type pairs: list[tuple[int, int]]
+
+    :param table: The letter of every cell of the table, row by row.
+    :type table: list[int]
+
+    :param position: The cell of every letter (the inverse of `table`), indexed by letter.
+    :type position: list[int]
+
+    :param quadgrams: The log-probability of every quadgram, as returned by :func:`quadgram_table`.
+    :type quadgrams: list[float] | memoryview
+
+    ---------------------------
+
+    :return: The score, higher is better.
+    :rtype: float
+    """
+    cells = DECODE_CELLS
+    (a, b), (c, d) = pairs[0], pairs[1]
+    d1, d2 = cells[position[a] * 25 + position[b]]
+    d3, d4 = cells[position[c] * 25 + position[d]]
+    index = ((table[d1] * 26 + table[d2]) * 26 + table[d3]) * 26 + table[d4]
+    score = quadgrams[index]
+
+    for a, b in pairs[2:]:
+        d1, d2 = cells[position[a] * 25 + position[b]]
+        index = index % 17576 * 26 + table[d1]
+        score += quadgrams[index]
+        index = index % 17576 * 26 + table[d2]
+        score += quadgrams[index]
+    return score
+
+def expected_score(quadgrams: list[float] | NgramModel):
+    """
+    Used to compute the average log-probability of a quadgram of the language itself, i.e. the score per quadgram a correct decryption tends to.
+
+    ---------------------------
+
+    :param quadgrams: The log-probability of every quadgram, or a 4-gram :class:`NgramModel`.
+    :type quadgrams: list[float] | NgramModel
+
+    ---------------------------
+
+    :return: The expected score per quadgram.
+    :rtype: float
+    """
+    quadgrams = quadgram_table(quadgrams)
+    return sum(10 ** score * score for score in quadgrams)
+
+def _swap(table: list[int], position: list[int], cells: list[tuple[int, int]]):
+    """
+    Used to swap the letters of the pairs of `cells` in place, keeping `position` in sync. Swapping twice restores the table.
+    """
+    for i, j in cells:
+        table[i], table[j] = table[j], table[i]
+        position[table[i]], position[table[j]] = i, j
+
+def _mutation(rng: random.Random):
+    """
+    Used to draw a random change of the table: two cells swapped (90% of the time), two rows or two columns swapped, or the table flipped upside down or left to right.
+
+    ---------------------------
+
+    :return: The pairs of cells to swap.
+    :rtype: list[tuple[int, int]]
+    """
+    kind = rng.random()
+    if kind < 0.9:
+        return [tuple(rng.sample(range(25), 2))]
+
+    r1, r2 = rng.sample(range(5), 2)
+    if kind < 0.93:
+        return [(r1 * 5 + c, r2 * 5 + c) for c in range(5)]
+    if kind < 0.96:
+        return [(r * 5 + r1, r * 5 + r2) for r in range(5)]
+    if kind < 0.98:
+        return [(r * 5 + c, (4 - r) * 5 + c) for r in range(2) for c in range(5)]
+    return [(r * 5 + c, r * 5 + 4 - c) for r in range(5) for c in range(2)]
+
+def anneal(pairs: list[tuple[int, int]], quadgrams: list[float] | NgramModel, seed: int | str = None, temperature: float = None, cooling: float = 0.2, iterations: int = 10000, target: float = None, stop = None):
+    """
+    Used to run one chain of `simulated annealing <https://en.wikipedia.org/wiki/Simulated_annealing>`_ over the Playfair tables, from a random table.
+
+    At every step, the table is changed in place by swapping two cells, rows or columns, or flipping it, and the change is kept if the score improves,
+    or with a probability of `exp(delta / temperature)` otherwise, so that the chain can leave local maxima while the temperature is high. A rejected change is swapped back.
+    The temperature starts at `temperature` and decreases by `cooling` every `iterations` steps.
+
+    ---------------------------
+
+    :param pairs: The digrams of the ciphertext, as returned by :func:`ciphertext_pairs`.
+    :type pairs: list[tuple[int, int]]
+
+    :param quadgrams: The log-probability of every quadgram, as returned by :func:`quadgram_log_probabilities`, or a 4-gram :class:`NgramModel`.
+    :type quadgrams: list[float] | NgramModel
+
+    :param seed: The seed of the chain, defaults to `None` (random).
+    :type seed: int | str, optional
+
+    :param temperature: The starting temperature, defaults to `None` (scaled with the length of the ciphertext).
+    :type temperature: float, optional
+
+    :param cooling: The decrease of the temperature, defaults to `0.2`.
+    :type cooling: float, optional
+
+    :param iterations: The number of steps at every temperature, defaults to `10000`.
+    :type iterations: int, optional
+
+    :param target: The score per quadgram at which the chain stops, defaults to `None` (never).
+    :type target: float, optional
+
+    :param stop: An event checked at every temperature, which stops the chain once set (e.g. by another chain), defaults to `None`.
+    :type stop: multiprocessing.Event, optional
+
+    ---------------------------
+
+    :return: The best score per quadgram and the best table, as a key of 25 letters.
+    :rtype: tuple[float, str]
+    """
+    quadgrams = quadgram_table(quadgrams)
+    rng = random.Random(seed)
+    quadgram_count = 2 * len(pairs) - 3
+    temperature = 10 + 0.087 * (2 * len(pairs) - 84) if temperature is None else temperature
+    target = math.inf if target is None else target * quadgram_count
+
+    table = LETTERS[:]
+    rng.shuffle(table)
+    position = [0] * 26
+    for cell, letter in enumerate(table):
+        position[letter] = cell
+
+    score = best = score_table(pairs, table, position, quadgrams)
+    best_table = table[:]
+
+    while temperature > 0 and best < target and not (stop is not None and stop.is_set()):
+        for _ in range(iterations):
+            cells = _mutation(rng)
+            _swap(table, position, cells)
+            candidate = score_table(pairs, table, position, quadgrams)
+            delta = candidate - score
+
+            if delta >= 0 or rng.random() < math.exp(delta / temperature):
+                score = candidate
+                if score > best:
+                    best, best_table = score, table[:]
+                    if best >= target:
+                        break
+            else:
+                _swap(table, position, cells)
+
+        temperature -= cooling
+
+    return best / quadgram_count, "".join(chr(97 + letter) for letter in best_table)
+
+def _init_worker(pairs: list[tuple[int, int]], quadgrams: list[float] | NgramModel, stop):
+    """
+    Used to store the ciphertext, the quadgrams and the stop event of a worker process once, when the process starts, instead of sending them along with every chain.
+    """
+    global _worker_state
+    _worker_state = pairs, quadgrams, stop
+
+def _run_chain(seed: str, options: dict):
+    """
+    Used to run a chain of :func:`anneal` in a worker process, setting the stop event once the chain reaches its target.
+    """
+    pairs, quadgrams, stop = _worker_state
+    result = anneal(pairs, quadgrams, seed=seed, stop=stop, **options)
+    if options["target"] is not None and result[0] >= options["target"]:
+        stop.set()
+    return result
+
+def crack_playfair(ciphertext: str, quadgrams: list[float] | NgramModel, chains: int = None, workers: int = None, seed: int | str = None, temperature: float = None, cooling: float = 0.2, iterations: int = 10000, target: float = None):
+    """
+    Used to recover the table and the plaintext of a text encoded by :class:`PlayfairCipher`, without knowing the keyword.
+
+    Independent chains of :func:`anneal` are run from different random tables, in parallel on a :class:`concurrent.futures.ProcessPoolExecutor` with `workers`.
+    The ciphertext and the quadgrams are sent to every worker process once, when the process starts.
+    Once a chain reaches the `target` score, the other chains stop at their next temperature and the chains not started yet are cancelled.
+    A :class:`NgramModel` is sent as its path, and the worker processes share the memory-mapped table.
+
+    ---------------------------
+
+    :param ciphertext: The encoded text.
+    :type ciphertext: str
+
+    :param quadgrams: The log-probability of every quadgram, as returned by :func:`quadgram_log_probabilities`, or a 4-gram :class:`NgramModel`.
+    :type quadgrams: list[float] | NgramModel
+
+    :param chains: The number of chains, defaults to `None` (`workers`, or the number of CPUs).
+    :type chains: int, optional
+
+    :param workers: The number of worker processes, defaults to `None` (the chains are run in the current process).
+    :type workers: int, optional
+
+    :param seed: The seed of the chains, defaults to `None` (random). The chain `i` is seeded with `f"{seed}:{i}"`.
+    :type seed: int | str, optional
+
+    :param temperature: The starting temperature, defaults to `None` (scaled with the length of the ciphertext).
+    :type temperature: float, optional
+
+    :param cooling: The decrease of the temperature, defaults to `0.2`.
+    :type cooling: float, optional
+
+    :param iterations: The number of steps at every temperature, defaults to `10000`.
+    :type iterations: int, optional
+
+    :param target: The score per quadgram at which to stop, defaults to `None` (5% below :func:`expected_score`).
+    :type target: float, optional
+
+    ---------------------------
+
+    :return: The table (as a key of 25 letters) and the score per quadgram (higher is better) of every chain, best first, and the text decoded with the best table.
+    :rtype: tuple[list[tuple[str, float]], str]
+
+    ---------------------------
+
+    :raises AnalysisError: Indicates that the ciphertext could not be split into digrams.
+
+    ---------------------------
+
+    **Example**
+    ---------------------------
+    .. code-block:: python
+
+       from ciphergeard.analysis import quadgram_log_probabilities
+       from ciphergeard.analysis.playfair import crack_playfair
+
+       with open("corpus.txt") as file:
+           quadgrams = quadgram_log_probabilities(file.read())
+
+       keys, plaintext = crack_playfair(ciphertext, quadgrams, workers=4)
+    """
+    pairs = ciphertext_pairs(ciphertext)
+    chains = chains or workers or os.cpu_count() or 1
+    target = expected_score(quadgrams) * 1.05 if target is None else target
+    options = {"temperature": temperature, "cooling": cooling, "iterations": iterations, "target": target}
+    seeds = [None if seed is None else f"{seed}:{i}" for i in range(chains)]
+
+    results = []
+    if workers is None or workers == 1 or chains == 1:
+        for chain_seed in seeds:
+            results.append(anneal(pairs, quadgrams, seed=chain_seed, **options))
+            if results[-1][0] >= target:
+                break
+    else:
+        stop = multiprocessing.Event()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(pairs, quadgrams, stop)) as executor:
+            pending = {executor.submit(_run_chain, chain_seed, options) for chain_seed in seeds}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                results += [future.result() for future in done if not future.cancelled()]
+                if stop.is_set():
+                    for future in pending:
+                        future.cancel()
+
+    ranked = sorted(((key, score) for score, key in results), key=lambda result: result[1], reverse=True)
+    return ranked, PlayfairCipher(keyword=ranked[0][0]).decode(ciphertext)
\ No newline at end of file
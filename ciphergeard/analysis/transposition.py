@@ -0,0 +1,283 @@
+import math
+import random
+from operator import add
+
+from ..columnar_transposition import column_permutation
+from ..rail_fence import zigzag_permutation
+from . import AnalysisError, NgramModel, quadgram_score, quadgram_table
+
+def bigram_log_probabilities(quadgrams: list[float] | NgramModel):
+    """
+    Used to derive the log-probability of every bigram from the quadgram table, by summing the probabilities of the quadgrams starting with it.
+    A 27th "letter" (26) stands for every other character: the bigrams containing it have a log-probability of 0, so they neither help nor hurt a score.
+
+    ---------------------------
+
+    :param quadgrams: The log-probability of every quadgram, as returned by :func:`quadgram_log_probabilities`, or a 4-gram :class:`NgramModel`.
+    :type quadgrams: list[float] | NgramModel
+
+    ---------------------------
+
+    :return: The log-probability of the bigram `ab` at the index `a * 27 + b`.
+    :rtype: list[float]
+    """
+    quadgrams = quadgram_table(quadgrams)
+    bigrams = [0.0] * 27 * 27
+    for a in range(26):
+        for b in range(26):
+            start = (a * 26 + b) * 676
+            bigrams[a * 27 + b] = math.log10(sum(10 ** score for score in quadgrams[start:start + 676]))
+    return bigrams
+
+def _letter_codes(text: str):
+    """
+    Used to number the characters of `text` for :func:`bigram_log_probabilities`: the English letters from 0 to 25, ignoring the case, and every other character 26.
+    """
+    return [ord(char) - 97 if 'a' <= char <= 'z' else 26 for char in text.lower()]
+
+def crack_rail_fence(ciphertext: str, quadgrams: list[float] | NgramModel, max_rails: int | None = 100):
+    """
+    Used to recover the number of rails and the plaintext of a text encoded by :class:`RailFenceCipher`.
+    Every number of rails up to `max_rails` is tried: the text is decoded with the (cached) :func:`zigzag_permutation` and scored by :func:`quadgram_score`.
+    The cost is one pass over the text per number of rails, so trying every number of rails of a long text is quadratic.
+
+    ---------------------------
+
+    :param ciphertext: The encoded text.
+    :type ciphertext: str
+
+    :param quadgrams: The log-probability of every quadgram, as returned by :func:`quadgram_log_probabilities`, or a 4-gram :class:`NgramModel`.
+    :type quadgrams: list[float] | NgramModel
+
+    :param max_rails: The largest number of rails to try, defaults to `100`. `None` tries every number of rails that changes the text, up to its length minus 1.
+    :type max_rails: int | None, optional
+
+    ---------------------------
+
+    :return: The `(rails, score)` of every number of rails, best (highest score per quadgram) first, and the text decoded with the best one.
+    :rtype: tuple[list[tuple[int, float]], str]
+
+    ---------------------------
+
+    :raises AnalysisError: Indicates that the ciphertext had less than 4 letters.
+
+    ---------------------------
+
+    **Example**
+    ---------------------------
+    .. code-block:: python
+
+       from ciphergeard.analysis import quadgram_log_probabilities
+       from ciphergeard.analysis.transposition import crack_rail_fence
+
+       with open("corpus.txt") as file:
+           quadgrams = quadgram_log_probabilities(file.read())
+
+       ranked, plaintext = crack_rail_fence(ciphertext, quadgrams)
+       rails, score = ranked[0]
+    """
+    length = len(ciphertext)
+    max_rails = length - 1 if max_rails is None else min(max_rails, length - 1)
+
+    ranked, best, plaintext = [], -math.inf, None
+    for rails in range(1, max(max_rails, 1) + 1):
+        _, inverse = zigzag_permutation(rails, length)
+        text = "".join(map(ciphertext.__getitem__, inverse))
+        score = quadgram_score(text, quadgrams)
+        ranked.append((rails, score))
+        if score > best:
+            best, plaintext = score, text
+
+    ranked.sort(key=lambda result: result[1], reverse=True)
+    return ranked, plaintext
+
+def _adjacency(columns: list[list[int]], bigrams: list[float]):
+    """
+    Used to score every pair of columns of the ciphertext as neighbours in the plaintext: the score of `(a, b)` is the sum of the bigrams made by the characters of `a` and `b` on every row.
+    """
+    firsts = [[code * 27 for code in column] for column in columns]
+    return [[sum(map(bigrams.__getitem__, map(add, first, second))) for second in columns] for first in firsts]
+
+def _climb(adjacency: list[list[float]], order: list[int], rng: random.Random):
+    """
+    Used to hill-climb from `order` (the column of the ciphertext written at every column of the plaintext), until no move improves the score.
+    The score is the sum of the adjacency of the neighbouring columns, so a move is scored by the few pairs of neighbours it changes instead of rescoring the order:
+    swapping two columns changes at most 4 pairs, and moving a run of columns elsewhere (which keeps the runs already in the right order together) changes 3.
+
+    ---------------------------
+
+    :return: The score of the local maximum, `order` being updated in place.
+    :rtype: float
+    """
+    size = len(order)
+    score = sum(adjacency[order[i]][order[i + 1]] for i in range(size - 1))
+    swaps = [(i, j) for i in range(size) for j in range(i + 1, size)]
+
+    def edge(a: int, b: int):
+        return 0.0 if a is None or b is None else adjacency[a][b]
+
+    improved = True
+    while improved:
+        improved = False
+        rng.shuffle(swaps)
+        for i, j in swaps:
+            edges = {edge for edge in (i - 1, i, j - 1, j) if 0 <= edge < size - 1}
+            before = sum(adjacency[order[edge]][order[edge + 1]] for edge in edges)
+            order[i], order[j] = order[j], order[i]
+            delta = sum(adjacency[order[edge]][order[edge + 1]] for edge in edges) - before
+
+            if delta > 1e-9:
+                score += delta
+                improved = True
+            else:
+                order[i], order[j] = order[j], order[i]
+
+        for i, j in swaps + [(i, i) for i in range(size)]:
+            # The run order[i..j] is cut out, joining its neighbours, and inserted before rest[k].
+            rest = order[:i] + order[j + 1:]
+            left, right = order[i - 1] if i else None, order[j + 1] if j + 1 < size else None
+            cut = edge(left, right) - edge(left, order[i]) - edge(order[j], right)
+
+            for k in range(len(rest) + 1):
+                before, after = rest[k - 1] if k else None, rest[k] if k < len(rest) else None
+                delta = cut - edge(before, after) + edge(before, order[i]) + edge(order[j], after)
+                if k != i and delta > 1e-9:
+                    order[:] = rest[:k] + order[i:j + 1] + rest[k:]
+                    score += delta
+                    improved = True
+                    break
+            if improved:
+                break
+    return score
+
+def _order_score(ciphertext: str, order: list[int], quadgrams: list[float] | NgramModel, sample_rows: int = 48):
+    """
+    Used to score a column order by the quadgrams of the first `sample_rows` rows it decodes.
+    """
+    size = len(order)
+    rows = len(ciphertext) // size
+    return quadgram_score("".join(ciphertext[order[col] * rows + row] for row in range(min(rows, sample_rows)) for col in range(size)), quadgrams)
+
+def _moves(order: list[int]):
+    """
+    Used to generate the orders one move away from `order`: two columns swapped, or a run of columns moved elsewhere.
+    """
+    size = len(order)
+    for i in range(size):
+        for j in range(i + 1, size):
+            moved = order[:]
+            moved[i], moved[j] = moved[j], moved[i]
+            yield moved
+        for j in range(i, size):
+            rest = order[:i] + order[j + 1:]
+            for k in range(len(rest) + 1):
+                if k != i:
+                    yield rest[:k] + order[i:j + 1] + rest[k:]
+
+def _polish(ciphertext: str, order: list[int], quadgrams: list[float] | NgramModel):
+    """
+    Used to hill-climb from `order` with the same moves as :func:`_climb`, scored by :func:`_order_score` instead of the bigrams of the neighbouring columns.
+    """
+    score = _order_score(ciphertext, order, quadgrams)
+    improved = True
+    while improved:
+        improved = False
+        for moved in _moves(order):
+            moved_score = _order_score(ciphertext, moved, quadgrams)
+            if moved_score > score + 1e-9:
+                order, score, improved = moved, moved_score, True
+                break
+    return order
+
+def crack_columnar(ciphertext: str, quadgrams: list[float] | NgramModel, min_columns: int = 2, max_columns: int = 20, restarts: int = 20, candidates: int = 3, seed: int | str = None):
+    """
+    Used to recover the column order and the plaintext of a text encoded by :class:`ColumnarTranspositionCipher` with a single keyword.
+
+    The encoded text is padded to complete rows, so the number of columns divides its length, and every column of the plaintext is a contiguous block of the ciphertext.
+    For every number of columns, the blocks are scored as neighbours once, with the bigrams derived by :func:`bigram_log_probabilities`, and the column order is hill-climbed from `restarts` random orders,
+    rescoring only the neighbours of the moved columns. The best `candidates` orders of every number of columns are kept.
+    With few rows, the bigrams may favour a wrong order, so the best `candidates` orders overall are hill-climbed again, scored by the quadgrams of the first rows they decode.
+    Every order is then decoded with the (cached) :func:`column_permutation` and ranked by :func:`quadgram_score`.
+
+    A keyword giving the order is returned, made of the letters `'a'`, `'b'`... in the order in which the columns are read.
+
+    ---------------------------
+
+    :param ciphertext: The encoded text.
+    :type ciphertext: str
+
+    :param quadgrams: The log-probability of every quadgram, as returned by :func:`quadgram_log_probabilities`, or a 4-gram :class:`NgramModel`.
+    :type quadgrams: list[float] | NgramModel
+
+    :param min_columns: The smallest number of columns (the length of the keyword) to try, defaults to `2`.
+    :type min_columns: int, optional
+
+    :param max_columns: The largest number of columns to try, defaults to `20`.
+    :type max_columns: int, optional
+
+    :param restarts: The number of random orders to climb from, for every number of columns, defaults to `20`.
+    :type restarts: int, optional
+
+    :param candidates: The number of orders kept for every number of columns, and polished overall, defaults to `3`.
+    :type candidates: int, optional
+
+    :param seed: The seed of the random orders, defaults to `None` (random).
+    :type seed: int | str, optional
+
+    ---------------------------
+
+    :return: The `(keyword, score)` of the candidates, best (highest score per quadgram) first, and the text decoded with the best one.
+    :rtype: tuple[list[tuple[str, float]], str]
+
+    ---------------------------
+
+    :raises AnalysisError: Indicates that no number of columns in the range divided the length of the ciphertext, or that the ciphertext had less than 4 letters.
+
+    ---------------------------
+
+    **Example**
+    ---------------------------
+    .. code-block:: python
+
+       from ciphergeard.analysis import quadgram_log_probabilities
+       from ciphergeard.analysis.transposition import crack_columnar
+
+       with open("corpus.txt") as file:
+           quadgrams = quadgram_log_probabilities(file.read())
+
+       ranked, plaintext = crack_columnar(ciphertext, quadgrams, max_columns=15)
+       keyword, score = ranked[0]
+    """
+    length = len(ciphertext)
+    sizes = [size for size in range(max(min_columns, 1), max_columns + 1) if length % size == 0]
+    if not sizes:
+        raise AnalysisError(f"No number of columns between {min_columns} and {max_columns} divides the length of the ciphertext ({length}).")
+
+    rng = random.Random(seed)
+    bigrams = bigram_log_probabilities(quadgrams)
+    codes = _letter_codes(ciphertext)
+
+    orders = []
+    for size in sizes:
+        rows = length // size
+        adjacency = _adjacency([codes[i * rows:(i + 1) * rows] for i in range(size)], bigrams)
+
+        climbed = {}
+        for _ in range(restarts):
+            order = list(range(size))
+            rng.shuffle(order)
+            climbed[tuple(order)] = _climb(adjacency, order, rng)
+        orders += sorted(climbed, key=climbed.get, reverse=True)[:candidates]
+
+    # With few rows, the bigrams may favour a wrong order: the best orders are polished with the quadgrams of the text they decode.
+    orders.sort(key=lambda order: _order_score(ciphertext, order, quadgrams), reverse=True)
+    orders[:candidates] = [_polish(ciphertext, list(order), quadgrams) for order in orders[:candidates]]
+
+    texts = {}
+    for order in orders:
+        keyword = "".join(chr(97 + rank) for rank in order)
+        _, inverse = column_permutation(keyword, length)
+        texts[keyword] = "".join(map(ciphertext.__getitem__, inverse)).rstrip()
+
+    ranked = sorted(((keyword, quadgram_score(text, quadgrams)) for keyword, text in texts.items()), key=lambda result: result[1], reverse=True)
+    return ranked, texts[ranked[0][0]]
\ No newline at end of file
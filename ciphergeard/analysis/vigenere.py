@@ -0,0 +1,257 @@
+import string
+from collections import Counter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ..vigenere import VigenereCipher
+from ..vigenere.beaufort import BeaufortVariant
+from ..vigenere.gronsfeld import GronsfeldVariant
+from . import ENGLISH_LETTER_PROBABILITIES, AnalysisError, chi_squared
+
+VARIANTS = {
+    "vigenere": (VigenereCipher, 1, 26),
+    "beaufort": (BeaufortVariant, -1, 26),
+    "gronsfeld": (GronsfeldVariant, 1, 9),
+}
+"""The class, the direction of the shifts while encoding and the number of possible shifts of every variant."""
+
+_LETTERS = string.ascii_lowercase.encode()
+
+def prepare(ciphertext: str):
+    """
+    Used to turn `ciphertext` into bytes holding one byte per character, with the lowercase ASCII letters kept and every other character replaced by `'?'`.
+    Like the Vigenère family, which advances the key on every character, the positions of the characters are kept.
+
+    ---------------------------
+
+    :param ciphertext: The encoded text.
+    :type ciphertext: str
+
+    ---------------------------
+
+    :return: The prepared text.
+    :rtype: bytes
+    """
+    return ciphertext.lower().strip().encode("ascii", "replace")
+
+def column_counts(data: bytes, period: int):
+    """
+    Used to count the letters of every column of `data`, i.e. of the characters sharing a position in a key of `period` characters.
+    With `NumPy <https://numpy.org>`_ installed, every column is counted by a `bincount` over a strided view.
+
+    ---------------------------
+
+    :param data: The text prepared by :func:`prepare`.
+    :type data: bytes
+
+    :param period: The length of the key.
+    :type period: int
+
+    ---------------------------
+
+    :return: The count of every letter from `'a'` to `'z'`, for every column.
+    :rtype: list[list[int]]
+    """
+    if numpy is not None:
+        array = numpy.frombuffer(data, dtype=numpy.uint8)
+        return [numpy.bincount(array[i::period], minlength=256)[97:123].tolist() for i in range(period)]
+
+    columns = [data[i::period] for i in range(period)]
+    return [[column.count(letter) for letter in _LETTERS] for column in columns]
+
+def index_of_coincidence(counts: list[int]):
+    """
+    Used to compute the `index of coincidence <https://en.wikipedia.org/wiki/Index_of_coincidence>`_ of letter counts, i.e. the probability that two letters drawn from them are the same.
+    It is about 0.066 for English text, and 0.038 for uniformly random letters.
+
+    ---------------------------
+
+    :param counts: The count of every letter.
+    :type counts: list[int]
+
+    ---------------------------
+
+    :return: The index of coincidence.
+    :rtype: float
+    """
+    total = sum(counts)
+    return sum(count * (count - 1) for count in counts) / (total * (total - 1)) if total > 1 else 0.0
+
+def period_coincidences(data: bytes, max_period: int = 40):
+    """
+    Used to compute the average index of coincidence of the columns of `data`, for every key length up to `max_period`.
+    With the right length (or a multiple of it), every column is a Caesar cipher and keeps the index of coincidence of the language.
+
+    ---------------------------
+
+    :param data: The text prepared by :func:`prepare`.
+    :type data: bytes
+
+    :param max_period: The longest key length to try, defaults to `40`.
+    :type max_period: int, optional
+
+    ---------------------------
+
+    :return: The average index of coincidence of every key length, from 1 to `max_period`.
+    :rtype: dict[int, float]
+    """
+    coincidences = {}
+    for period in range(1, max_period + 1):
+        columns = column_counts(data, period)
+        coincidences[period] = sum(index_of_coincidence(counts) for counts in columns) / period
+    return coincidences
+
+def kasiski_votes(data: bytes, max_period: int = 40):
+    """
+    Used to run the `Kasiski examination <https://en.wikipedia.org/wiki/Kasiski_examination>`_ on `data`: repeated trigrams are likely the same plaintext encoded by the same part of the key,
+    so the key length likely divides the spacing between them.
+
+    The last position of every trigram is kept in a dict, so the repeats are found in a single pass. The spacings are counted first, and only the distinct ones are divided.
+
+    ---------------------------
+
+    :param data: The text prepared by :func:`prepare`.
+    :type data: bytes
+
+    :param max_period: The longest key length to vote for, defaults to `40`.
+    :type max_period: int, optional
+
+    ---------------------------
+
+    :return: The number of spacings every key length from 2 to `max_period` divides.
+    :rtype: dict[int, int]
+    """
+    last, spacings = {}, Counter()
+    for i in range(len(data) - 2):
+        trigram = data[i:i + 3]
+        if trigram.isalpha():
+            previous = last.get(trigram)
+            if previous is not None:
+                spacings[i - previous] += 1
+            last[trigram] = i
+
+    return {period: sum(count for spacing, count in spacings.items() if spacing % period == 0) for period in range(2, max_period + 1)}
+
+def solve_shifts(columns: list[list[int]], direction: int = 1, shifts: int = 26, probabilities: list[float] = None):
+    """
+    Used to solve every column as a Caesar cipher: the shift whose decoded counts have the lowest chi-squared statistic is kept.
+
+    ---------------------------
+
+    :param columns: The letter counts of every column, as returned by :func:`column_counts`.
+    :type columns: list[list[int]]
+
+    :param direction: `1` if the key was added while encoding (Vigenère, Gronsfeld), `-1` if it was subtracted (Beaufort), defaults to `1`.
+    :type direction: int, optional
+
+    :param shifts: The number of possible shifts, from 0, defaults to `26`.
+    :type shifts: int, optional
+
+    :param probabilities: The probability of every letter from `'a'` to `'z'`, defaults to the English letter probabilities.
+    :type probabilities: list[float], optional
+
+    ---------------------------
+
+    :return: The shift of every column, and the sum of their chi-squared statistics.
+    :rtype: tuple[list[int], float]
+    """
+    probabilities = probabilities or ENGLISH_LETTER_PROBABILITIES
+    solved, total = [], 0.0
+    for counts in columns:
+        # The letter x is encoded as x + direction * shift, so the decoded count of x is the count of that letter.
+        scores = [(chi_squared([counts[(x + direction * shift) % 26] for x in range(26)], probabilities), shift) for shift in range(shifts)]
+        score, shift = min(scores)
+        solved.append(shift)
+        total += score
+    return solved, total
+
+def crack_vigenere(ciphertext: str, variant: str = "vigenere", max_period: int = 40, candidates: int = 5, sample_size: int = 1 << 20, probabilities: list[float] = None):
+    """
+    Used to recover the key and the plaintext of a text encoded by :class:`VigenereCipher`, :class:`BeaufortVariant` or :class:`GronsfeldVariant`, without knowing the key.
+
+    The most likely key lengths are the best `candidates` by :func:`period_coincidences`, along with the best `candidates` by :func:`kasiski_votes` (weighted by the length).
+    Both only look at the first `sample_size` characters, and the Kasiski examination at the first 64 KiB of them.
+    For every length, the columns of the whole text are solved by :func:`solve_shifts`. A key made of a repeated shorter key is reduced to the shorter one.
+
+    ---------------------------
+
+    :param ciphertext: The encoded text.
+    :type ciphertext: str
+
+    :param variant: `'vigenere'`, `'beaufort'` or `'gronsfeld'`, defaults to `'vigenere'`.
+    :type variant: str, optional
+
+    :param max_period: The longest key length to try, defaults to `40`.
+    :type max_period: int, optional
+
+    :param candidates: The number of key lengths taken from each test, defaults to `5`.
+    :type candidates: int, optional
+
+    :param sample_size: The number of characters used to find the key length, defaults to `1048576`.
+    :type sample_size: int, optional
+
+    :param probabilities: The probability of every letter from `'a'` to `'z'`, defaults to the English letter probabilities.
+    :type probabilities: list[float], optional
+
+    ---------------------------
+
+    :return: The key candidates (a keyword, or an `int` for Gronsfeld) and their score (the chi-squared statistic per letter, lower is better), best first, and the text decoded with the best key.
+    :rtype: tuple[list[tuple[str | int, float]], str]
+
+    ---------------------------
+
+    :raises AnalysisError: Indicates that the variant was unknown, or that the ciphertext did not contain any letter.
+
+    ---------------------------
+
+    **Example**
+    ---------------------------
+    .. code-block:: python
+
+       from ciphergeard.analysis.vigenere import crack_vigenere
+
+       with open("encoded.txt") as file:
+           keys, plaintext = crack_vigenere(file.read(), variant="vigenere")
+
+       keyword, score = keys[0]
+    """
+    if variant not in VARIANTS:
+        raise AnalysisError(f"Expected one of {', '.join(VARIANTS)}. Found: {variant}")
+    cipher, direction, shifts = VARIANTS[variant]
+
+    data = prepare(ciphertext)
+    letters = sum(data.count(letter) for letter in _LETTERS)
+    if not letters:
+        raise AnalysisError('The ciphertext does not contain any letter.')
+
+    sample = data[:sample_size]
+    max_period = max(1, min(max_period, len(data) // 2))
+    coincidences = period_coincidences(sample, max_period)
+    votes = kasiski_votes(sample[:1 << 16], max_period)
+
+    periods = sorted(coincidences, key=coincidences.get, reverse=True)[:candidates]
+    periods += sorted(votes, key=lambda period: votes[period] * period, reverse=True)[:candidates]
+
+    keys = {}
+    for period in dict.fromkeys(periods):
+        solved, score = solve_shifts(column_counts(data, period), direction, shifts, probabilities)
+
+        # A repeated key (e.g. the double of the right length) is reduced to its shortest repeating unit.
+        for length in range(1, period + 1):
+            if period % length == 0 and solved == solved[:length] * (period // length):
+                solved = solved[:length]
+                break
+
+        keys.setdefault(tuple(solved), score / letters)
+
+    ranked = sorted(keys.items(), key=lambda key: key[1])
+    if variant == "gronsfeld":
+        ranked = [(int("".join(str(shift + 1) for shift in solved)), score) for solved, score in ranked]
+    else:
+        ranked = [("".join(string.ascii_lowercase[shift] for shift in solved), score) for solved, score in ranked]
+
+    key = ranked[0][0]
+    return ranked, cipher(key).decode(ciphertext)
\ No newline at end of file
@@ -1,9 +1,11 @@
 import string
+from .batch import BatchMixin
+from .parallel import ParallelFileMixin
 
 class AtbashCipherError(Exception):
     pass
 
-class AtbashCipher:
+class AtbashCipher(BatchMixin, ParallelFileMixin):
     def __init__(self) -> None:
         """
         The `Atbash Cipher <https://en.wikipedia.org/wiki/Atbash>`_, a class monoalphabetic substitution cipher.
@@ -28,7 +30,8 @@ class AtbashCipher:
            plaintext = cipher.decode(ciphertext=ciphertext)
            # Output: attack at dawn
         """
-        pass
+        reversed_letters = string.ascii_lowercase[::-1].encode()
+        self.byte_table = bytes.maketrans(string.ascii_letters.encode(), reversed_letters * 2)
 
     def encode(self, plaintext: str):
         """
@@ -81,6 +84,78 @@ class AtbashCipher:
 
         return plaintext
     
+    def encode_bytes(self, plaintext: bytes | bytearray | memoryview):
+        """
+        Used to encode the `plaintext` directly as bytes, without decoding it to `str` first.
+        Only the ASCII letters are encoded, every other byte is left untouched.
+
+        ---------------------------
+
+        :param plaintext: The plaintext to encode.
+        :type plaintext: bytes | bytearray | memoryview
+
+        ---------------------------
+
+        :return: The encoded bytes.
+        :rtype: bytes
+        """
+        return bytes(plaintext).strip().translate(self.byte_table)
+
+    def decode_bytes(self, ciphertext: bytes | bytearray | memoryview):
+        """
+        Used to decode the `ciphertext` directly as bytes, without decoding it to `str` first.
+        Only the ASCII letters are decoded, every other byte is left untouched.
+
+        ---------------------------
+
+        :param ciphertext: The encoded bytes to decode.
+        :type ciphertext: bytes | bytearray | memoryview
+
+        ---------------------------
+
+        :return: The decoded bytes.
+        :rtype: bytes
+        """
+        return bytes(ciphertext).strip().translate(self.byte_table)
+
+    def encode_chunk(self, chunk: bytes, position: int = 0):
+        """
+        Used to encode a chunk of a larger text, e.g. by :meth:`encode_file`. Every letter is encoded on its own, so the `position` of the chunk is not needed.
+
+        ---------------------------
+
+        :param chunk: The chunk to encode. It is not stripped.
+        :type chunk: bytes
+
+        :param position: The offset of the chunk in the text, defaults to `0`.
+        :type position: int, optional
+
+        ---------------------------
+
+        :return: The encoded chunk.
+        :rtype: bytes
+        """
+        return chunk.translate(self.byte_table)
+
+    def decode_chunk(self, chunk: bytes, position: int = 0):
+        """
+        Used to decode a chunk of a larger text, e.g. by :meth:`decode_file`. Every letter is decoded on its own, so the `position` of the chunk is not needed.
+
+        ---------------------------
+
+        :param chunk: The chunk to decode. It is not stripped.
+        :type chunk: bytes
+
+        :param position: The offset of the chunk in the text, defaults to `0`.
+        :type position: int, optional
+
+        ---------------------------
+
+        :return: The decoded chunk.
+        :rtype: bytes
+        """
+        return chunk.translate(self.byte_table)
+
     def get_index(self, letter: str):
         """
         Used to return the index of a letter.
@@ -1,24 +1,31 @@
+import re
 import string
 import random
+from .batch import BatchMixin
 
 class BaconianCipherError(Exception):
     pass
 
-class BaconianCipher:
+class BaconianCipher(BatchMixin):
     def __init__(self, lookup_table: dict[str]) -> None:
         """
         The `Baconian Cipher <https://en.wikipedia.org/wiki/Bacon%27s_cipher>`_, a method of steganographic message encoding.
         The cipher is not case-sensitive, so both plaintext and encoded text are converted to lowercase during processing.
 
-        A reverse dict of the `lookup_table` is generated for ease-of-access when decoding.
+        A reverse dict of the `lookup_table` is generated for ease-of-access when decoding, along with a prefix tree of its codes.
+        The codes don't need to share a length (e.g. shorter codes for frequent letters) as long as none of them is the beginning of another one.
 
         ---------------------------
 
-        :param lookup_table: The lookup table. Can be generated using the `generate_lookup_table` function.
+        :param lookup_table: The lookup table. Can be generated using :meth:`generate_lookup_table`.
         :type lookup_table: dict
 
         ---------------------------
 
+        :raises BaconianCipherError: Indicates that the codes of the `lookup_table` were not unique, non-empty, alphabetic and prefix-free.
+
+        ---------------------------
+
         **Example**
         ---------------------------
         .. code-block::python
@@ -39,27 +46,164 @@ class BaconianCipher:
         """
         self.lookup_table = lookup_table
         self.rlookup_table = {val: key for key, val in self.lookup_table.items()}
+        if len(self.rlookup_table) != len(self.lookup_table):
+            raise BaconianCipherError('The codes of the lookup table must be unique.')
+        self.trie = self.build_trie()
+        self.pattern = self.compile_trie(self.trie)
+
+    def build_trie(self):
+        """
+        Used to build a prefix tree of the codes in `self.lookup_table`.
+        Every node is a dict mapping a character to the next node, and `''` to the letter whose code ends there.
+
+        ---------------------------
+
+        :return: The root of the prefix tree.
+        :rtype: dict
+
+        ---------------------------
+
+        :raises BaconianCipherError: Indicates that the table was empty, or a code was empty, not alphabetic, or the beginning of another code.
+        """
+        if not self.lookup_table:
+            raise BaconianCipherError('Please specify a proper lookup table.')
+
+        trie = {}
+        for letter, code in self.lookup_table.items():
+            if not code.isalpha():
+                raise BaconianCipherError(f"Expected a non-empty alphabetic code. Found: '{code}' ({letter})")
+
+            node = trie
+            for char in code:
+                if '' in node:
+                    raise BaconianCipherError(f"The code of '{node['']}' is the beginning of the code of '{letter}'.")
+                node = node.setdefault(char, {})
+
+            if node:
+                raise BaconianCipherError(f"The code of '{letter}' is the beginning of another code.")
+            node[''] = letter
+        return trie
+
+    def compile_trie(self, trie: dict):
+        """
+        Used to compile the prefix tree into a regular expression which matches a single code or a run of non-letters.
+        Every branch of the tree becomes a nested group, so the regular expression engine walks the tree one character at a time without backtracking.
+
+        ---------------------------
+
+        :param trie: The root of the prefix tree.
+        :type trie: dict
 
-    def generate_lookup_table(multiple_char: bool = False):
+        ---------------------------
+
+        :return: The compiled regular expression.
+        :rtype: re.Pattern
+        """
+        def branch(node):
+            if '' in node:
+                return ""
+            alternatives = [re.escape(char) + branch(child) for char, child in node.items()]
+            return alternatives[0] if len(alternatives) == 1 else f"(?:{'|'.join(alternatives)})"
+
+        return re.compile(f"{branch(trie)}|[\\W\\d_]+")
+
+    @classmethod
+    def generate_lookup_table(cls, multiple_char: bool = False, seed: int | str | random.Random = None, length: int = 5):
         """
         Used to generate a lookup table.
 
+        The codes are drawn without replacement from the numbers of all the possible codes, so every letter gets a distinct code in 26 draws.
+        With the same `seed`, the same table is generated in every process.
+
         ---------------------------
 
         :param multiple_char: If set to `True`, it will include the whole english alphabet for the cipher of a letter. Else, only 'a' & 'b', defaults to `False`.
         :type multiple_char: bool, optional
 
+        :param seed: The seed, or the random number generator to draw from, defaults to `None` (the global generator of the `random` module).
+        :type seed: int | str | random.Random, optional
+
+        :param length: The length of every code, defaults to `5`.
+        :type length: int, optional
+
         ---------------------------
 
         :return: The lookup table.
         :rtype: dict
+
+        ---------------------------
+
+        :raises BaconianCipherError: Indicates that there are less than 26 codes of the specified `length`.
         """
         char_pool = string.ascii_lowercase if multiple_char else "ab"
-        lookup_table = set()
-        while len(lookup_table) < 26:
-            sequence = "".join(random.choices(char_pool, k=5))
-            lookup_table.add(sequence)
-        return {letter: sequence for letter, sequence in zip(string.ascii_lowercase, lookup_table)}
+        if len(char_pool) ** length < 26:
+            raise BaconianCipherError(f"Expected at least 26 codes. Found: {len(char_pool) ** length} codes of length {length}")
+
+        if isinstance(seed, random.Random):
+            rng = seed
+        else:
+            rng = random if seed is None else random.Random(seed)
+
+        codes = rng.sample(range(len(char_pool) ** length), 26)
+        return {letter: cls.code_to_string(code, char_pool, length) for letter, code in zip(string.ascii_lowercase, codes)}
+
+    @classmethod
+    def generate_lookup_tables(cls, count: int, seed: int | str, multiple_char: bool = False, length: int = 5, start: int = 0):
+        """
+        Used to generate many lookup tables at once, e.g. to explore the key space.
+
+        The table at index `i` is generated from its own seed, derived from `seed` and `i`, so a range of the tables can be generated on its own (e.g. by a worker process) using `start`.
+
+        ---------------------------
+
+        :param count: The number of tables to generate.
+        :type count: int
+
+        :param seed: The seed shared by all the tables.
+        :type seed: int | str
+
+        :param multiple_char: If set to `True`, it will include the whole english alphabet for the cipher of a letter. Else, only 'a' & 'b', defaults to `False`.
+        :type multiple_char: bool, optional
+
+        :param length: The length of every code, defaults to `5`.
+        :type length: int, optional
+
+        :param start: The index of the first table, defaults to `0`.
+        :type start: int, optional
+
+        ---------------------------
+
+        :return: The lookup tables.
+        :rtype: list[dict]
+        """
+        return [cls.generate_lookup_table(multiple_char, random.Random(f"{seed}:{i}"), length) for i in range(start, start + count)]
+
+    @staticmethod
+    def code_to_string(code: int, char_pool: str, length: int):
+        """
+        Used to write the number of a code in base `len(char_pool)`, using the characters of `char_pool` as digits.
+
+        ---------------------------
+
+        :param code: The number of the code.
+        :type code: int
+
+        :param char_pool: The characters used in the codes.
+        :type char_pool: str
+
+        :param length: The length of the code.
+        :type length: int
+
+        ---------------------------
+
+        :return: The code.
+        :rtype: str
+        """
+        digits = []
+        for _ in range(length):
+            code, digit = divmod(code, len(char_pool))
+            digits.append(char_pool[digit])
+        return "".join(reversed(digits))
 
     def encode(self, plaintext: str):
         """
@@ -76,16 +220,9 @@ class BaconianCipher:
         :rtype: str
         """
         plaintext = plaintext.lower().strip()
+        lookup_table = self.lookup_table
 
-        fstr = ""
-        for char in plaintext:
-            if not char.isalpha():
-                fstr += char
-                continue
-
-            fstr += self.lookup_table[char]
-
-        return fstr
+        return "".join([lookup_table[char] if char.isalpha() else char for char in plaintext])
     
     def decode(self, ciphertext: str):
         """
@@ -100,32 +237,22 @@ class BaconianCipher:
 
         :return: The decoded text.
         :rtype: str
-        """
-        ciphertext = ciphertext.lower().strip()
-
-        plaintext = ""
-        i = 0
-
-        while i < len(ciphertext):
-            sq = ciphertext[i : i + 5]
 
-            if not sq[0].isalpha():
-                for j, letter in enumerate(sq):
-                    if letter.isalpha():
-                        break
-                    plaintext += letter
-                else:
-                    i += 5
-                    continue
-
-                i += j
-                sq = ciphertext[i : i + 5]
+        ---------------------------
 
-            try:
-                plaintext += self.rlookup_table[sq]
-            except Exception:
-                raise BaconianCipherError(f"Unable to decode invalid sequence - '{sq}' ({i})")
-            
-            i += 5
+        :raises BaconianCipherError: Indicates that the `ciphertext` contained an invalid or incomplete code.
+        """
+        ciphertext = ciphertext.lower().strip()
 
-        return plaintext
\ No newline at end of file
+        # A single pass of the prefix tree splits the text into codes and runs of non-letters.
+        # The codes are alphabetic, so a run of non-letters is never mistaken for one and is passed through as is.
+        tokens = self.pattern.findall(ciphertext)
+        if sum(map(len, tokens)) != len(ciphertext):
+            i = 0
+            match = self.pattern.match(ciphertext, i)
+            while match:
+                i = match.end()
+                match = self.pattern.match(ciphertext, i)
+            raise BaconianCipherError(f"Unable to decode invalid sequence - '{ciphertext[i : i + 5]}' ({i})")
+
+        return "".join(map(self.rlookup_table.get, tokens, tokens))
\ No newline at end of file
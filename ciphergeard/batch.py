@@ -0,0 +1,156 @@
+from concurrent.futures import ProcessPoolExecutor
+
+_worker_cipher = None
+
+class BatchError(Exception):
+    pass
+
+def _init_worker(cipher):
+    """
+    Used to store the cipher of a worker process once, when the process starts, instead of sending it along with every chunk.
+
+    ---------------------------
+
+    :param cipher: The cipher to use in this process.
+    :type cipher: BatchMixin
+    """
+    global _worker_cipher
+    _worker_cipher = cipher
+
+def _process_chunk(method: str, messages: list):
+    """
+    Used to encode/decode a chunk of messages with the cipher of the worker process.
+
+    ---------------------------
+
+    :param method: The name of the method to call, `'encode'` or `'decode'`.
+    :type method: str
+
+    :param messages: The messages to process.
+    :type messages: list
+
+    ---------------------------
+
+    :return: The processed messages.
+    :rtype: list
+    """
+    return _apply(getattr(_worker_cipher, method), messages)
+
+def _apply(method, messages: list):
+    """
+    Used to call `method` on every message. A tuple is unpacked into the arguments of `method`.
+
+    ---------------------------
+
+    :param method: The bound method to call.
+    :type method: Callable
+
+    :param messages: The messages to process.
+    :type messages: list
+
+    ---------------------------
+
+    :return: The processed messages.
+    :rtype: list
+    """
+    return [method(*message) if isinstance(message, tuple) else method(message) for message in messages]
+
+class BatchMixin:
+    """
+    Adds :meth:`encode_many` and :meth:`decode_many` to a cipher, to process many (usually short) messages at once.
+
+    Small batches, or batches without `workers`, are processed in the current process, looking up the method only once.
+    Larger batches are split into chunks of `chunk_size` messages and sent to a :class:`concurrent.futures.ProcessPoolExecutor`.
+    The cipher is sent to every worker process once, when the process starts, so only the messages travel with the chunks.
+    Starting the processes takes some time, so the pool only pays off for large batches.
+
+    For ciphers whose `encode`/`decode` take more than the text (e.g. :class:`VernamCipher`), every message is a tuple of the arguments.
+
+    ---------------------------
+
+    **Example**
+    ---------------------------
+    .. code-block:: python
+
+       from ciphergeard.affine import AffineCipher
+
+       cipher = AffineCipher(a=5, b=8)
+
+       ciphertexts = cipher.encode_many(["ATTACK AT DAWN", "RETREAT"], workers=4)
+       # Output: ['izzisg iz xiov', 'pczpciz']
+
+       plaintexts = cipher.decode_many(ciphertexts)
+       # Output: ['attack at dawn', 'retreat']
+    """
+
+    def encode_many(self, messages, workers: int = None, chunk_size: int = 1024):
+        """
+        Used to encode many messages, in order.
+
+        ---------------------------
+
+        :param messages: The messages to encode.
+        :type messages: Iterable
+
+        :param workers: The number of worker processes, defaults to `None` (the current process only).
+        :type workers: int, optional
+
+        :param chunk_size: The number of messages sent to a worker at once, defaults to `1024`.
+        :type chunk_size: int, optional
+
+        ---------------------------
+
+        :return: The encoded messages.
+        :rtype: list
+
+        ---------------------------
+
+        :raises BatchError: Indicates that `workers` or `chunk_size` was not a natural number.
+        """
+        return self.__process("encode", messages, workers, chunk_size)
+
+    def decode_many(self, messages, workers: int = None, chunk_size: int = 1024):
+        """
+        Used to decode many messages, in order.
+
+        ---------------------------
+
+        :param messages: The messages to decode.
+        :type messages: Iterable
+
+        :param workers: The number of worker processes, defaults to `None` (the current process only).
+        :type workers: int, optional
+
+        :param chunk_size: The number of messages sent to a worker at once, defaults to `1024`.
+        :type chunk_size: int, optional
+
+        ---------------------------
+
+        :return: The decoded messages.
+        :rtype: list
+
+        ---------------------------
+
+        :raises BatchError: Indicates that `workers` or `chunk_size` was not a natural number.
+        """
+        return self.__process("decode", messages, workers, chunk_size)
+
+    def __process(self, method: str, messages, workers: int, chunk_size: int):
+        """
+        Internal function to apply `method` to every message, in the current process or in chunks of `chunk_size` messages spread over `workers` processes.
+        """
+        if workers is not None and workers < 1:
+            raise BatchError('`workers` must be a natural number, i.e., > 0.')
+        if chunk_size < 1:
+            raise BatchError('`chunk_size` must be a natural number, i.e., > 0.')
+
+        messages = list(messages)
+        if not workers or workers == 1 or len(messages) <= chunk_size:
+            return _apply(getattr(self, method), messages)
+
+        chunks = [messages[i:i + chunk_size] for i in range(0, len(messages), chunk_size)]
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=_init_worker, initargs=(self,)) as executor:
+            processed = []
+            for chunk in executor.map(_process_chunk, [method] * len(chunks), chunks):
+                processed.extend(chunk)
+        return processed
\ No newline at end of file
@@ -1,16 +1,20 @@
 import string
+from .batch import BatchMixin
 
 class BifidCipherError(Exception):
     pass
 
-class BifidCipher:
-    def __init__(self, keyword: str, filler_char: str = "x") -> None:
+class BifidCipher(BatchMixin):
+    def __init__(self, keyword: str, filler_char: str = "x", period: int = None) -> None:
         """
         The `Bifid Cipher <https://en.wikipedia.org/wiki/Bifid_cipher>`_, a cipher which combines the Polybius square with transposition, and uses fractionation to achieve diffusion. 
         The cipher is not case-sensitive, so both plaintext and encoded text are converted to lowercase during processing.
 
         All odd-length inputs will be suffixed by the specified `filler_char`. `'i'` and `'j'` share a combined position.
 
+        If a `period` is specified, the cipher works as the periodic Bifid: the letters are fractionated in blocks of `period` letters instead of all at once, and no filler is needed.
+        Each block only depends on its own letters, so the text can be streamed using :meth:`stream_encoder` and :meth:`stream_decoder`.
+
         ---------------------------
 
         :param keyword: The keyword to use while encoding.
@@ -19,6 +23,13 @@ class BifidCipher:
         :param filler_char: The filler character to suffix the text when of odd-length, defaults to `'x'`.
         :type filler_char: str
 
+        :param period: The number of letters fractionated together, defaults to `None` (the whole text).
+        :type period: int, optional
+
+        ---------------------------
+
+        :raises BifidCipherError: Indicates an error while initializing.
+
         ---------------------------
 
         **Example**
@@ -42,6 +53,9 @@ class BifidCipher:
         if not self.keyword:
             raise BifidCipherError('Please specify a proper keyword.')
         self.filler = filler_char
+        self.period = period
+        if self.period is not None and self.period <= 0:
+            raise BifidCipherError('`period` must be a natural number, i.e., > 0.')
         self.square = self.generate_polybius_square()
         self.char_map = self.map_chars(self.square)
 
@@ -113,40 +127,21 @@ class BifidCipher:
         :return: The encoded text.
         :rtype: str
         """
-        plaintext: list[str] = list(plaintext.lower().strip().replace('j', 'i'))
-
-        x, y = [], []
-        z = {}
-
-        i, offset = 0, 0
-        while i < len(plaintext):
-            c1, c2 = plaintext[i], (plaintext[i + 1] if i + 1 < len(plaintext) else self.filler)
+        plaintext = plaintext.lower().strip().replace('j', 'i')
 
-            if not c1.isalpha():
-                z.update({i + offset: c1})
-                i += 1
-                continue
+        letters, others = self.separate(plaintext)
+        if self.period:
+            encoded = []
+            for i in range(0, len(letters), self.period):
+                encoded.extend(self.encode_block(letters[i:i + self.period]))
+            return self.merge(encoded, others)
 
-            if not c2.isalpha():
-                z.update({i + offset + 1: c2})
-                plaintext.pop(i + 1)
-                offset += 1
-                continue
+        if len(letters) % 2 == 1:
+            letters.append(self.char_map[self.filler])
 
-            p1, p2 = self.char_map[c1], self.char_map[c2]
-            x.append((p1[0], p2[0]))
-            y.append((p1[1], p2[1]))
+        encoded = self.encode_block(letters)
 
-            i += 2
-
-        encoded = []
-        for ele in x + y:
-            encoded.append(self.square[ele[0]][ele[1]])
-
-        for index, char in z.items():
-            encoded.insert(index, char)
-
-        ciphertext = "".join(encoded)
+        ciphertext = self.merge(encoded, others)
         if len(ciphertext) % 2 == 1 and ciphertext[-1] == self.filler:
             ciphertext = ciphertext[:-1]
 
@@ -166,31 +161,227 @@ class BifidCipher:
         :return: The decoded text.
         :rtype: str
         """
-        ciphertext: list[str] = list(ciphertext.lower().strip())
+        ciphertext = ciphertext.lower().strip()
+
+        if self.period:
+            letters, others = self.separate(ciphertext)
+            decoded = []
+            for i in range(0, len(letters), self.period):
+                decoded.extend(self.decode_block(letters[i:i + self.period]))
+            return self.merge(decoded, others)
 
         if len(ciphertext) % 2 == 1:
             ciphertext += self.filler
 
-        x = []
-        z = {}
-        for i, char in enumerate(ciphertext):
-            if not char.isalpha():
-                z.update({i: char})
-            else:
-                x.append(self.char_map[char])
+        letters, others = self.separate(ciphertext)
 
-        n = int(len(x) // 2)
-        x, y = x[:n], x[n:]
+        n = int(len(letters) // 2)
+        x, y = letters[:n], letters[n:]
 
         decoded = []
         for i in range(0, n):
             decoded.extend([self.square[x[i][0]][y[i][0]], self.square[x[i][1]][y[i][1]]])
 
-        for index, char in z.items():
-            decoded.insert(index, char)
-
-        plaintext = "".join(decoded)
+        plaintext = self.merge(decoded, others)
         if len(plaintext) % 2 == 1 and plaintext[-1] == self.filler:
             plaintext = plaintext[:-1]
 
-        return plaintext
\ No newline at end of file
+        return plaintext
+
+    def encode_block(self, letters: list[tuple]):
+        """
+        Used to fractionate a block of letters: their rows followed by their columns are read out again in pairs.
+
+        ---------------------------
+
+        :param letters: The positions of the letters in the square.
+        :type letters: list[tuple]
+
+        ---------------------------
+
+        :return: The encoded letters.
+        :rtype: list[str]
+        """
+        coords = [p[0] for p in letters] + [p[1] for p in letters]
+        return [self.square[coords[i]][coords[i + 1]] for i in range(0, len(coords) - 1, 2)]
+
+    def decode_block(self, letters: list[tuple]):
+        """
+        Used to reverse :meth:`encode_block` for a block of letters.
+
+        ---------------------------
+
+        :param letters: The positions of the encoded letters in the square.
+        :type letters: list[tuple]
+
+        ---------------------------
+
+        :return: The decoded letters.
+        :rtype: list[str]
+        """
+        coords = [i for p in letters for i in p]
+        n = len(letters)
+        return [self.square[coords[i]][coords[n + i]] for i in range(n)]
+
+    def stream_encoder(self):
+        """
+        Used to create an incremental encoder, which emits every block as soon as its last letter arrives.
+
+        ---------------------------
+
+        :return: The encoder.
+        :rtype: BifidStream
+
+        ---------------------------
+
+        :raises BifidCipherError: Indicates that no `period` was specified.
+        """
+        if not self.period:
+            raise BifidCipherError('A `period` must be specified to stream.')
+        return BifidStream(cipher=self, decode=False)
+
+    def stream_decoder(self):
+        """
+        Used to create an incremental decoder, which emits every block as soon as its last letter arrives.
+
+        ---------------------------
+
+        :return: The decoder.
+        :rtype: BifidStream
+
+        ---------------------------
+
+        :raises BifidCipherError: Indicates that no `period` was specified.
+        """
+        if not self.period:
+            raise BifidCipherError('A `period` must be specified to stream.')
+        return BifidStream(cipher=self, decode=True)
+
+    def separate(self, text: str):
+        """
+        Used to separate the English characters of `text` from the rest in a single pass.
+
+        ---------------------------
+
+        :param text: The text to separate.
+        :type text: str
+
+        ---------------------------
+
+        :return: The positions of the English characters in the square, and the index and value of every other character.
+        :rtype: tuple[list[tuple], list[tuple]]
+        """
+        letters, others = [], []
+        for i, char in enumerate(text):
+            if char.isalpha():
+                letters.append(self.char_map[char])
+            else:
+                others.append((i, char))
+        return letters, others
+
+    def merge(self, letters: list[str], others: list[tuple]):
+        """
+        Used to put the non-English characters back at their original index between the `letters`, in a single pass.
+        A character whose index lies past the end of the text is appended at the end instead.
+
+        ---------------------------
+
+        :param letters: The processed English characters.
+        :type letters: list[str]
+
+        :param others: The index and value of every other character, in order.
+        :type others: list[tuple]
+
+        ---------------------------
+
+        :return: The merged text.
+        :rtype: str
+        """
+        merged = []
+        taken = 0
+        for k, (index, char) in enumerate(others):
+            end = min(index - k, len(letters))
+            merged.extend(letters[taken:end])
+            merged.append(char)
+            taken = end
+        merged.extend(letters[taken:])
+        return "".join(merged)
+
+class BifidStream:
+    def __init__(self, cipher: BifidCipher, decode: bool = False) -> None:
+        """
+        An incremental encoder/decoder for the periodic :class:`BifidCipher`, usually created by :meth:`BifidCipher.stream_encoder` or :meth:`BifidCipher.stream_decoder`.
+        Only the text since the last completed block is kept, so the memory used depends on the `period` instead of the size of the text.
+
+        Unlike :meth:`BifidCipher.encode`, the chunks are not stripped. The joined output matches a one-shot `encode`/`decode` of the joined input as long as it has no leading or trailing whitespace.
+
+        ---------------------------
+
+        :param cipher: The periodic cipher to use.
+        :type cipher: BifidCipher
+
+        :param decode: Indicates whether to decode instead of encode, defaults to `False`.
+        :type decode: bool, optional
+
+        ---------------------------
+
+        **Example**
+        ---------------------------
+        .. code-block:: python
+
+           from ciphergeard.bifid import BifidCipher
+
+           cipher = BifidCipher(keyword="SECRET", period=5)
+           encoder = cipher.stream_encoder()
+
+           with open("plain.txt") as src, open("encoded.txt", "w") as dst:
+               for chunk in iter(lambda: src.read(65536), ""):
+                   dst.write(encoder.process(chunk))
+               dst.write(encoder.flush())
+        """
+        self.cipher = cipher
+        self.decode = decode
+        self.pending = []
+        self.letters = []
+
+    def process(self, chunk: str):
+        """
+        Used to encode/decode the next `chunk` of text.
+
+        ---------------------------
+
+        :param chunk: The next chunk of text.
+        :type chunk: str
+
+        ---------------------------
+
+        :return: The text of every block completed by this chunk.
+        :rtype: str
+        """
+        chunk = chunk.lower() if self.decode else chunk.lower().replace('j', 'i')
+
+        processed = []
+        for char in chunk:
+            self.pending.append(char)
+            if char.isalpha():
+                self.letters.append(self.cipher.char_map[char])
+                if len(self.letters) == self.cipher.period:
+                    processed.append(self.flush())
+
+        return "".join(processed)
+
+    def flush(self):
+        """
+        Used to encode/decode the pending text, even if its block is incomplete. It should be called once after the last chunk.
+
+        ---------------------------
+
+        :return: The processed pending text.
+        :rtype: str
+        """
+        block = self.cipher.decode_block(self.letters) if self.decode else self.cipher.encode_block(self.letters)
+        block = iter(block)
+
+        processed = "".join(next(block) if char.isalpha() else char for char in self.pending)
+        self.pending, self.letters = [], []
+        return processed
\ No newline at end of file
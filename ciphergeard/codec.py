@@ -0,0 +1,283 @@
+"""
+Integration of the ciphers with the :mod:`codecs` machinery, so that `open`, :func:`codecs.open`, `str.encode`, `bytes.decode` and sockets wrapped in text streams can cipher on the fly.
+
+Once :func:`register` is called, the following encodings are available (`-` and `_` are interchangeable and the names are not case-sensitive):
+
+- `cg-rot13`
+- `cg-atbash`
+- `cg-caesar-<offset>`, e.g. `cg-caesar-3`
+- `cg-affine-<a>-<b>`, e.g. `cg-affine-5-8`
+- `cg-vigenere-<keyword>`, e.g. `cg-vigenere-secret`
+- `cg-beaufort-<keyword>`
+- `cg-gronsfeld-<key>`, e.g. `cg-gronsfeld-69421`
+
+Encoding turns text into the UTF-8 bytes of its ciphertext, and decoding turns such bytes back into text.
+ROT13, Caesar, Affine and Atbash do not depend on the position in the text: they work on the bytes through their `encode_chunk`/`decode_chunk` methods.
+The Vigenère family works on the text through a :class:`VigenereStream`, so that, like :meth:`VigenereCipher.encode`, its key advances on every character rather than on every byte of its UTF-8 encoding.
+Either way, the memory used does not depend on the size of the text, and the incremental encoders/decoders only carry the position in the key between calls.
+ROT13, Caesar and Affine keep the case of the letters; Atbash and the Vigenère family lowercase them, like their classes. Only the ASCII letters are ciphered.
+
+Unlike the `encode`/`decode` of the classes, the text is not stripped. A file is ciphered from its beginning: appending to an existing file with a Vigenère encoding restarts the key.
+
+**Example**
+---------------------------
+.. code-block:: python
+
+   from ciphergeard import codec
+
+   codec.register()
+
+   with open("encoded.txt", "w", encoding="cg-vigenere-secret") as file:
+       file.write("ATTACK AT DAWN")
+
+   with open("encoded.txt", encoding="cg-vigenere-secret") as file:
+       plaintext = file.read()
+       # Output: attack at dawn
+"""
+
+import codecs
+
+from .affine import AffineCipher, AffineCipherError
+from .atbash import AtbashCipher
+from .caesar import CaesarCipher
+from .rot13 import ROT13Cipher
+from .vigenere import VigenereCipher, VigenereCipherError
+from .vigenere.beaufort import BeaufortVariant
+from .vigenere.gronsfeld import GronsfeldVariant, GronsfeldVariantError
+
+PREFIX = "cg_"
+"""The prefix of the (normalized) names of the encodings."""
+
+CIPHERS = {
+    "rot13": lambda: ROT13Cipher(case_sensitive=True),
+    "atbash": lambda: AtbashCipher(),
+    "caesar": lambda offset: CaesarCipher(offset=int(offset), case_sensitive=True),
+    "affine": lambda a, b: AffineCipher(a=int(a), b=int(b), case_sensitive=True),
+    "vigenere": lambda keyword: VigenereCipher(keyword=keyword),
+    "beaufort": lambda keyword: BeaufortVariant(keyword=keyword),
+    "gronsfeld": lambda key: GronsfeldVariant(key=int(key)),
+}
+"""The cipher of every encoding, built from the parts of the name following the cipher's."""
+
+def key_stream(cipher, direction: int):
+    """
+    Used to create the stream keeping the position in the key of a cipher of the Vigenère family, by characters.
+
+    ---------------------------
+
+    :param cipher: The cipher.
+    :type cipher: AffineCipher | AtbashCipher | VigenereCipher
+
+    :param direction: `1` to encode, `-1` to decode.
+    :type direction: int
+
+    ---------------------------
+
+    :return: The stream, or `None` if the cipher does not depend on the position in the text.
+    :rtype: VigenereStream | None
+    """
+    if not isinstance(cipher, VigenereCipher):
+        return None
+    return cipher.stream_encoder() if direction > 0 else cipher.stream_decoder()
+
+class CipherIncrementalEncoder(codecs.IncrementalEncoder):
+    cipher = None
+
+    def __init__(self, errors: str = "strict") -> None:
+        """
+        An incremental encoder for the cipher in `cipher`, which is set by the subclass created for every encoding.
+
+        ---------------------------
+
+        :param errors: The error handling scheme of the UTF-8 encoding, defaults to `'strict'`.
+        :type errors: str, optional
+        """
+        super().__init__(errors)
+        self.stream = key_stream(self.cipher, 1)
+
+    def encode(self, input: str, final: bool = False):
+        if self.stream is not None:
+            return self.stream.process(input).encode("utf-8", self.errors)
+        return self.cipher.encode_chunk(input.encode("utf-8", self.errors))
+
+    def reset(self):
+        if self.stream is not None:
+            self.stream.reset()
+
+class CipherIncrementalDecoder(codecs.IncrementalDecoder):
+    cipher = None
+
+    def __init__(self, errors: str = "strict") -> None:
+        """
+        An incremental decoder for the cipher in `cipher`, which is set by the subclass created for every encoding.
+        A UTF-8 character split between two inputs is kept until it is complete, and raises with `final` (under `'strict'`) if it is never completed.
+
+        ---------------------------
+
+        :param errors: The error handling scheme of the UTF-8 decoding, defaults to `'strict'`.
+        :type errors: str, optional
+        """
+        super().__init__(errors)
+        self.stream = key_stream(self.cipher, -1)
+        self.utf8 = codecs.getincrementaldecoder("utf-8")(errors)
+
+    def decode(self, input: bytes, final: bool = False):
+        if self.stream is not None:
+            return self.stream.process(self.utf8.decode(bytes(input), final))
+        return self.utf8.decode(self.cipher.decode_chunk(bytes(input)), final)
+
+    def reset(self):
+        self.utf8.reset()
+        if self.stream is not None:
+            self.stream.reset()
+
+    def getstate(self):
+        # The pending bytes are the start of a non-ASCII character, which no cipher changes; the flag is the position in the key.
+        buffered, _ = self.utf8.getstate()
+        return buffered, self.stream.offset if self.stream is not None else 0
+
+    def setstate(self, state: tuple[bytes, int]):
+        buffered, offset = state
+        self.utf8.setstate((buffered, 0))
+        if self.stream is not None:
+            self.stream.offset = offset
+
+class CipherStreamWriter(codecs.StreamWriter):
+    incremental_encoder = None
+
+    def __init__(self, stream, errors: str = "strict") -> None:
+        """
+        A stream writer for the cipher of `incremental_encoder`, which is set by the subclass created for every encoding.
+
+        ---------------------------
+
+        :param stream: The binary stream to write to.
+        :type stream: BinaryIO
+
+        :param errors: The error handling scheme of the UTF-8 encoding, defaults to `'strict'`.
+        :type errors: str, optional
+        """
+        super().__init__(stream, errors)
+        self.encoder = self.incremental_encoder(errors)
+
+    def encode(self, input: str, errors: str = "strict"):
+        return self.encoder.encode(input), len(input)
+
+    def reset(self):
+        super().reset()
+        self.encoder.reset()
+
+class CipherStreamReader(codecs.StreamReader):
+    incremental_decoder = None
+
+    def __init__(self, stream, errors: str = "strict") -> None:
+        """
+        A stream reader for the cipher of `incremental_decoder`, which is set by the subclass created for every encoding.
+
+        ---------------------------
+
+        :param stream: The binary stream to read from.
+        :type stream: BinaryIO
+
+        :param errors: The error handling scheme of the UTF-8 decoding, defaults to `'strict'`.
+        :type errors: str, optional
+        """
+        super().__init__(stream, errors)
+        self.decoder = self.incremental_decoder(errors)
+        self.pending = b""
+
+    def decode(self, input: bytes, errors: str = "strict"):
+        # The bytes of an incomplete character are left to the buffer of the reader, which only passes them back alone once the stream is exhausted:
+        # the decoder is then flushed, so that a truncated character raises like with a text stream.
+        final = bool(input) and input == self.pending
+        text = self.decoder.decode(input, final)
+        self.pending, offset = self.decoder.getstate()
+        self.decoder.setstate((b"", offset))
+        return text, len(input) - len(self.pending)
+
+    def reset(self):
+        super().reset()
+        self.decoder.reset()
+        self.pending = b""
+
+def codec_info(name: str, cipher):
+    """
+    Used to create the :class:`codecs.CodecInfo` of an encoding, with its own subclasses of the incremental encoder/decoder and stream writer/reader.
+
+    ---------------------------
+
+    :param name: The name of the encoding.
+    :type name: str
+
+    :param cipher: The cipher, which must implement `encode_chunk` and `decode_chunk`.
+    :type cipher: AffineCipher | AtbashCipher | VigenereCipher
+
+    ---------------------------
+
+    :return: The codec info.
+    :rtype: codecs.CodecInfo
+    """
+    encoder = type("IncrementalEncoder", (CipherIncrementalEncoder,), {"cipher": cipher})
+    decoder = type("IncrementalDecoder", (CipherIncrementalDecoder,), {"cipher": cipher})
+
+    def encode(input: str, errors: str = "strict"):
+        return encoder(errors).encode(input, final=True), len(input)
+
+    def decode(input: bytes, errors: str = "strict"):
+        return decoder(errors).decode(input, final=True), len(input)
+
+    return codecs.CodecInfo(
+        name=name,
+        encode=encode,
+        decode=decode,
+        incrementalencoder=encoder,
+        incrementaldecoder=decoder,
+        streamwriter=type("StreamWriter", (CipherStreamWriter,), {"incremental_encoder": encoder}),
+        streamreader=type("StreamReader", (CipherStreamReader,), {"incremental_decoder": decoder}),
+    )
+
+def search(name: str):
+    """
+    Used by :func:`codecs.lookup` to find the encodings of this module.
+
+    ---------------------------
+
+    :param name: The normalized name of the encoding, e.g. `'cg_affine_5_8'`.
+    :type name: str
+
+    ---------------------------
+
+    :return: The codec info, or `None` if the name is not one of these encodings.
+    :rtype: codecs.CodecInfo | None
+
+    ---------------------------
+
+    :raises LookupError: Indicates that the key in the name was not valid for the cipher.
+    """
+    if not name.startswith(PREFIX):
+        return None
+
+    cipher_name, *key = name[len(PREFIX):].split("_")
+    factory = CIPHERS.get(cipher_name)
+    if factory is None:
+        return None
+
+    try:
+        cipher = factory(*key)
+    except (TypeError, ValueError, AffineCipherError, VigenereCipherError, GronsfeldVariantError) as error:
+        raise LookupError(f"Invalid key for the encoding '{name}'.") from error
+
+    return codec_info(name.replace("_", "-"), cipher)
+
+def register():
+    """
+    Used to register the encodings of this module with :func:`codecs.register`. Registering more than once has no effect.
+    """
+    codecs.unregister(search)
+    codecs.register(search)
+
+def unregister():
+    """
+    Used to remove the encodings of this module with :func:`codecs.unregister`.
+    """
+    codecs.unregister(search)
\ No newline at end of file
@@ -1,17 +1,109 @@
+import functools
+from array import array
+from .batch import BatchMixin
+
 class ColumnarTranspositionCipherError(Exception):
     pass
 
-class ColumnarTranspositionCipher:
-    def __init__(self, keyword: str) -> None:
+MAX_CACHED_LENGTH = 1 << 16
+"""The length of the longest text whose permutations are cached. They take 8 bytes per character, so the permutations of longer texts are computed again rather than kept in memory."""
+
+def column_permutation(keyword: str, length: int):
+    """
+    Used to compute the order in which the columnar transposition reads the characters of a text of `length` characters, and its inverse.
+    The text is written in rows of `len(keyword)` characters, and the columns are read in the alphabetical order of the keyword. If the last row is incomplete, only its leftmost columns are read.
+    The last few results are cached for texts of up to :data:`MAX_CACHED_LENGTH` characters, so texts of the same length skip the computation.
+
+    ---------------------------
+
+    :param keyword: The keyword.
+    :type keyword: str
+
+    :param length: The length of the text.
+    :type length: int
+
+    ---------------------------
+
+    :return: The index of the character read at every position of the encoded text, and the position in the encoded text of every character.
+    :rtype: tuple[array, array]
+    """
+    if length > MAX_CACHED_LENGTH:
+        return _column_permutation(keyword, length)
+    return _cached_column_permutation(keyword, length)
+
+def _column_permutation(keyword: str, length: int):
+    """
+    Internal function to compute the permutations of :func:`column_permutation`.
+    """
+    typecode = "I" if length < 2 ** 32 else "Q"
+    num_cols = len(keyword)
+
+    permutation, inverse = array(typecode), array(typecode, bytes(array(typecode).itemsize * length))
+    for col_index in sorted(range(num_cols), key=lambda x: keyword[x]):
+        column = range(col_index, length, num_cols)
+        inverse[col_index::num_cols] = array(typecode, range(len(permutation), len(permutation) + len(column)))
+        permutation.extend(column)
+
+    return permutation, inverse
+
+_cached_column_permutation = functools.lru_cache(maxsize=16)(_column_permutation)
+
+def double_column_permutation(keyword: str, second_keyword: str, length: int):
+    """
+    Used to fuse the permutations of two successive columnar transpositions of a text of `length` characters into one, so that the text only has to be gathered once.
+    Like :func:`column_permutation`, the last few results are cached for texts of up to :data:`MAX_CACHED_LENGTH` characters.
+
+    ---------------------------
+
+    :param keyword: The keyword of the first transposition.
+    :type keyword: str
+
+    :param second_keyword: The keyword of the second transposition.
+    :type second_keyword: str
+
+    :param length: The length of the text.
+    :type length: int
+
+    ---------------------------
+
+    :return: The fused permutation and its inverse, in the same form as :func:`column_permutation`.
+    :rtype: tuple[array, array]
+    """
+    if length > MAX_CACHED_LENGTH:
+        return _double_column_permutation(keyword, second_keyword, length)
+    return _cached_double_column_permutation(keyword, second_keyword, length)
+
+def _double_column_permutation(keyword: str, second_keyword: str, length: int):
+    """
+    Internal function to compute the permutations of :func:`double_column_permutation`.
+    """
+    first, first_inverse = column_permutation(keyword, length)
+    second, second_inverse = column_permutation(second_keyword, length)
+    return array(first.typecode, map(first.__getitem__, second)), array(first.typecode, map(second_inverse.__getitem__, first_inverse))
+
+_cached_double_column_permutation = functools.lru_cache(maxsize=16)(_double_column_permutation)
+
+class ColumnarTranspositionCipher(BatchMixin):
+    def __init__(self, keyword: str, second_keyword: str = None) -> None:
         """
         The `Columnar Transposition Cipher <https://en.wikipedia.org/wiki/Transposition_cipher#Columnar_transposition>`_ in which the message is written out in rows of a fixed length, and then read out again column by column.
         The cipher is case-sensitive and can process uppercase and lowercase characters separately.
 
+        If a `second_keyword` is specified, the cipher works as a double transposition: the encoded text is transposed again using the second keyword.
+        Both transpositions are fused into a single permutation, so the text is still only traversed once.
+
         ---------------------------
 
         :param keyword: The keyword to use while encoding.
         :type keyword: str
 
+        :param second_keyword: The keyword of the second transposition, defaults to `None`.
+        :type second_keyword: str, optional
+
+        ---------------------------
+
+        :raises ColumnarTranspositionCipherError: Indicates an error while initializing.
+
         ---------------------------
 
         **Example**
@@ -34,10 +126,14 @@ class ColumnarTranspositionCipher:
         self.keyword = keyword.strip()
         if not self.keyword:
             raise ColumnarTranspositionCipherError('Please specify a proper keyword.')
+        self.second_keyword = second_keyword.strip() if second_keyword is not None else None
+        if self.second_keyword == "":
+            raise ColumnarTranspositionCipherError('Please specify a proper second keyword.')
 
     def encode(self, plaintext: str):
         """
         Used to encode the `plaintext`.
+        The last row is padded with spaces, so that every column has the same length.
 
         ---------------------------
 
@@ -50,25 +146,10 @@ class ColumnarTranspositionCipher:
         :rtype: str
         """
         plaintext = plaintext.strip()
+        plaintext += ' ' * (-len(plaintext) % len(self.keyword))
 
-        num_cols = len(self.keyword)
-        num_rows = -(-len(plaintext) // num_cols)
-        
-        grid = ['' for _ in range(num_rows)]
-        
-        for i, char in enumerate(plaintext):
-            row = i // num_cols
-            grid[row] += char
-        
-        if len(grid[-1]) < num_cols:
-            grid[-1] += ' ' * (num_cols - len(grid[-1]))
-        
-        ciphertext = ''
-        for col_index in sorted(range(num_cols), key=lambda x: self.keyword[x]):
-            for row in grid:
-                ciphertext += row[col_index]
-        
-        return ciphertext
+        permutation, _ = self.permutation(len(plaintext))
+        return ''.join(map(plaintext.__getitem__, permutation))
     
     def decode(self, ciphertext: str):
         """
@@ -84,31 +165,23 @@ class ColumnarTranspositionCipher:
         :return: The decoded text.
         :rtype: str
         """
-        num_cols = len(self.keyword)
-        num_rows = -(-len(ciphertext) // num_cols)
-
-        col_order = sorted(range(num_cols), key=lambda x: self.keyword[x])
-
-        num_full_cols = len(ciphertext) % num_cols
-        num_full_rows = len(ciphertext) // num_cols
-
-        col_lengths = [num_full_rows + 1 if i < num_full_cols else num_full_rows for i in range(num_cols)]
+        _, inverse = self.permutation(len(ciphertext))
+        return ''.join(map(ciphertext.__getitem__, inverse)).rstrip()
 
-        col_texts = []
-        start = 0
-        for length in col_lengths:
-            col_texts.append(ciphertext[start:start + length])
-            start += length
+    def permutation(self, length: int):
+        """
+        Used to get the (cached) permutation of this cipher for a text of `length` characters.
 
-        grid = ['' for _ in range(num_rows)]
+        ---------------------------
 
-        for col_index, text in zip(col_order, col_texts):
-            for row_index, char in enumerate(text):
-                if len(grid[row_index]) < num_cols:
-                    grid[row_index] += ' ' * (num_cols - len(grid[row_index]))
-                grid[row_index] = grid[row_index][:col_index] + char + grid[row_index][col_index + 1:]
+        :param length: The length of the text.
+        :type length: int
 
-        plaintext = ''.join(grid).rstrip()
+        ---------------------------
 
-        return plaintext
-        
\ No newline at end of file
+        :return: The permutation and its inverse.
+        :rtype: tuple[array, array]
+        """
+        if self.second_keyword:
+            return double_column_permutation(self.keyword, self.second_keyword, length)
+        return column_permutation(self.keyword, length)
\ No newline at end of file
@@ -1,4 +1,14 @@
-class MorseCode:
+import heapq
+import math
+from operator import itemgetter
+
+from .batch import BatchMixin
+from .frequency import ENGLISH_LETTER_FREQUENCIES
+
+class MorseCodeError(Exception):
+    pass
+
+class MorseCode(BatchMixin):
     def __init__(self) -> None:
         """
         `Morse code <https://en.wikipedia.org/wiki/Morse_code>`_ is a method used in telecommunication to encode text characters as standardized sequences of two different signal durations, called dots and dashes.
@@ -22,10 +32,30 @@ class MorseCode:
         """
         self.char_map = {'a': '.-', 'b': '-...', 'c': '-.-.', 'd': '-..', 'e': '.', 'f': '..-.', 'g': '--.', 'h': '....', 'i': '..', 'j': '.---', 'k': '-.-', 'l': '.-..', 'm': '--', 'n': '-.', 'o': '---', 'p': '.--.', 'q': '--.-', 'r': '.-.', 's': '...', 't': '-', 'u': '..-', 'v': '...-', 'w': '.--', '*': '-..-', 'y': '-.--', 'z': '--..', '1': '.----', '2': '..---', '3': '...--', '4': '....-', '5': '.....', '6': '-....', '7': '--...', '8': '---..', '9': '----.', '0': '-----', ',': '--..--', '?': '..--..', ':': '---...', '-': '-....-', '"': '.-..-.', '(': '-.--.', ')': '-.--.-', '=': '-...-', '.': '.-.-.-', ';': '-.-.-.', '/': '-..-.', "'": '.----.', '_': '..--.-', '+': '.-.-.', '@': '.--.-.'}
         self.rchar_map = {v: k for k, v in self.char_map.items()}
+        self.trie = self.build_trie()
+
+    def build_trie(self):
+        """
+        Used to build a prefix tree of the symbols in `self.char_map`.
+        Every node is a dict mapping `'.'` and `'-'` to the next node, and `''` to the character whose symbol ends there.
+
+        ---------------------------
+
+        :return: The root of the prefix tree.
+        :rtype: dict
+        """
+        trie = {}
+        for char, symbol in self.char_map.items():
+            node = trie
+            for signal in symbol:
+                node = node.setdefault(signal, {})
+            node[''] = char
+        return trie
 
     def encode(self, plaintext: str):
         """
         Used to encode the `plaintext`.
+        The symbols of a word are separated by a space, and every space between the words becomes two spaces.
 
         ---------------------------
 
@@ -37,16 +67,10 @@ class MorseCode:
         :return: The encoded text.
         :rtype: str
         """
-        plaintext = plaintext.lower().strip()
+        words = plaintext.lower().strip().split(" ")
+        char_map = self.char_map
 
-        ciphertext = ""
-        for char in plaintext:
-            if char == " ":
-                ciphertext += "  "
-                continue
-            ciphertext += (" " if not ciphertext.endswith(' ') else "") + self.char_map.get(char, char)
-
-        return ciphertext.strip()
+        return "  ".join([" ".join([char_map.get(char, char) for char in word]) for word in words]).strip()
     
     def decode(self, ciphertext: str):
         """
@@ -62,13 +86,184 @@ class MorseCode:
         :return: The decoded text.
         :rtype: str
         """
-        ciphertext = ciphertext.lower().strip()
+        return self.decode_symbols(ciphertext.lower().strip().split(' ')).strip()
+
+    def decode_symbols(self, symbols: list[str]):
+        """
+        Used to decode a list of symbols. An empty symbol (between two consecutive spaces) is decoded as a space.
+
+        ---------------------------
+
+        :param symbols: The symbols to decode.
+        :type symbols: list[str]
+
+        ---------------------------
+
+        :return: The decoded text.
+        :rtype: str
+        """
+        rchar_map = self.rchar_map
+        return "".join([rchar_map.get(symbol, symbol) if symbol else " " for symbol in symbols])
+
+    def decode_unspaced(self, ciphertext: str, top_k: int = 1, frequencies: dict[str, float] = None):
+        """
+        Used to decode a `ciphertext` whose symbols are not separated, by ranking its possible readings.
+
+        Every reading is scored as the sum of the log-frequencies of its characters. The best `top_k` readings of every suffix of the text are memoized,
+        from the end to the start, so the cost grows linearly with the length of the text instead of the (exponential) number of readings.
+
+        ---------------------------
+
+        :param ciphertext: The dots and dashes to decode. Any whitespace is ignored.
+        :type ciphertext: str
+
+        :param top_k: The number of readings to return, defaults to `1`.
+        :type top_k: int, optional
+
+        :param frequencies: The relative frequency of the characters, defaults to the English letter frequencies. Characters without a positive frequency get a small penalty.
+        :type frequencies: dict[str, float], optional
+
+        ---------------------------
+
+        :return: The best readings and their scores, best first. Empty if the text cannot be read.
+        :rtype: list[tuple[str, float]]
+
+        ---------------------------
+
+        :raises MorseCodeError: Indicates that the `ciphertext` contained something other than dots and dashes, or that no frequency was positive.
+
+        ---------------------------
+
+        **Example**
+        ---------------------------
+        .. code-block:: python
+
+           from ciphergeard.morse import MorseCode
+
+           cipher = MorseCode()
+
+           readings = cipher.decode_unspaced(ciphertext="......-...-..---", top_k=3)
+           # Output: [(text, score), ...] for the three most likely readings
+        """
+        symbols = "".join(ciphertext.split())
+        if symbols.strip('.-'):
+            raise MorseCodeError(f"Expected only dots and dashes. Found: {set(symbols) - {'.', '-'}}")
+
+        frequencies = frequencies or ENGLISH_LETTER_FREQUENCIES
+        positive = [frequency for frequency in frequencies.values() if frequency > 0]
+        if not positive:
+            raise MorseCodeError('Expected at least one positive frequency.')
+        total = sum(positive)
+        penalty = math.log(min(positive) / total) - math.log(100)
+        scores = {char: math.log(frequencies[char] / total) if frequencies.get(char, 0) > 0 else penalty for char in self.char_map}
+
+        # best[i] holds the top readings of symbols[i:] as (score, char, next position, rank in best[next position]).
+        n = len(symbols)
+        best = [[] for _ in range(n)] + [[(0.0, None, n, 0)]]
+
+        for i in range(n - 1, -1, -1):
+            candidates = []
+            node = self.trie
+            for j in range(i, n):
+                node = node.get(symbols[j])
+                if node is None:
+                    break
+                if '' in node:
+                    char = node['']
+                    candidates.extend((entry[0] + scores[char], char, j + 1, rank) for rank, entry in enumerate(best[j + 1]))
+            best[i] = heapq.nlargest(top_k, candidates, key=itemgetter(0))
+
+        readings = []
+        for entry in best[0]:
+            score, chars = entry[0], []
+            while entry[1] is not None:
+                chars.append(entry[1])
+                entry = best[entry[2]][entry[3]]
+            readings.append(("".join(chars), score))
+
+        return readings
+
+    def stream_decoder(self):
+        """
+        Used to create an incremental decoder, which decodes every symbol as soon as the space after it arrives.
+
+        ---------------------------
+
+        :return: The decoder.
+        :rtype: MorseStream
+        """
+        return MorseStream(cipher=self)
+
+    def decode_stream(self, source, chunk_size: int = 65536):
+        """
+        Used to decode the encoded text read from `source` incrementally, for eg. an opened file or `socket.makefile()`.
+
+        ---------------------------
+
+        :param source: The file-like object to read the encoded text from.
+        :type source: TextIO
+
+        :param chunk_size: The number of characters to read at a time, defaults to `65536`.
+        :type chunk_size: int, optional
+
+        ---------------------------
+
+        :return: The decoded text, chunk by chunk.
+        :rtype: Generator[str]
+        """
+        decoder = self.stream_decoder()
+        for chunk in iter(lambda: source.read(chunk_size), ""):
+            decoded = decoder.process(chunk)
+            if decoded:
+                yield decoded
+
+        decoded = decoder.flush()
+        if decoded:
+            yield decoded
+
+
+class MorseStream:
+    def __init__(self, cipher: MorseCode) -> None:
+        """
+        An incremental decoder for :class:`MorseCode`, usually created by :meth:`MorseCode.stream_decoder`.
+        A symbol cut by the end of a chunk is carried over to the next one.
+
+        Unlike :meth:`MorseCode.decode`, the chunks are not stripped. The joined output matches a one-shot `decode` of the joined input as long as it has no leading or trailing whitespace.
+
+        ---------------------------
+
+        :param cipher: The Morse code to use.
+        :type cipher: MorseCode
+        """
+        self.cipher = cipher
+        self.pending = ""
+
+    def process(self, chunk: str):
+        """
+        Used to decode the next `chunk` of encoded text.
+
+        ---------------------------
+
+        :param chunk: The next chunk of encoded text.
+        :type chunk: str
+
+        ---------------------------
+
+        :return: The decoded text of every symbol completed by this chunk.
+        :rtype: str
+        """
+        symbols = (self.pending + chunk.lower()).split(' ')
+        self.pending = symbols.pop()
+        return self.cipher.decode_symbols(symbols)
 
-        plaintext = ""
-        for char in ciphertext.split(' '):
-            if char == "":
-                plaintext += " "
-                continue
-            plaintext += self.rchar_map.get(char, char)
+    def flush(self):
+        """
+        Used to decode the pending symbol. It should be called once after the last chunk.
+
+        ---------------------------
 
-        return plaintext.strip()
\ No newline at end of file
+        :return: The decoded pending symbol.
+        :rtype: str
+        """
+        symbols, self.pending = [self.pending] if self.pending else [], ""
+        return self.cipher.decode_symbols(symbols)
\ No newline at end of file
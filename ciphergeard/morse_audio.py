@@ -0,0 +1,261 @@
+import wave
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .morse import MorseCode
+
+class MorseAudioError(Exception):
+    pass
+
+class MorseAudio:
+    def __init__(self, wpm: float = 20, frequency: float = 600, sample_rate: int = 8000) -> None:
+        """
+        Renders the output of :class:`MorseCode` to audio, and decodes audio back to text. It requires `NumPy <https://numpy.org>`_.
+
+        The standard timing is used: a dot lasts one unit (`1.2 / wpm` seconds), a dash three units, the gap inside a symbol one unit, the gap between symbols three units and the gap between words seven units.
+
+        The waveform is built by concatenating precomputed tone and silence blocks, and decoded with a moving-average envelope and the lengths of its on/off runs, so long recordings are processed in a few vectorized passes.
+
+        ---------------------------
+
+        :param wpm: The speed in words per minute, defaults to `20`.
+        :type wpm: float, optional
+
+        :param frequency: The frequency of the tone in Hz, defaults to `600`.
+        :type frequency: float, optional
+
+        :param sample_rate: The number of samples per second, defaults to `8000`.
+        :type sample_rate: int, optional
+
+        ---------------------------
+
+        :raises MorseAudioError: Indicates that NumPy is not installed.
+
+        ---------------------------
+
+        **Example**
+        ---------------------------
+        .. code-block:: python
+
+           from ciphergeard.morse_audio import MorseAudio
+
+           audio = MorseAudio(wpm=20, frequency=600, sample_rate=8000)
+
+           signal = audio.encode(plaintext="ATTACK AT DAWN")
+           audio.write_wav("attack.wav", signal)
+
+           plaintext = audio.decode_wav("attack.wav")
+           # Output: attack at dawn
+        """
+        if numpy is None:
+            raise MorseAudioError('NumPy is required for Morse audio. It can be installed using `pip install numpy`.')
+
+        self.wpm = wpm
+        self.frequency = frequency
+        self.sample_rate = sample_rate
+        self.cipher = MorseCode()
+
+        self.unit = max(1, round(1.2 / wpm * sample_rate))
+        tone = numpy.sin(2 * numpy.pi * frequency * numpy.arange(3 * self.unit) / sample_rate).astype(numpy.float32)
+        silence = numpy.zeros(7 * self.unit, dtype=numpy.float32)
+        self.blocks = {'.': tone[:self.unit], '-': tone, 'signal_gap': silence[:self.unit], 'symbol_gap': silence[:3 * self.unit], 'word_gap': silence[:4 * self.unit]}
+        self.symbol_cache = {}
+
+    def encode(self, plaintext: str):
+        """
+        Used to encode the `plaintext` to audio.
+
+        ---------------------------
+
+        :param plaintext: The plaintext to encode.
+        :type plaintext: str
+
+        ---------------------------
+
+        :return: The waveform, with samples between -1 and 1.
+        :rtype: numpy.ndarray
+        """
+        return self.synthesize(self.cipher.encode(plaintext=plaintext))
+
+    def decode(self, signal, sample_rate: int = None):
+        """
+        Used to decode audio to text.
+
+        ---------------------------
+
+        :param signal: The waveform. Multi-channel audio (one column per channel) is mixed down first.
+        :type signal: numpy.ndarray
+
+        :param sample_rate: The sample rate of the `signal`, defaults to `self.sample_rate`.
+        :type sample_rate: int, optional
+
+        ---------------------------
+
+        :return: The decoded text.
+        :rtype: str
+        """
+        return self.cipher.decode(ciphertext=self.demodulate(signal, sample_rate))
+
+    def synthesize(self, ciphertext: str):
+        """
+        Used to render dots and dashes (as returned by :meth:`MorseCode.encode`) to audio.
+        Characters other than dots and dashes are skipped.
+
+        ---------------------------
+
+        :param ciphertext: The encoded text.
+        :type ciphertext: str
+
+        ---------------------------
+
+        :return: The waveform, with samples between -1 and 1.
+        :rtype: numpy.ndarray
+        """
+        blocks = [self.blocks['word_gap'] if not symbol else self.symbol_block(symbol) for symbol in ciphertext.strip().split(' ')]
+        return numpy.concatenate(blocks) if blocks else numpy.zeros(0, dtype=numpy.float32)
+
+    def symbol_block(self, symbol: str):
+        """
+        Used to render a single symbol, followed by the gap between symbols. The blocks are cached per symbol.
+
+        ---------------------------
+
+        :param symbol: The dots and dashes of the symbol.
+        :type symbol: str
+
+        ---------------------------
+
+        :return: The waveform of the symbol.
+        :rtype: numpy.ndarray
+        """
+        if symbol not in self.symbol_cache:
+            blocks = []
+            for signal in symbol:
+                if signal in '.-':
+                    blocks.extend((self.blocks[signal], self.blocks['signal_gap']))
+            blocks = blocks[:-1] + [self.blocks['symbol_gap']]
+            self.symbol_cache[symbol] = numpy.concatenate(blocks)
+        return self.symbol_cache[symbol]
+
+    def demodulate(self, signal, sample_rate: int = None):
+        """
+        Used to turn audio back into dots and dashes, in the format of :meth:`MorseCode.encode`.
+
+        The envelope is the moving average of the rectified signal over a quarter of a unit (or one period of the tone, if longer), computed with a cumulative sum.
+        It is thresholded with hysteresis around half its maximum, and the lengths of the resulting on/off runs are classified in units.
+
+        ---------------------------
+
+        :param signal: The waveform. Multi-channel audio (one column per channel) is mixed down first.
+        :type signal: numpy.ndarray
+
+        :param sample_rate: The sample rate of the `signal`, defaults to `self.sample_rate`.
+        :type sample_rate: int, optional
+
+        ---------------------------
+
+        :return: The encoded text.
+        :rtype: str
+        """
+        sample_rate = sample_rate or self.sample_rate
+        signal = numpy.asarray(signal, dtype=numpy.float32)
+        if signal.ndim > 1:
+            signal = signal.mean(axis=1)
+
+        unit = 1.2 / self.wpm * sample_rate
+        window = max(1, round(sample_rate / self.frequency), round(unit / 4))
+        if signal.size < window:
+            return ""
+
+        total = numpy.concatenate(([0.0], numpy.cumsum(numpy.abs(signal), dtype=numpy.float64)))
+        envelope = (total[window:] - total[:-window]) / window
+        if envelope.max() <= 0:
+            return ""
+
+        # Hysteresis: a run only switches on above 60% of the peak and off below 40%, so noise around a single threshold can't split a tone.
+        # Samples in between carry the state of the last sample outside the band forward.
+        peak = envelope.max()
+        decided = (envelope > 0.6 * peak) | (envelope < 0.4 * peak)
+        last = numpy.maximum.accumulate(numpy.where(decided, numpy.arange(envelope.size), 0))
+        on = envelope[last] > 0.5 * peak
+        bounds = numpy.concatenate(([0], numpy.flatnonzero(on[1:] != on[:-1]) + 1, [on.size]))
+        lengths, states = numpy.diff(bounds), on[bounds[:-1]]
+
+        # Drop the silence before the first and after the last tone.
+        if not states[0]:
+            lengths, states = lengths[1:], states[1:]
+        if not states[-1]:
+            lengths, states = lengths[:-1], states[:-1]
+
+        signals = numpy.array(['.', '-'])[(lengths[states] >= 2 * unit).astype(numpy.intp)]
+        gaps = numpy.array(['', ' ', '  '])[numpy.digitize(lengths[~states] / unit, [2, 5])]
+
+        runs = numpy.empty(lengths.size, dtype=object)
+        runs[0::2], runs[1::2] = signals, gaps
+        return "".join(runs.tolist())
+
+    def write_wav(self, path: str, signal):
+        """
+        Used to write a waveform to a 16-bit mono WAV file.
+
+        ---------------------------
+
+        :param path: The path of the WAV file.
+        :type path: str
+
+        :param signal: The waveform, with samples between -1 and 1.
+        :type signal: numpy.ndarray
+        """
+        samples = (numpy.clip(signal, -1, 1) * 32767).astype('<i2')
+        with wave.open(path, "wb") as file:
+            file.setnchannels(1)
+            file.setsampwidth(2)
+            file.setframerate(self.sample_rate)
+            file.writeframes(samples.tobytes())
+
+    def read_wav(self, path: str):
+        """
+        Used to read a 16-bit PCM WAV file.
+
+        ---------------------------
+
+        :param path: The path of the WAV file.
+        :type path: str
+
+        ---------------------------
+
+        :return: The waveform (one column per channel) and its sample rate.
+        :rtype: tuple[numpy.ndarray, int]
+
+        ---------------------------
+
+        :raises MorseAudioError: Indicates that the WAV file was not 16-bit PCM.
+        """
+        with wave.open(path, "rb") as file:
+            if file.getsampwidth() != 2:
+                raise MorseAudioError(f"Expected a 16-bit WAV file. Found: {file.getsampwidth() * 8}-bit")
+            channels, sample_rate = file.getnchannels(), file.getframerate()
+            frames = file.readframes(file.getnframes())
+
+        signal = numpy.frombuffer(frames, dtype='<i2').reshape(-1, channels) / 32768
+        return signal, sample_rate
+
+    def decode_wav(self, path: str):
+        """
+        Used to decode a 16-bit PCM WAV file to text.
+
+        ---------------------------
+
+        :param path: The path of the WAV file.
+        :type path: str
+
+        ---------------------------
+
+        :return: The decoded text.
+        :rtype: str
+        """
+        signal, sample_rate = self.read_wav(path)
+        return self.decode(signal, sample_rate)
\ No newline at end of file
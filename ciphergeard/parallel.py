@@ -0,0 +1,213 @@
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+_worker_state = None
+
+class ParallelError(Exception):
+    pass
+
+def process_file(source_path: str, target_path: str, kernel, workers: int = None, chunk_size: int = 1 << 24):
+    """
+    Used to process the file at `source_path` into `target_path` in chunks, on up to `workers` processes.
+
+    The source is memory-mapped and the target is preallocated and memory-mapped in every process, so the workers read and write the files directly:
+    only the bounds of the chunks are sent to them, never the data, and every chunk lands at its own offset, in order.
+    The chunks are aligned to :data:`mmap.ALLOCATIONGRANULARITY`.
+
+    `kernel` is called as `kernel(chunk, position)` with the bytes of a chunk and its offset in the file, and must return as many bytes.
+    It must be picklable (e.g. a module-level function or the method of a picklable object) when `workers` are used.
+
+    ---------------------------
+
+    :param source_path: The path of the file to process.
+    :type source_path: str
+
+    :param target_path: The path to write the processed file to.
+    :type target_path: str
+
+    :param kernel: The function processing a chunk.
+    :type kernel: Callable[[bytes, int], bytes]
+
+    :param workers: The number of worker processes, defaults to `None` (the current process only).
+    :type workers: int, optional
+
+    :param chunk_size: The number of bytes processed at a time, rounded up to the allocation granularity, defaults to 16 MiB.
+    :type chunk_size: int, optional
+
+    ---------------------------
+
+    :raises ParallelError: Indicates that `workers` or `chunk_size` was not a natural number, that both paths were the same file, or that `kernel` changed the length of a chunk.
+    """
+    if workers is not None and workers < 1:
+        raise ParallelError('`workers` must be a natural number, i.e., > 0.')
+    if chunk_size < 1:
+        raise ParallelError('`chunk_size` must be a natural number, i.e., > 0.')
+
+    granularity = mmap.ALLOCATIONGRANULARITY
+    chunk_size = -(-chunk_size // granularity) * granularity
+
+    # The target is truncated before the source is read, which would erase a source processed in place.
+    if os.path.exists(target_path) and os.path.samefile(source_path, target_path):
+        raise ParallelError(f"The source and the target are the same file - '{target_path}'")
+
+    size = os.path.getsize(source_path)
+    with open(target_path, "wb") as target:
+        target.truncate(size)
+    if not size:
+        return
+
+    starts = range(0, size, chunk_size)
+    ends = [min(size, start + chunk_size) for start in starts]
+
+    if not workers or workers == 1 or len(starts) == 1:
+        with open(source_path, "rb") as source, open(target_path, "r+b") as target:
+            with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as text, mmap.mmap(target.fileno(), 0) as output:
+                for start, end in zip(starts, ends):
+                    _process_range(text, output, kernel, start, end)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(starts)), initializer=_init_worker, initargs=(source_path, target_path, kernel)) as executor:
+        # Consumed only to surface the errors of the workers.
+        for _ in executor.map(_process_worker_range, starts, ends):
+            pass
+
+def _init_worker(source_path: str, target_path: str, kernel):
+    """
+    Used to map both files once per worker process, when the process starts.
+
+    ---------------------------
+
+    :param source_path: The path of the file to process.
+    :type source_path: str
+
+    :param target_path: The path of the preallocated target file.
+    :type target_path: str
+
+    :param kernel: The function processing a chunk.
+    :type kernel: Callable[[bytes, int], bytes]
+    """
+    global _worker_state
+    with open(source_path, "rb") as source, open(target_path, "r+b") as target:
+        text = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        output = mmap.mmap(target.fileno(), 0)
+    _worker_state = (text, output, kernel)
+
+def _process_worker_range(start: int, end: int):
+    """
+    Used to process a chunk with the files mapped by :func:`_init_worker`.
+
+    ---------------------------
+
+    :param start: The offset of the chunk.
+    :type start: int
+
+    :param end: The offset after the chunk.
+    :type end: int
+    """
+    text, output, kernel = _worker_state
+    _process_range(text, output, kernel, start, end)
+
+def _process_range(text: mmap.mmap, output: mmap.mmap, kernel, start: int, end: int):
+    """
+    Used to process the bytes between `start` and `end` of `text` into `output`.
+
+    ---------------------------
+
+    :param text: The mapped source file.
+    :type text: mmap.mmap
+
+    :param output: The mapped target file.
+    :type output: mmap.mmap
+
+    :param kernel: The function processing a chunk.
+    :type kernel: Callable[[bytes, int], bytes]
+
+    :param start: The offset of the chunk.
+    :type start: int
+
+    :param end: The offset after the chunk.
+    :type end: int
+
+    ---------------------------
+
+    :raises ParallelError: Indicates that `kernel` changed the length of the chunk.
+    """
+    processed = kernel(text[start:end], start)
+    if len(processed) != end - start:
+        raise ParallelError(f"Expected the chunk at {start} to keep its length ({end - start}). Found: {len(processed)}")
+    output[start:end] = processed
+
+    # Drop the source pages already processed, so that the mapped file does not keep growing the memory used.
+    if hasattr(mmap, "MADV_DONTNEED"):
+        text.madvise(mmap.MADV_DONTNEED, start, end - start)
+
+class ParallelFileMixin:
+    """
+    Adds :meth:`encode_file` and :meth:`decode_file` to a cipher whose output for any part of a text can be computed from that part and its position alone,
+    i.e. which implements `encode_chunk(chunk, position)` and `decode_chunk(chunk, position)`.
+    The files are processed by :func:`process_file`.
+
+    Like the `*_bytes` methods, only the ASCII letters are processed, and unlike :meth:`encode`, the text is not stripped.
+
+    ---------------------------
+
+    **Example**
+    ---------------------------
+    .. code-block:: python
+
+       from ciphergeard.vigenere import VigenereCipher
+
+       cipher = VigenereCipher(keyword="SECRET")
+
+       cipher.encode_file("plain.txt", "encoded.txt", workers=8)
+       cipher.decode_file("encoded.txt", "decoded.txt", workers=8)
+    """
+
+    def encode_file(self, plaintext_path: str, ciphertext_path: str, workers: int = None, chunk_size: int = 1 << 24):
+        """
+        Used to encode the file at `plaintext_path` into `ciphertext_path`.
+
+        ---------------------------
+
+        :param plaintext_path: The path of the plaintext file.
+        :type plaintext_path: str
+
+        :param ciphertext_path: The path to write the encoded text to.
+        :type ciphertext_path: str
+
+        :param workers: The number of worker processes, defaults to `None` (the current process only).
+        :type workers: int, optional
+
+        :param chunk_size: The number of bytes processed at a time, defaults to 16 MiB.
+        :type chunk_size: int, optional
+
+        ---------------------------
+
+        :raises ParallelError: Indicates that `workers` or `chunk_size` was not a natural number, or that both paths were the same file.
+        """
+        process_file(plaintext_path, ciphertext_path, self.encode_chunk, workers, chunk_size)
+
+    def decode_file(self, ciphertext_path: str, plaintext_path: str, workers: int = None, chunk_size: int = 1 << 24):
+        """
+        Used to decode the file at `ciphertext_path` into `plaintext_path`.
+
+        ---------------------------
+
+        :param ciphertext_path: The path of the encoded file.
+        :type ciphertext_path: str
+
+        :param plaintext_path: The path to write the decoded text to.
+        :type plaintext_path: str
+
+        :param workers: The number of worker processes, defaults to `None` (the current process only).
+        :type workers: int, optional
+
+        :param chunk_size: The number of bytes processed at a time, defaults to 16 MiB.
+        :type chunk_size: int, optional
+
+        ---------------------------
+
+        :raises ParallelError: Indicates that `workers` or `chunk_size` was not a natural number, or that both paths were the same file.
+        """
+        process_file(ciphertext_path, plaintext_path, self.decode_chunk, workers, chunk_size)
\ No newline at end of file
@@ -1,9 +1,14 @@
+import operator
+import re
 import string
+from .batch import BatchMixin
+
+_LETTER_RUN = re.compile("[a-z]{2,}")
 
 class PlayfairCipherError(Exception):
     pass
 
-class PlayfairCipher:
+class PlayfairCipher(BatchMixin):
     def __init__(self, keyword: str, filler_char: str = 'x', table: list = None, char_map: dict = None):
         """
         The `Playfair cipher <https://en.wikipedia.org/wiki/Playfair_cipher>`_, a manual symmetric encryption technique and the first literal digram substitution cipher.
@@ -48,6 +53,32 @@ class PlayfairCipher:
         self.filler = filler_char
         self.table = table or self.generate_table()
         self.char_map = char_map or self.map_chars()
+        self.encode_digrams, self.decode_digrams = self.generate_digrams()
+
+    def __getstate__(self):
+        """
+        Used to pickle the cipher without its digram tables, which make up most of its size and are cheap to rebuild.
+
+        ---------------------------
+
+        :return: The state of the cipher.
+        :rtype: dict
+        """
+        state = self.__dict__.copy()
+        del state['encode_digrams'], state['decode_digrams']
+        return state
+
+    def __setstate__(self, state: dict):
+        """
+        Used to unpickle the cipher, rebuilding its digram tables.
+
+        ---------------------------
+
+        :param state: The state of the cipher.
+        :type state: dict
+        """
+        self.__dict__.update(state)
+        self.encode_digrams, self.decode_digrams = self.generate_digrams()
 
     def remove_dupes(self, l: list[str]):
         """
@@ -103,60 +134,51 @@ class PlayfairCipher:
                 char_map.update({col: (i, j)})
         return char_map
     
-    def encode(self, plaintext: str):
+    def generate_digrams(self):
         """
-        Used to encode the `plaintext`.
+        Used to precompute the encoded and decoded form of every digram of `self.table`.
+        There are only 25x25 possible digrams, so the encoding/decoding only has to look them up.
 
         ---------------------------
 
-        :param plaintext: The plaintext to encode.
-        :type plaintext: str
-
-        ---------------------------
-
-        :return: The encoded text.
-        :rtype: str
+        :return: The encoding and decoding digram tables, mapping every digram to its encoded/decoded one.
+        :rtype: tuple[dict[str], dict[str]]
         """
-        plaintext: list[str] = list(plaintext.lower().strip().replace('j', 'i'))
+        encode_digrams, decode_digrams = {}, {}
 
-        ciphertext = ""
-        i = 0    
-        exc2 = ""    
-        while i < len(plaintext):
-            c1, c2 = plaintext[i], (plaintext[i + 1] if i + 1 < len(plaintext) else self.filler)
+        for c1, p1 in self.char_map.items():
+            for c2, p2 in self.char_map.items():
+                if p1[0] == p2[0]: # Same row
+                    e1, e2 = self.table[p1[0]][(p1[1] + 1) % 5], self.table[p2[0]][(p2[1] + 1) % 5]
+                    d1, d2 = self.table[p1[0]][p1[1] - 1], self.table[p2[0]][p2[1] - 1]
 
-            if not c1.isalpha():
-                ciphertext += c1
-                i += 1
-                continue
+                elif p1[1] == p2[1]: # Same column
+                    e1, e2 = self.table[(p1[0] + 1) % 5][p1[1]], self.table[(p2[0] + 1) % 5][p2[1]]
+                    d1, d2 = self.table[p1[0] - 1][p1[1]], self.table[p2[0] - 1][p2[1]]
 
-            if not c2.isalpha():
-                for j, char in enumerate(plaintext[i + 1:]):
-                    if char.isalpha():
-                        c2 = char
-                        i += j
-                        break
-                    else:
-                        exc2 += char
-                else:
-                    c2 = self.filler
+                else: # Rectangle
+                    e1, e2 = d1, d2 = self.table[p1[0]][p2[1]], self.table[p2[0]][p1[1]]
+
+                encode_digrams[c1 + c2] = e1 + e2
+                decode_digrams[c1 + c2] = d1 + d2
 
-            p1, p2 = self.char_map[c1], self.char_map[c2]
+        return encode_digrams, decode_digrams
 
-            if p1[0] == p2[0]: # Same row
-                e1, e2 = self.table[p1[0]][p1[1] + 1 if p1[1] + 1 < 5 else 4 - p1[1]], self.table[p2[0]][p2[1] + 1 if p2[1] + 1 < 5 else 4 - p2[1]]
+    def encode(self, plaintext: str):
+        """
+        Used to encode the `plaintext`.
 
-            elif p1[1] == p2[1]: # Same column
-                e1, e2 = self.table[p1[0] + 1 if p1[0] + 1 < 5 else 4 - p1[0]][p1[1]], self.table[p2[0] + 1 if p2[0] + 1 < 5 else 4 - p2[0]][p2[1]]
+        ---------------------------
 
-            else: # Rectangle
-                e1, e2 = self.table[p1[0]][p2[1]], self.table[p2[0]][p1[1]]
+        :param plaintext: The plaintext to encode.
+        :type plaintext: str
 
-            ciphertext += e1 + exc2 + e2
-            exc2 = ""
-            i += 2
+        ---------------------------
 
-        return ciphertext
+        :return: The encoded text.
+        :rtype: str
+        """
+        return self.__substitute(plaintext.lower().strip().replace('j', 'i'), self.encode_digrams)
 
     def decode(self, ciphertext: str):
         """
@@ -172,43 +194,59 @@ class PlayfairCipher:
         :return: The decoded text.
         :rtype: str
         """
-        ciphertext: list[str] = list(ciphertext.lower().strip().replace('j', 'i'))
+        return self.__substitute(ciphertext.lower().strip().replace('j', 'i'), self.decode_digrams)
+
+    def __substitute(self, text: str, digrams: dict[str]):
+        """
+        Internal function to substitute every digram of `text` using `digrams`.
+        The non-English characters are kept in place, those between the two letters of a digram end up between their substitutes.
+
+        ---------------------------
 
-        plaintext = ""
+        :param text: The lowercased text.
+        :type text: str
+
+        :param digrams: The digram table to use.
+        :type digrams: dict[str]
+
+        ---------------------------
+
+        :return: The substituted text.
+        :rtype: str
+        """
+        result = []
+        length = len(text)
         i = 0
-        exc2 = ""
-        while i < len(ciphertext):
-            c1, c2 = ciphertext[i], (ciphertext[i + 1] if i + 1 < len(ciphertext) else self.filler)
+        while i < length:
+            c1 = text[i]
 
             if not c1.isalpha():
-                plaintext += c1
+                result.append(c1)
                 i += 1
                 continue
 
+            run = _LETTER_RUN.match(text, i)
+            if run:
+                # A run of letters is made up of complete digrams, so they are all looked up at once.
+                end = run.end() - (run.end() - i) % 2
+                result.extend(map(digrams.__getitem__, map(operator.add, text[i:end:2], text[i + 1:end:2])))
+                i = end
+                continue
+
+            c2 = text[i + 1] if i + 1 < length else self.filler
+            exc2 = ""
+
             if not c2.isalpha():
-                for j, char in enumerate(ciphertext[i + 1:]):
-                    if char.isalpha():
-                        c2 = char
-                        i += j
+                for j in range(i + 1, length):
+                    if text[j].isalpha():
+                        c2, exc2 = text[j], text[i + 1:j]
+                        i = j - 1
                         break
-                    else:
-                        exc2 += char
                 else:
-                    c2 = self.filler
-
-            p1, p2 = self.char_map[c1], self.char_map[c2]
-
-            if p1[0] == p2[0]: # Same row
-                d1, d2 = self.table[p1[0]][p1[1] - 1], self.table[p2[0]][p2[1] - 1]
+                    c2, exc2 = self.filler, text[i + 1:]
 
-            elif p1[1] == p2[1]: # Same column
-                d1, d2 = self.table[p1[0] - 1][p1[1]], self.table[p2[0] - 1][p2[1]]
-
-            else: # Rectangle
-                d1, d2 = self.table[p1[0]][p2[1]], self.table[p2[0]][p1[1]]  
-
-            plaintext += d1 + exc2 + d2
-            exc2 = ""
+            digram = digrams[c1 + c2]
+            result.append(digram[0] + exc2 + digram[1] if exc2 else digram)
             i += 2
 
-        return plaintext
\ No newline at end of file
+        return "".join(result)
\ No newline at end of file
@@ -1,4 +1,67 @@
-class RailFenceCipher:
+import functools
+from array import array
+from .batch import BatchMixin
+
+class RailFenceCipherError(Exception):
+    pass
+
+MAX_CACHED_LENGTH = 1 << 16
+"""The length of the longest text whose permutations are cached. They take 8 bytes per character, so the permutations of longer texts are computed again rather than kept in memory."""
+
+def zigzag_permutation(rails: int, length: int):
+    """
+    Used to compute the order in which the rail fence reads the characters of a text of `length` characters, and its inverse.
+    Both are computed arithmetically row by row in O(n), and the last few results are cached for texts of up to :data:`MAX_CACHED_LENGTH` characters, so texts of the same length skip the computation.
+
+    ---------------------------
+
+    :param rails: The number of rails.
+    :type rails: int
+
+    :param length: The length of the text.
+    :type length: int
+
+    ---------------------------
+
+    :return: The index of the character read at every position of the encoded text, and the position in the encoded text of every character.
+    :rtype: tuple[array, array]
+    """
+    if length > MAX_CACHED_LENGTH:
+        return _zigzag_permutation(rails, length)
+    return _cached_zigzag_permutation(rails, length)
+
+def _zigzag_permutation(rails: int, length: int):
+    """
+    Internal function to compute the permutations of :func:`zigzag_permutation`.
+    """
+    typecode = "I" if length < 2 ** 32 else "Q"
+    if rails == 1:
+        return array(typecode, range(length)), array(typecode, range(length))
+
+    cycle = 2 * (rails - 1)
+    permutation, inverse = array(typecode), array(typecode, bytes(array(typecode).itemsize * length))
+
+    for row in range(rails):
+        down = range(row, length, cycle)
+        if row == 0 or row == rails - 1:
+            inverse[row::cycle] = array(typecode, range(len(permutation), len(permutation) + len(down)))
+            permutation.extend(down)
+            continue
+
+        # Every middle row is visited twice per cycle, once going down and once going up.
+        up = range(cycle - row, length, cycle)
+        start = len(permutation)
+        positions = array(typecode, bytes(permutation.itemsize * (len(down) + len(up))))
+        positions[0::2], positions[1::2] = array(typecode, down), array(typecode, up)
+        inverse[row::cycle] = array(typecode, range(start, start + 2 * len(down), 2))
+        inverse[cycle - row::cycle] = array(typecode, range(start + 1, start + 1 + 2 * len(up), 2))
+        permutation.extend(positions)
+
+    return permutation, inverse
+
+_cached_zigzag_permutation = functools.lru_cache(maxsize=16)(_zigzag_permutation)
+
+class RailFenceCipher(BatchMixin):
     def __init__(self, rails: int, placeholder: str = '#') -> None:
         """
         The `Rail Fence Cipher <https://en.wikipedia.org/wiki/Rail_fence_cipher>`_, is a classical type of transposition cipher. It derives its name from the manner in which encryption is performed, in analogy to a fence built with horizontal rails.
@@ -9,11 +72,15 @@ class RailFenceCipher:
         :param rails: The number of rails to use.
         :type rails: int
 
-        :param placeholder: The character to use as a placeholder when decoding, defaults to `'#'`.
+        :param placeholder: The character to use as a placeholder when decoding, defaults to `'#'`. It is no longer needed, as the decoding uses :func:`zigzag_permutation`.
         :type placeholder: str, optional
 
         ---------------------------
 
+        :raises RailFenceCipherError: Indicates an error while initializing.
+
+        ---------------------------
+
         **Example**
         ---------------------------
         .. code-block:: python
@@ -31,6 +98,8 @@ class RailFenceCipher:
            # Output: Attack at Dawn
         """
         self.rails = rails
+        if self.rails < 1:
+            raise RailFenceCipherError('`rails` must be a natural number, i.e., > 0.')
         self.placeholder = placeholder
 
     def encode(self, plaintext: str):
@@ -47,26 +116,8 @@ class RailFenceCipher:
         :return: The encoded text.
         :rtype: str
         """
-        rail = [['' for _ in range(len(plaintext))] for _ in range(self.rails)]
-
-        direction_down = False
-        row, col = 0, 0
-        
-        for char in plaintext:
-            rail[row][col] = char
-            col += 1
-            
-            if row == 0 or row == self.rails - 1:
-                direction_down = not direction_down
-            
-            row += 1 if direction_down else -1
-        
-        result = []
-        for i in range(self.rails):
-            for j in range(len(plaintext)):
-                if rail[i][j] != '\n':
-                    result.append(rail[i][j])
-        return ''.join(result)
+        permutation, _ = zigzag_permutation(self.rails, len(plaintext))
+        return "".join(map(plaintext.__getitem__, permutation)).replace("\n", "")
     
     def decode(self, ciphertext: str):
         """
@@ -82,33 +133,5 @@ class RailFenceCipher:
         :return: The decoded text.
         :rtype: str
         """
-        rail = [['' for _ in range(len(ciphertext))] for _ in range(self.rails)]
-
-        direction_down = False
-        row, col = 0, 0
-
-        for _ in range(len(ciphertext)):
-            rail[row][col] = self.placeholder
-            col += 1
-            if row == 0 or row == self.rails - 1:
-                direction_down = not direction_down
-            row += 1 if direction_down else -1
-
-        index = 0
-        for i in range(self.rails):
-            for j in range(len(ciphertext)):
-                if rail[i][j] == self.placeholder and index < len(ciphertext):
-                    rail[i][j] = ciphertext[index]
-                    index += 1
-
-        result = []
-        row, col = 0, 0
-        direction_down = False
-        for _ in range(len(ciphertext)):
-            result.append(rail[row][col])
-            col += 1
-            if row == 0 or row == self.rails - 1:
-                direction_down = not direction_down
-            row += 1 if direction_down else -1
-
-        return ''.join(result)
\ No newline at end of file
+        _, inverse = zigzag_permutation(self.rails, len(ciphertext))
+        return "".join(map(ciphertext.__getitem__, inverse))
\ No newline at end of file
@@ -1,10 +1,41 @@
+import mmap
+import os
 import random
 import string
+from .batch import BatchMixin
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_BYTE_TABLE = bytes(
+    ((p - 97 + k - 97) % 26) + 97 if 97 <= p <= 122 else p
+    for k in range(256)
+    for p in range(256)
+)
+_RBYTE_TABLE = bytes(
+    ((p - k) % 26) + 97 if 97 <= p <= 122 else p
+    for k in range(256)
+    for p in range(256)
+)
+
+_KEYWORD_TABLE = (string.ascii_lowercase * 9).encode().ljust(256, b"?")
+
+def _combine(text: bytes, keyword: bytes, table: bytes):
+    """
+    Internal function to look up every `(keyword, text)` byte pair in `table`, vectorized with NumPy when it is available.
+    """
+    if numpy is not None:
+        text = numpy.frombuffer(text, dtype=numpy.uint8).astype(numpy.uint16)
+        keyword = numpy.frombuffer(keyword, dtype=numpy.uint8).astype(numpy.uint16)
+        return numpy.frombuffer(table, dtype=numpy.uint8)[(keyword << 8) | text].tobytes()
+    return bytes(table[(k << 8) | p] for p, k in zip(text, keyword))
 
 class VernamCipherError(Exception):
     pass
 
-class VernamCipher:
+class VernamCipher(BatchMixin):
     def __init__(self) -> None:
         """
         The `Vernam Cipher <https://en.wikipedia.org/wiki/One-time_pad>`_, is a form of :class:`VigenereCipher` but utilizes a unqiue keyword (equal to the length of the plaintext) everytime when encoding.
@@ -72,14 +103,11 @@ class VernamCipher:
 
         keyword = keyword or self.generate_keyword(len(plaintext))
 
-        ciphertext = ""
-        for p, k in zip(plaintext, keyword):
-            if not p.isalpha():
-                ciphertext += p
-                continue
-            ciphertext += chr(((ord(p) + ord(k) - 194) % 26) + 97)
+        if plaintext.isascii() and keyword.isascii():
+            return _combine(plaintext.encode(), keyword.encode(), _BYTE_TABLE).decode()
 
-        return ciphertext
+        # The non-ASCII characters do not fit the byte table, but the letters among them are still shifted.
+        return "".join(chr(((ord(p) + ord(k) - 194) % 26) + 97) if p.isalpha() else p for p, k in zip(plaintext, keyword))
     
     def decode(self, ciphertext: str, keyword: str):
         """
@@ -107,12 +135,177 @@ class VernamCipher:
         if len(ciphertext) != len(keyword):
             raise VernamCipherError(f"The length of encoded text ({len(ciphertext)}) should be equal to the length of the specified keyword ({len(keyword)}).")
 
-        plaintext = ""
-        for e, k in zip(ciphertext, keyword):
-            if not e.isalpha():
-                plaintext += e
-                continue
-            
-            plaintext += chr(((ord(e) - ord(k)) % 26) + 97)
+        if ciphertext.isascii() and keyword.isascii():
+            return _combine(ciphertext.encode(), keyword.encode(), _RBYTE_TABLE).decode()
+
+        # The non-ASCII characters do not fit the byte table, but the letters among them are still shifted.
+        return "".join(chr(((ord(e) - ord(k)) % 26) + 97) if e.isalpha() else e for e, k in zip(ciphertext, keyword))
+
+    def encode_bytes(self, plaintext: bytes | bytearray | memoryview, keyword: bytes | bytearray | memoryview):
+        """
+        Used to encode the `plaintext` directly as bytes, without decoding it to `str` first.
+        Only the ASCII letters are encoded, every other byte is left untouched.
+
+        ---------------------------
+
+        :param plaintext: The plaintext to encode.
+        :type plaintext: bytes | bytearray | memoryview
+
+        :param keyword: The keyword to use.
+        :type keyword: bytes | bytearray | memoryview
+
+        ---------------------------
+
+        :return: The encoded bytes.
+        :rtype: bytes
+
+        ---------------------------
+
+        :raises VernamCipherError: Indicates an error while encoding.
+        """
+        plaintext = bytes(plaintext).lower().strip()
+
+        if keyword and len(plaintext) != len(keyword):
+            raise VernamCipherError(f"The length of plain text ({len(plaintext)}) should be equal to the length of the specified keyword ({len(keyword)}).")
+
+        keyword = bytes(keyword) if keyword else self.generate_keyword(len(plaintext)).encode()
+
+        return _combine(plaintext, keyword, _BYTE_TABLE)
+
+    def decode_bytes(self, ciphertext: bytes | bytearray | memoryview, keyword: bytes | bytearray | memoryview):
+        """
+        Used to decode the `ciphertext` directly as bytes, without decoding it to `str` first.
+        Only the ASCII letters are decoded, every other byte is left untouched.
+
+        ---------------------------
+
+        :param ciphertext: The encoded bytes to decode.
+        :type ciphertext: bytes | bytearray | memoryview
+
+        :param keyword: The keyword to use.
+        :type keyword: bytes | bytearray | memoryview
+
+        ---------------------------
+
+        :return: The decoded bytes.
+        :rtype: bytes
+
+        ---------------------------
+
+        :raises VernamCipherError: Indicates an error while decoding.
+        """
+        ciphertext = bytes(ciphertext).lower().strip()
+
+        if len(ciphertext) != len(keyword):
+            raise VernamCipherError(f"The length of encoded text ({len(ciphertext)}) should be equal to the length of the specified keyword ({len(keyword)}).")
+
+        return _combine(ciphertext, bytes(keyword), _RBYTE_TABLE)
+
+    def generate_keyword_file(self, path: str, n: int, window: int = 1 << 20):
+        """
+        Used to write a random keyword of `n` length to the file at `path`, `window` bytes at a time.
+        It allows generating pads much larger than the memory. The bytes are drawn from :func:`os.urandom`, as a one-time pad is only secure if it cannot be predicted.
+
+        ---------------------------
+
+        :param path: The path of the keyword file.
+        :type path: str
+
+        :param n: The length of the keyword.
+        :type n: int
+
+        :param window: The number of bytes to generate and write at a time, defaults to 1 MiB.
+        :type window: int, optional
+        """
+        with open(path, "wb") as file:
+            while n > 0:
+                # Only the bytes below 234 (26 * 9) are kept, so that every letter stays equally likely.
+                chunk = os.urandom(min(n, window)).translate(_KEYWORD_TABLE, bytes(range(234, 256)))
+                file.write(chunk)
+                n -= len(chunk)
+
+    def encode_file(self, plaintext_path: str, keyword_path: str, ciphertext_path: str, window: int = 1 << 20):
+        """
+        Used to encode the file at `plaintext_path` with the keyword file at `keyword_path` into `ciphertext_path`.
+        Both input files are memory-mapped and processed `window` bytes at a time, so the memory used does not depend on their size.
+
+        Unlike :meth:`encode`, the plaintext is not stripped.
+
+        ---------------------------
+
+        :param plaintext_path: The path of the plaintext file.
+        :type plaintext_path: str
+
+        :param keyword_path: The path of the keyword file, for eg. generated by :meth:`generate_keyword_file`.
+        :type keyword_path: str
+
+        :param ciphertext_path: The path to write the encoded text to.
+        :type ciphertext_path: str
+
+        :param window: The number of bytes to process at a time, defaults to 1 MiB.
+        :type window: int, optional
+
+        ---------------------------
+
+        :raises VernamCipherError: Indicates an error while encoding.
+        """
+        self.__process_file(plaintext_path, keyword_path, ciphertext_path, window, _BYTE_TABLE)
+
+    def decode_file(self, ciphertext_path: str, keyword_path: str, plaintext_path: str, window: int = 1 << 20):
+        """
+        Used to decode the file at `ciphertext_path` with the keyword file at `keyword_path` into `plaintext_path`.
+        Both input files are memory-mapped and processed `window` bytes at a time, so the memory used does not depend on their size.
+
+        ---------------------------
+
+        :param ciphertext_path: The path of the encoded file.
+        :type ciphertext_path: str
+
+        :param keyword_path: The path of the keyword file.
+        :type keyword_path: str
+
+        :param plaintext_path: The path to write the decoded text to.
+        :type plaintext_path: str
+
+        :param window: The number of bytes to process at a time, defaults to 1 MiB.
+        :type window: int, optional
+
+        ---------------------------
+
+        :raises VernamCipherError: Indicates an error while decoding.
+        """
+        self.__process_file(ciphertext_path, keyword_path, plaintext_path, window, _RBYTE_TABLE)
+
+    def __process_file(self, source_path: str, keyword_path: str, target_path: str, window: int, table: bytes):
+        """
+        Internal function to combine a memory-mapped source and keyword file window by window into `target_path`.
+
+        ---------------------------
+
+        :raises VernamCipherError: Indicates that the target was the source or the keyword file, or that the lengths of the files did not match.
+        """
+        # The target is truncated before the inputs are read, which would erase them.
+        if os.path.exists(target_path) and any(os.path.samefile(path, target_path) for path in (source_path, keyword_path)):
+            raise VernamCipherError(f"The target is the same file as the text or the keyword file - '{target_path}'")
+
+        with open(source_path, "rb") as source, open(keyword_path, "rb") as keyword:
+            size, keyword_size = os.fstat(source.fileno()).st_size, os.fstat(keyword.fileno()).st_size
+            if size != keyword_size:
+                raise VernamCipherError(f"The length of the text file ({size}) should be equal to the length of the keyword file ({keyword_size}).")
+
+            with open(target_path, "wb") as target:
+                if not size:
+                    return
+
+                with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as text, mmap.mmap(keyword.fileno(), 0, access=mmap.ACCESS_READ) as key:
+                    released = 0
+                    for start in range(0, size, window):
+                        target.write(_combine(text[start:start + window].lower(), key[start:start + window], table))
 
-        return plaintext
\ No newline at end of file
+                        # Drop the pages already processed, so that the mapped files do not keep growing the memory used.
+                        if hasattr(mmap, "MADV_DONTNEED"):
+                            end = min(size, start + window) // mmap.PAGESIZE * mmap.PAGESIZE
+                            if end > released:
+                                text.madvise(mmap.MADV_DONTNEED, released, end - released)
+                                key.madvise(mmap.MADV_DONTNEED, released, end - released)
+                                released = end
\ No newline at end of file
@@ -1,7 +1,12 @@
+from ..batch import BatchMixin
+from ..parallel import ParallelFileMixin
+from .engine import shift_bytes, shift_text
+from .stream import VigenereStream
+
 class VigenereCipherError(Exception):
     pass
 
-class VigenereCipher:
+class VigenereCipher(BatchMixin, ParallelFileMixin):
     def __init__(self, keyword: str) -> None:
         """
         This class implements the `Vigenère Cipher <https://en.wikipedia.org/wiki/Vigen%C3%A8re_cipher>`_, a classic polyalphabetic substitution cipher.
@@ -35,6 +40,7 @@ class VigenereCipher:
         self.keyword = keyword.lower().strip()
         if not self.keyword:
             raise VigenereCipherError('Please specify a proper keyword.')
+        self.key_period = None
 
     def encode(self, plaintext: str):
         """
@@ -50,19 +56,7 @@ class VigenereCipher:
         :return: The encoded text.
         :rtype: str
         """
-        plaintext = plaintext.lower().strip()
-        ciphertext = ""
-
-        keyword = self.match_keyword_length(plaintext) if len(self.keyword) != len(plaintext) else self.keyword
-        
-        for i, j in zip(plaintext, keyword, strict=True):
-            if not i.isalpha():
-                ciphertext += i
-                continue
-            ciphertext += chr(((self.get_index(i) + self.get_index(j)) % 26) + 97)
-            continue
-
-        return ciphertext
+        return shift_text(plaintext.lower().strip(), self.key_shifts(1), period=self.key_period)
 
     def decode(self, ciphertext: str):
         """
@@ -78,18 +72,121 @@ class VigenereCipher:
         :return: The decoded text.
         :rtype: str
         """
-        ciphertext = ciphertext.lower().strip()
-        plaintext = ""
+        return shift_text(ciphertext.lower().strip(), self.key_shifts(-1), period=self.key_period)
 
-        keyword = self.match_keyword_length(ciphertext) if len(self.keyword) != len(ciphertext) else self.keyword
-        
-        for i, j in zip(ciphertext, keyword, strict=True):
-            if not i.isalpha():
-                plaintext += i
-                continue
-            plaintext += chr(((self.get_index(i) - self.get_index(j)) % 26) + 97)
+    def encode_bytes(self, plaintext: bytes | bytearray | memoryview):
+        """
+        Used to encode the `plaintext` directly as bytes, without decoding it to `str` first.
+        Only the ASCII letters are encoded, every other byte is left untouched.
+
+        ---------------------------
+
+        :param plaintext: The plaintext to encode.
+        :type plaintext: bytes | bytearray | memoryview
+
+        ---------------------------
+
+        :return: The encoded bytes.
+        :rtype: bytes
+        """
+        return shift_bytes(bytes(plaintext).lower().strip(), self.key_shifts(1), period=self.key_period)
+
+    def decode_bytes(self, ciphertext: bytes | bytearray | memoryview):
+        """
+        Used to decode the `ciphertext` directly as bytes, without decoding it to `str` first.
+        Only the ASCII letters are decoded, every other byte is left untouched.
 
-        return plaintext
+        ---------------------------
+
+        :param ciphertext: The encoded bytes to decode.
+        :type ciphertext: bytes | bytearray | memoryview
+
+        ---------------------------
+
+        :return: The decoded bytes.
+        :rtype: bytes
+        """
+        return shift_bytes(bytes(ciphertext).lower().strip(), self.key_shifts(-1), period=self.key_period)
+
+    def stream_encoder(self):
+        """
+        Used to create an incremental encoder, which keeps its position in the key between chunks.
+
+        ---------------------------
+
+        :return: The encoder.
+        :rtype: VigenereStream
+        """
+        return VigenereStream(self.key_shifts(1), period=self.key_period)
+
+    def stream_decoder(self):
+        """
+        Used to create an incremental decoder, which keeps its position in the key between chunks.
+
+        ---------------------------
+
+        :return: The decoder.
+        :rtype: VigenereStream
+        """
+        return VigenereStream(self.key_shifts(-1), period=self.key_period)
+
+    def encode_chunk(self, chunk: bytes, position: int = 0):
+        """
+        Used to encode a chunk of a larger text, e.g. by :meth:`encode_file`, starting at the key position of its offset.
+
+        ---------------------------
+
+        :param chunk: The chunk to encode. It is not stripped.
+        :type chunk: bytes
+
+        :param position: The offset of the chunk in the text, defaults to `0`.
+        :type position: int, optional
+
+        ---------------------------
+
+        :return: The encoded chunk.
+        :rtype: bytes
+        """
+        encoder = self.stream_encoder()
+        encoder.offset = position % encoder.period
+        return encoder.process_bytes(chunk)
+
+    def decode_chunk(self, chunk: bytes, position: int = 0):
+        """
+        Used to decode a chunk of a larger text, e.g. by :meth:`decode_file`, starting at the key position of its offset.
+
+        ---------------------------
+
+        :param chunk: The chunk to decode. It is not stripped.
+        :type chunk: bytes
+
+        :param position: The offset of the chunk in the text, defaults to `0`.
+        :type position: int, optional
+
+        ---------------------------
+
+        :return: The decoded chunk.
+        :rtype: bytes
+        """
+        decoder = self.stream_decoder()
+        decoder.offset = position % decoder.period
+        return decoder.process_bytes(chunk)
+
+    def key_shifts(self, direction: int):
+        """
+        Used to convert `self.keyword` into the shift of every keyword character.
+
+        ---------------------------
+
+        :param direction: `1` to get the shifts for adding the keyword, `-1` for subtracting it.
+        :type direction: int
+
+        ---------------------------
+
+        :return: The shifts, each between 0 and 25.
+        :rtype: list[int]
+        """
+        return [(direction * self.get_index(char)) % 26 for char in self.keyword]
 
     def get_index(self, letter: str):
         """
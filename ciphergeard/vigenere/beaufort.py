@@ -1,4 +1,6 @@
 from ..vigenere import VigenereCipher
+from .engine import shift_bytes, shift_text
+from .stream import VigenereStream
 
 class BeaufortVariantError(Exception):
     pass
@@ -53,18 +55,7 @@ class BeaufortVariant(VigenereCipher):
         :return: The encoded text.
         :rtype: str
         """
-        plaintext = plaintext.lower().strip()
-        ciphertext = ""
-
-        keyword = self.match_keyword_length(plaintext) if len(self.keyword) != len(plaintext) else self.keyword
-        
-        for i, j in zip(plaintext, keyword, strict=True):
-            if not i.isalpha():
-                ciphertext += i
-                continue
-            ciphertext += chr(((self.get_index(i) - self.get_index(j)) % 26) + 97)
-
-        return ciphertext
+        return shift_text(plaintext.lower().strip(), self.key_shifts(-1), period=self.key_period)
 
     def decode(self, ciphertext: str):
         """
@@ -80,16 +71,60 @@ class BeaufortVariant(VigenereCipher):
         :return: The decoded text.
         :rtype: str
         """
-        ciphertext = ciphertext.lower().strip()
-        plaintext = ""
-
-        keyword = self.match_keyword_length(ciphertext) if len(self.keyword) != len(ciphertext) else self.keyword
-        
-        for i, j in zip(ciphertext, keyword, strict=True):
-            if not i.isalpha():
-                plaintext += i
-                continue
-            plaintext += chr(((self.get_index(i) + self.get_index(j)) % 26) + 97)
-            continue
-
-        return plaintext
\ No newline at end of file
+        return shift_text(ciphertext.lower().strip(), self.key_shifts(1), period=self.key_period)
+
+    def encode_bytes(self, plaintext: bytes | bytearray | memoryview):
+        """
+        Used to encode the `plaintext` directly as bytes, without decoding it to `str` first.
+        Only the ASCII letters are encoded, every other byte is left untouched.
+
+        ---------------------------
+
+        :param plaintext: The plaintext to encode.
+        :type plaintext: bytes | bytearray | memoryview
+
+        ---------------------------
+
+        :return: The encoded bytes.
+        :rtype: bytes
+        """
+        return shift_bytes(bytes(plaintext).lower().strip(), self.key_shifts(-1), period=self.key_period)
+
+    def decode_bytes(self, ciphertext: bytes | bytearray | memoryview):
+        """
+        Used to decode the `ciphertext` directly as bytes, without decoding it to `str` first.
+        Only the ASCII letters are decoded, every other byte is left untouched.
+
+        ---------------------------
+
+        :param ciphertext: The encoded bytes to decode.
+        :type ciphertext: bytes | bytearray | memoryview
+
+        ---------------------------
+
+        :return: The decoded bytes.
+        :rtype: bytes
+        """
+        return shift_bytes(bytes(ciphertext).lower().strip(), self.key_shifts(1), period=self.key_period)
+
+    def stream_encoder(self):
+        """
+        Used to create an incremental encoder, which keeps its position in the key between chunks.
+
+        ---------------------------
+
+        :return: The encoder.
+        :rtype: VigenereStream
+        """
+        return VigenereStream(self.key_shifts(-1), period=self.key_period)
+
+    def stream_decoder(self):
+        """
+        Used to create an incremental decoder, which keeps its position in the key between chunks.
+
+        ---------------------------
+
+        :return: The decoder.
+        :rtype: VigenereStream
+        """
+        return VigenereStream(self.key_shifts(1), period=self.key_period)
\ No newline at end of file
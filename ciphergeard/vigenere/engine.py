@@ -0,0 +1,155 @@
+import string
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_SHIFT_TABLES = [
+    str.maketrans(string.ascii_lowercase, string.ascii_lowercase[shift:] + string.ascii_lowercase[:shift])
+    for shift in range(26)
+]
+_BYTE_SHIFT_TABLES = [
+    bytes.maketrans(string.ascii_lowercase.encode(), (string.ascii_lowercase[shift:] + string.ascii_lowercase[:shift]).encode())
+    for shift in range(26)
+]
+_NUMPY_SHIFT_TABLES = numpy.frombuffer(b"".join(_BYTE_SHIFT_TABLES), dtype=numpy.uint8) if numpy is not None else None
+_NUMPY_MIN_KEY_LENGTH = 64
+
+def rotate_shifts(shifts: list[int], offset: int):
+    """
+    Used to rotate `shifts` so that the key starts at position `offset`.
+
+    ---------------------------
+
+    :param shifts: The shift of every keyword character.
+    :type shifts: list[int]
+
+    :param offset: The position of the key to start at.
+    :type offset: int
+
+    ---------------------------
+
+    :return: The rotated shifts.
+    :rtype: list[int]
+    """
+    offset %= len(shifts)
+    return shifts[offset:] + shifts[:offset] if offset else shifts
+
+def split_periods(length: int, offset: int, period: int):
+    """
+    Used to split `length` characters, starting at position `offset` of the key, at every point where a key of `period` characters restarts.
+
+    ---------------------------
+
+    :param length: The number of characters.
+    :type length: int
+
+    :param offset: The position of the key to start at.
+    :type offset: int
+
+    :param period: The number of characters after which the key restarts.
+    :type period: int
+
+    ---------------------------
+
+    :return: The start, end and key offset of every segment.
+    :rtype: Generator[tuple[int, int, int]]
+    """
+    start, offset = 0, offset % period
+    while start < length:
+        end = min(length, start + period - offset)
+        yield start, end, offset
+        start, offset = end, 0
+
+def shift_text(text: str, shifts: list[int], offset: int = 0, period: int = None):
+    """
+    Used to shift the lowercase English letters of `text` by the repeating `shifts`.
+    The key advances on every character, letter or not, exactly like the Vigenère family classes.
+
+    ASCII text is routed through :func:`shift_bytes`, any other text is translated one key position at a time.
+
+    ---------------------------
+
+    :param text: The lowercased text to shift.
+    :type text: str
+
+    :param shifts: The shift of every keyword character, each between 0 and 25.
+    :type shifts: list[int]
+
+    :param offset: The position of the key to start at, defaults to `0`.
+    :type offset: int, optional
+
+    :param period: The number of characters after which the key restarts from its beginning, even if `shifts` was not used up, defaults to `None`.
+    :type period: int, optional
+
+    ---------------------------
+
+    :return: The shifted text.
+    :rtype: str
+    """
+    if text.isascii():
+        return shift_bytes(text.encode("ascii"), shifts, offset, period).decode("ascii")
+
+    if period:
+        shifts = shifts[:period]
+        if period % len(shifts):
+            return "".join(shift_text(text[start:end], shifts, key_offset) for start, end, key_offset in split_periods(len(text), offset, period))
+
+    shifts = rotate_shifts(shifts, offset)
+    chars = list(text)
+    step = len(shifts)
+
+    for i in range(min(step, len(chars))):
+        chars[i::step] = text[i::step].translate(_SHIFT_TABLES[shifts[i]])
+
+    return "".join(chars)
+
+def shift_bytes(text: bytes, shifts: list[int], offset: int = 0, period: int = None):
+    """
+    Used to shift the lowercase ASCII letters of `text` by the repeating `shifts`.
+
+    Every position sharing a keyword character is translated at once with a strided slice, through a lookup table which leaves the non-letters untouched.
+    With `NumPy <https://numpy.org>`_ installed and a long key (e.g. :class:`RunningKeyVariant`), where the per-slice overhead dominates,
+    the whole text is instead gathered at once from the 26 stacked tables, indexed by the tiled shifts and the bytes.
+
+    ---------------------------
+
+    :param text: The lowercased bytes to shift.
+    :type text: bytes
+
+    :param shifts: The shift of every keyword character, each between 0 and 25.
+    :type shifts: list[int]
+
+    :param offset: The position of the key to start at, defaults to `0`.
+    :type offset: int, optional
+
+    :param period: The number of characters after which the key restarts from its beginning, even if `shifts` was not used up, defaults to `None`.
+    :type period: int, optional
+
+    ---------------------------
+
+    :return: The shifted bytes.
+    :rtype: bytes
+    """
+    if period:
+        shifts = shifts[:period]
+        if period % len(shifts):
+            return b"".join(shift_bytes(text[start:end], shifts, key_offset) for start, end, key_offset in split_periods(len(text), offset, period))
+
+    shifts = rotate_shifts(shifts, offset)
+
+    step = len(shifts)
+
+    if numpy is not None and step >= _NUMPY_MIN_KEY_LENGTH:
+        data = numpy.frombuffer(text, dtype=numpy.uint8)
+        index = numpy.tile(numpy.array(shifts, dtype=numpy.uint16) << 8, -(-data.size // step))[:data.size]
+        index |= data
+        return _NUMPY_SHIFT_TABLES.take(index).tobytes()
+
+    shifted = bytearray(text)
+
+    for i in range(min(step, len(shifted))):
+        shifted[i::step] = shifted[i::step].translate(_BYTE_SHIFT_TABLES[shifts[i]])
+
+    return bytes(shifted)
\ No newline at end of file
@@ -1,5 +1,5 @@
 import math
-from ..vigenere import VigenereCipher
+from ..vigenere import VigenereCipher, VigenereCipherError
 
 class RunningKeyVariant(VigenereCipher):
     def __init__(self, keywords: list[str], max_lcm: int = None) -> None:
@@ -12,6 +12,9 @@ class RunningKeyVariant(VigenereCipher):
         The keywords are standardized by either repeated or truncated achieved by calculating the LCM of their lengths.
         The keywords are encoded by each other till a final keyword is obtained.
 
+        The final keyword is never expanded to the LCM. Only the component keyword is stored, and the key restarts every LCM (or `max_lcm`) characters while encoding/decoding.
+        This keeps the construction proportional to the total length of the keywords, however large the LCM is.
+
         ---------------------------
 
         :param keywords: The keywords to use.
@@ -24,6 +27,8 @@ class RunningKeyVariant(VigenereCipher):
 
         :raises ValueError: Indicates that there was an error during initialization.
 
+        :raises VigenereCipherError: Indicates that one of the keywords was empty.
+
         ---------------------------
 
         **Example**
@@ -47,18 +52,18 @@ class RunningKeyVariant(VigenereCipher):
         if max_lcm and max_lcm <= 0:
             raise ValueError('`max_lcm` must be a natural number, i.e., > 0.')
     
+        keywords = [keyword.lower().strip() for keyword in keywords]
+        if not all(keywords):
+            raise VigenereCipherError('Please specify proper keywords.')
+
         lcm = math.lcm(*(len(keyword) for keyword in keywords))
         if max_lcm:
             lcm = min(max_lcm, lcm)
 
-        lcmstr = "a" * lcm
-
-        self.keyword = keywords.pop(0).lower().strip()
-        fkeyword = self.match_keyword_length(plaintext=lcmstr)
-
-        for keyword in keywords:
-            self.keyword = keyword.lower().strip()
-            mkeyword = self.match_keyword_length(plaintext=lcmstr)
-            fkeyword = self.encode(plaintext=mkeyword)
+        # Encoding a keyword repeated to the LCM is the same as repeating the encoded keyword, so the LCM never has to be built.
+        fkeyword = keywords[0]
+        for keyword in keywords[1:]:
+            fkeyword = VigenereCipher(keyword).encode(plaintext=keyword)
 
         super().__init__(fkeyword)
+        self.key_period = lcm
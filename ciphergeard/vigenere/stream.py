@@ -0,0 +1,91 @@
+from .engine import shift_bytes, shift_text
+
+class VigenereStream:
+    def __init__(self, shifts: list[int], period: int = None) -> None:
+        """
+        An incremental encoder/decoder for the Vigenère family, usually created by :meth:`VigenereCipher.stream_encoder` or :meth:`VigenereCipher.stream_decoder`.
+        The position in the key is carried over between chunks, so the text can be processed in arbitrary pieces with constant memory.
+
+        Unlike :meth:`VigenereCipher.encode`, the chunks are not stripped. The joined output matches a one-shot `encode`/`decode` of the joined input as long as it has no leading or trailing whitespace.
+
+        ---------------------------
+
+        :param shifts: The shift of every keyword character, each between 0 and 25.
+        :type shifts: list[int]
+
+        :param period: The number of characters after which the key restarts from its beginning, defaults to `None`.
+        :type period: int, optional
+
+        ---------------------------
+
+        **Example**
+        ---------------------------
+        .. code-block:: python
+
+           from ciphergeard.vigenere import VigenereCipher
+
+           cipher = VigenereCipher(keyword="SECRET")
+           encoder = cipher.stream_encoder()
+
+           with open("plain.txt") as src, open("encoded.txt", "w") as dst:
+               for chunk in iter(lambda: src.read(65536), ""):
+                   dst.write(encoder.process(chunk))
+        """
+        self.shifts = shifts
+        self.period = period or len(shifts)
+        self.offset = 0
+
+    def process(self, chunk: str):
+        """
+        Used to encode/decode the next `chunk` of text.
+
+        ---------------------------
+
+        :param chunk: The next chunk of text.
+        :type chunk: str
+
+        ---------------------------
+
+        :return: The processed chunk.
+        :rtype: str
+        """
+        chunk = chunk.lower()
+        processed = shift_text(chunk, self.shifts, self.offset, self.period)
+        self.offset = (self.offset + len(chunk)) % self.period
+        return processed
+
+    def process_bytes(self, chunk: bytes | bytearray | memoryview):
+        """
+        Used to encode/decode the next `chunk` of bytes.
+
+        ---------------------------
+
+        :param chunk: The next chunk of bytes.
+        :type chunk: bytes | bytearray | memoryview
+
+        ---------------------------
+
+        :return: The processed chunk.
+        :rtype: bytes
+        """
+        chunk = bytes(chunk).lower()
+        processed = shift_bytes(chunk, self.shifts, self.offset, self.period)
+        self.offset = (self.offset + len(chunk)) % self.period
+        return processed
+
+    def flush(self):
+        """
+        Used to end the stream. Every character is processed as soon as it is received, so nothing is pending.
+
+        ---------------------------
+
+        :return: An empty string.
+        :rtype: str
+        """
+        return ""
+
+    def reset(self):
+        """
+        Used to restart the stream at the beginning of the key.
+        """
+        self.offset = 0
\ No newline at end of file
@@ -0,0 +1,39 @@
+import codecs
+import io
+
+import pytest
+
+from ciphergeard import codec
+from ciphergeard.vigenere import VigenereCipher
+from ciphergeard.vigenere.beaufort import BeaufortVariant
+from ciphergeard.vigenere.gronsfeld import GronsfeldVariant
+
+PLAINTEXT = "café au lait, naïve señor"
+
+@pytest.fixture(autouse=True)
+def registered():
+    codec.register()
+    yield
+    codec.unregister()
+
+@pytest.mark.parametrize("encoding, cipher", [
+    ("cg-vigenere-secret", VigenereCipher(keyword="secret")),
+    ("cg-beaufort-secret", BeaufortVariant(keyword="secret")),
+    ("cg-gronsfeld-69421", GronsfeldVariant(key=69421)),
+])
+def test_non_ascii_round_trip(encoding, cipher):
+    encoded = PLAINTEXT.encode(encoding)
+
+    assert encoded.decode("utf-8") == cipher.encode(PLAINTEXT)
+    assert cipher.decode(encoded.decode("utf-8")) == PLAINTEXT
+    assert encoded.decode(encoding) == PLAINTEXT
+
+    decoder = codecs.getincrementaldecoder(encoding)()
+    assert "".join(decoder.decode(encoded[i:i + 1]) for i in range(len(encoded))) + decoder.decode(b"", final=True) == PLAINTEXT
+
+@pytest.mark.parametrize("encoding", ["cg-vigenere-secret", "cg-rot13"])
+def test_stream_reader_truncated_character(encoding):
+    with pytest.raises(UnicodeDecodeError):
+        codecs.getreader(encoding)(io.BytesIO(b"caf\xc3")).read()
+
+    assert codecs.getreader(encoding)(io.BytesIO(PLAINTEXT.encode(encoding))).read() == PLAINTEXT
\ No newline at end of file
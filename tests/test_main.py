@@ -0,0 +1,48 @@
+import pytest
+
+from ciphergeard.__main__ import build_parser, main
+from ciphergeard.vigenere import VigenereCipher
+
+def test_same_input_and_output(tmp_path):
+    path = tmp_path / "plain.txt"
+    path.write_text("attack at dawn")
+
+    with pytest.raises(SystemExit) as exit:
+        main(["caesar", "--offset", "3", str(path), "-o", str(path)])
+    assert exit.value.code == 1
+    assert path.read_text() == "attack at dawn"
+
+def test_vigenere_non_ascii(tmp_path):
+    source, target = tmp_path / "plain.txt", tmp_path / "encoded.txt"
+    source.write_text("café au lait", encoding="utf-8")
+
+    main(["vigenere", "--keyword", "secret", str(source), "-o", str(target)])
+    assert target.read_text(encoding="utf-8") == VigenereCipher(keyword="secret").encode("café au lait")
+
+def test_repeated_keywords():
+    args = build_parser().parse_args(["running-key", "--keywords", "ab", "--keywords", "cde", "plain.txt"])
+    assert args.keywords == ["ab", "cde"]
+    assert args.input == "plain.txt"
+def test_vernam_output_is_keyword_file(tmp_path):
+    plaintext, keyword = tmp_path / "plain.txt", tmp_path / "pad.txt"
+    plaintext.write_bytes(b"attack at dawn")
+    keyword.write_bytes(b"qwertyuiopasdf")
+
+    with pytest.raises(SystemExit) as exit:
+        main(["vernam", "--keyword-file", str(keyword), str(plaintext), "-o", str(keyword)])
+    assert exit.value.code == 1
+    assert keyword.read_bytes() == b"qwertyuiopasdf"
+
+@pytest.mark.parametrize("plaintext", ["attack at dawn", "café au lait"])
+def test_vigenere_workers(tmp_path, plaintext):
+    source, serial, parallel = tmp_path / "plain.txt", tmp_path / "serial.txt", tmp_path / "parallel.txt"
+    source.write_text(plaintext, encoding="utf-8")
+
+    main(["vigenere", "--keyword", "secret", str(source), "-o", str(serial)])
+    if plaintext.isascii():
+        main(["vigenere", "--keyword", "secret", str(source), "-o", str(parallel), "--workers", "2"])
+        assert parallel.read_bytes() == serial.read_bytes()
+    else:
+        with pytest.raises(SystemExit) as exit:
+            main(["vigenere", "--keyword", "secret", str(source), "-o", str(parallel), "--workers", "2"])
+        assert exit.value.code == 1
\ No newline at end of file
@@ -0,0 +1,15 @@
+import pytest
+
+from ciphergeard.morse import MorseCode, MorseCodeError
+from ciphergeard.frequency import ENGLISH_LETTER_FREQUENCIES
+
+def test_decode_unspaced_with_zero_frequency():
+    frequencies = dict(ENGLISH_LETTER_FREQUENCIES, z=0.0)
+    readings = MorseCode().decode_unspaced("--..", top_k=3, frequencies=frequencies)
+
+    assert len(readings) == 3
+    assert all(score < 0 for _, score in readings)
+
+def test_decode_unspaced_without_positive_frequency():
+    with pytest.raises(MorseCodeError):
+        MorseCode().decode_unspaced("...", frequencies={"e": 0.0})
\ No newline at end of file
@@ -0,0 +1,34 @@
+import math
+
+import pytest
+
+from ciphergeard.analysis.ngrams import NgramModel, NgramModelError, load_model
+
+def test_from_counts(tmp_path):
+    model = NgramModel.from_counts("TION 6\nATIO 3\nthis 1\n", str(tmp_path / "english.ngrams"))
+
+    assert model.n == 4
+    assert model.table[((19 * 26 + 8) * 26 + 14) * 26 + 13] == pytest.approx(math.log10(0.6))
+    assert model.score("ation") == pytest.approx((math.log10(0.3) + math.log10(0.6)) / 2)
+
+def test_from_counts_matches_compile(tmp_path):
+    compiled = NgramModel.compile("attack at dawn", str(tmp_path / "compiled.ngrams"), n=2)
+    counted = NgramModel.from_counts("AT 2\nTT 1\nTA 1\nAC 1\nCK 1\nKA 1\nTD 1\nDA 1\nAW 1\nWN 1", str(tmp_path / "counted.ngrams"))
+
+    assert list(counted.table) == list(compiled.table)
+
+@pytest.mark.parametrize("counts", ["TION x", "TI0N 5", "TION 5\nABC 3", ""])
+def test_from_counts_invalid(tmp_path, counts):
+    with pytest.raises(NgramModelError):
+        NgramModel.from_counts(counts, str(tmp_path / "invalid.ngrams"))
+
+def test_recompile_loaded_model(tmp_path):
+    path = str(tmp_path / "english.ngrams")
+    NgramModel.compile("attack at dawn", path)
+    model = load_model(path)
+    score = model.score("attack")
+
+    NgramModel.compile("defend the east wall", path)
+    assert model.score("attack") == score
+    assert load_model(path) is not model
+    assert load_model(path).score("attack") != score
\ No newline at end of file
@@ -0,0 +1,19 @@
+import pytest
+
+from ciphergeard.caesar import CaesarCipher
+from ciphergeard.parallel import ParallelError
+
+def test_encode_file_in_place(tmp_path):
+    path = tmp_path / "plain.txt"
+    path.write_bytes(b"attack at dawn")
+
+    with pytest.raises(ParallelError):
+        CaesarCipher(offset=3).encode_file(str(path), str(path))
+    assert path.read_bytes() == b"attack at dawn"
+
+def test_encode_file(tmp_path):
+    source, target = tmp_path / "plain.txt", tmp_path / "encoded.txt"
+    source.write_bytes(b"attack at dawn")
+
+    CaesarCipher(offset=3).encode_file(str(source), str(target))
+    assert target.read_bytes() == CaesarCipher(offset=3).encode_bytes(b"attack at dawn")
\ No newline at end of file
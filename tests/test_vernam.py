@@ -0,0 +1,42 @@
+import pytest
+
+from ciphergeard.vernam import VernamCipher, VernamCipherError
+
+@pytest.fixture
+def files(tmp_path):
+    plaintext, keyword = tmp_path / "plain.txt", tmp_path / "pad.txt"
+    plaintext.write_bytes(b"attack at dawn")
+    VernamCipher().generate_keyword_file(str(keyword), len(b"attack at dawn"))
+    return plaintext, keyword
+
+def test_encode_file_round_trip(files, tmp_path):
+    plaintext, keyword = files
+    encoded, decoded = tmp_path / "encoded.txt", tmp_path / "decoded.txt"
+
+    VernamCipher().encode_file(str(plaintext), str(keyword), str(encoded))
+    VernamCipher().decode_file(str(encoded), str(keyword), str(decoded))
+    assert decoded.read_bytes() == b"attack at dawn"
+
+def test_encode_file_in_place(files):
+    plaintext, keyword = files
+
+    with pytest.raises(VernamCipherError):
+        VernamCipher().encode_file(str(plaintext), str(keyword), str(plaintext))
+    assert plaintext.read_bytes() == b"attack at dawn"
+
+def test_decode_file_into_keyword(files):
+    plaintext, keyword = files
+    pad = keyword.read_bytes()
+
+    with pytest.raises(VernamCipherError):
+        VernamCipher().decode_file(str(plaintext), str(keyword), str(keyword))
+    assert keyword.read_bytes() == pad
+
+def test_encode_file_length_mismatch(files, tmp_path):
+    plaintext, keyword = files
+    encoded = tmp_path / "encoded.txt"
+    plaintext.write_bytes(b"attack at dawn!")
+
+    with pytest.raises(VernamCipherError):
+        VernamCipher().encode_file(str(plaintext), str(keyword), str(encoded))
+    assert not encoded.exists()
\ No newline at end of file